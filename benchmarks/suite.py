@@ -0,0 +1,736 @@
+"""Benchmark suite for decode, validate, encode, key path and memory hot paths.
+
+Every case is a synthetic schema of a given size: flat models, deep
+TypedObjectField nesting, wide TypedListField/TypedDictField collections and
+datetime-heavy models. Feature benchmarks time single features on a fixed
+workload: error collection, views, projections, streaming dumps, columns,
+collections, NDJSON stores, discriminated variants and so on.
+For each case and operation the suite reports throughput, latency
+percentiles and tracemalloc peak memory, and compares them with a stored
+baseline, exiting with status 1 on regressions.
+
+Reports (--report) print comparisons that are not gated by the baseline,
+e.g. scaling of fromjson_many() with the number of worker processes or
+memory retained per record with and without string interning.
+
+Timings depend on the machine, so the baseline is not part of the
+repository: save one with --save-baseline on the machine the suite runs on,
+before the changes to check, and again after intended changes.
+
+Usage: python benchmarks/suite.py [--quick] [--filter TEXT]
+                                  [--save-baseline] [--tolerance FRACTION]
+       python benchmarks/suite.py --report [--quick] [--filter TEXT]
+"""
+import argparse
+import atexit
+import datetime
+import functools
+import gc
+import io
+import json
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import dicty  # noqa: E402
+
+BASELINE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+SIZES = ['small', 'medium', 'large']
+MEMORY_SLACK = 512
+
+
+def make_class(name, fields, base=dicty.DictObject):
+    return type(name, (base,), dict(fields))
+
+
+class Leaf(dicty.DictObject):
+    id = dicty.IntegerField()
+    name = dicty.StringField()
+    price = dicty.FloatField(optional=True)
+    active = dicty.BooleanField(optional=True)
+
+
+LEAF = {'id': 1, 'name': 'leaf', 'price': 1.5, 'active': True}
+
+
+def flat_case(size):
+    count = {'small': 5, 'medium': 20, 'large': 100}[size]
+    kinds = [
+        (dicty.IntegerField, 1),
+        (dicty.StringField, 'value'),
+        (dicty.FloatField, 1.5),
+        (dicty.BooleanField, True),
+    ]
+    fields, record = [], {}
+    for no in range(count):
+        field_class, value = kinds[no % len(kinds)]
+        fields.append(('f{}'.format(no), field_class()))
+        record['f{}'.format(no)] = value
+    cls = make_class('Flat', fields)
+    paths = [functools.partial(getattr, cls, 'f{}'.format(no))
+             for no in range(count)]
+    return cls, record, paths
+
+
+def deep_case(size):
+    depth = {'small': 2, 'medium': 8, 'large': 32}[size]
+    cls, record = Leaf, dict(LEAF)
+    for no in range(depth):
+        cls = make_class('Deep{}'.format(no), [
+            ('id', dicty.IntegerField()),
+            ('child', dicty.TypedObjectField(cls)),
+        ])
+        record = {'id': no, 'child': record}
+    root = cls
+
+    def path():
+        value = root
+        for _ in range(depth):
+            value = value.child
+        return value.name
+    return root, record, [path]
+
+
+def list_case(size):
+    count = {'small': 10, 'medium': 100, 'large': 1000}[size]
+    cls = make_class('Wide', [('items', dicty.TypedListField(Leaf))])
+    record = {'items': [dict(LEAF, id=no) for no in range(count)]}
+    paths = [lambda no=no: cls.items[no % 100].name
+             for no in range(count)]
+    return cls, record, paths
+
+
+def dict_case(size):
+    count = {'small': 10, 'medium': 100, 'large': 1000}[size]
+    cls = make_class('WideDict', [('items', dicty.TypedDictField(Leaf))])
+    record = {'items': dict(('k{}'.format(no), dict(LEAF, id=no))
+                            for no in range(count))}
+    paths = [lambda key='k{}'.format(no % 100): cls.items[key].name
+             for no in range(count)]
+    return cls, record, paths
+
+
+def datetime_case(size):
+    count = {'small': 2, 'medium': 10, 'large': 50}[size]
+    fields, record = [], {}
+    for no in range(count):
+        if no % 2:
+            fields.append(('d{}'.format(no), dicty.DateField()))
+            record['d{}'.format(no)] = '2020-01-{:02}'.format(no % 28 + 1)
+        else:
+            fields.append(('d{}'.format(no), dicty.DatetimeField()))
+            record['d{}'.format(no)] = '2020-01-02 03:04:{:02}'.format(
+                no % 60)
+    cls = make_class('Dates', fields)
+    paths = [functools.partial(getattr, cls, 'd{}'.format(no))
+             for no in range(count)]
+    return cls, record, paths
+
+
+CASES = [
+    ('flat', flat_case),
+    ('deep', deep_case),
+    ('list', list_case),
+    ('dict', dict_case),
+    ('datetime', datetime_case),
+]
+
+
+class Item(dicty.DictObject):
+    id = dicty.IntegerField()
+    name = dicty.StringField()
+    price = dicty.FloatField(optional=True)
+    created = dicty.DatetimeField(optional=True)
+
+
+class Document(dicty.DictObject):
+    id = dicty.IntegerField()
+    title = dicty.StringField()
+    author = dicty.TypedObjectField(Item)
+    items = dicty.TypedListField(Item)
+
+
+ITEM = {'id': 1, 'name': 'item', 'price': 1.5,
+        'created': '2020-01-02 03:04:05'}
+
+
+def make_documents(count, items=20):
+    return [{'id': no, 'title': 'document', 'author': dict(ITEM),
+             'items': [dict(ITEM, id=i) for i in range(items)]}
+            for no in range(count)]
+
+
+def collect_feature():
+    records = make_documents(100, items=2)
+    for record in records[::3]:
+        record['items'][1]['price'] = 'bad'
+
+    def fromjson():
+        for record in records:
+            try:
+                Document.fromjson(record)
+            except dicty.FieldError:
+                pass
+    return [
+        ('fromjson', fromjson),
+        ('try_fromjson',
+         lambda: [Document.try_fromjson(record) for record in records]),
+    ]
+
+
+def view_feature():
+    records = make_documents(20)
+    return [
+        ('fromjson', lambda: [Document.fromjson(record).author.name
+                              for record in records]),
+        ('view', lambda: [Document.view(record).author.name
+                          for record in records]),
+    ]
+
+
+def projection_feature():
+    records = make_documents(20)
+    only = [Document.id, Document.items.price]
+    return [
+        ('fromjson', lambda: [Document.fromjson(record)
+                              for record in records]),
+        ('only', lambda: [Document.fromjson(record, only=only)
+                          for record in records]),
+    ]
+
+
+def dump_feature():
+    doc = Document.fromjson(make_documents(1, items=200)[0])
+
+    class NullFile(object):
+        def write(self, text):
+            pass
+    return [
+        ('dumps', lambda: NullFile().write(json.dumps(doc.jsonize()))),
+        ('dump', lambda: doc.dump(NullFile())),
+        ('dump_many', lambda: Document.dump_many([doc] * 5, io.StringIO())),
+    ]
+
+
+def columns_feature():
+    try:
+        import numpy
+    except ImportError:
+        return []
+    objects = [Document.fromjson(record)
+               for record in make_documents(200, items=1)]
+    fields = [Document.id, Document.author.price, Document.author.created]
+    columns = {
+        'id': numpy.arange(200, dtype='int64'),
+        'title': numpy.array(['document'] * 200),
+        'created': numpy.array(['2020-01-01 00:{:02}:00'.format(no % 60)
+                                for no in range(200)]),
+    }
+    cls = make_class('Row', [('id', dicty.IntegerField()),
+                             ('title', dicty.StringField()),
+                             ('created', dicty.DatetimeField())])
+    return [
+        ('to_columns', lambda: Document.to_columns(objects, fields)),
+        ('from_columns', lambda: cls.from_columns(columns)),
+    ]
+
+
+def datetime_feature():
+    field = dicty.DatetimeField()
+    string = '1985-06-12 11:22:33'
+    value = datetime.datetime(1985, 6, 12, 11, 22, 33)
+    return [
+        ('fromjson', lambda: field.fromjson(string)),
+        ('tojson', lambda: field.tojson(value)),
+    ]
+
+
+def collection_feature():
+    cls = make_class('Event', [('user_id', dicty.IntegerField()),
+                               ('created', dicty.DatetimeField())])
+    start = datetime.datetime(2020, 1, 1)
+    events = [cls(user_id=no % 100,
+                  created=start + datetime.timedelta(seconds=no * 7 % 86400))
+              for no in range(10000)]
+    collection = dicty.Collection(cls, index=[cls.user_id],
+                                  sorted_index=[cls.created], objects=events)
+    low = start + datetime.timedelta(hours=1)
+    high = start + datetime.timedelta(hours=2)
+    return [
+        ('build', lambda: dicty.Collection(
+            cls, index=[cls.user_id], sorted_index=[cls.created],
+            objects=events[:1000])),
+        ('find', lambda: collection.find(cls.user_id, 7)),
+        ('range', lambda: collection.range(cls.created, low, high)),
+    ]
+
+
+def path_feature():
+    doc = Document.fromjson(make_documents(1)[0])
+    path = Document.items[0].price
+    getter = dicty.path_getter(path)
+    return [
+        ('build', lambda: Document.items[0].price),
+        ('getter', lambda: getter(doc)),
+        ('get', lambda: dicty.path_get(path, doc)),
+        ('set', lambda: dicty.path_set(path, doc, 1.5)),
+    ]
+
+
+def ndjson_store_feature():
+    directory = tempfile.mkdtemp()
+    atexit.register(shutil.rmtree, directory, True)
+    filename = os.path.join(directory, 'records.ndjson')
+    with open(filename, 'w') as fp:
+        for no in range(10000):
+            fp.write(json.dumps(dict(ITEM, id=no, name='id{}'.format(no))) +
+                     '\n')
+    cls = make_class('Stored', [('id', dicty.IntegerField()),
+                                ('name', dicty.StringField('name')),
+                                ('price', dicty.FloatField())])
+    dicty.NDJSONStore(cls, filename, key=cls.name).close()
+    store = dicty.NDJSONStore(cls, filename, key=cls.name)
+    atexit.register(store.close)
+    return [
+        ('load_index', lambda: dicty.NDJSONStore(
+            cls, filename, key=cls.name).close()),
+        ('get', lambda: store.get('id9999')),
+        ('position', lambda: store[5000]),
+    ]
+
+
+def variants_feature():
+    variants = {}
+    for no in range(8):
+        tag = 'event{}'.format(no)
+        variants[tag] = make_class('Event{}'.format(no), [
+            ('type', dicty.RegexpStringField(regexp='^{}$'.format(tag))),
+            ('value', dicty.IntegerField()),
+        ])
+    cls = make_class('Log', [('events', dicty.TypedListField(
+        variants, discriminator='type'))])
+    record = {'events': [{'type': 'event{}'.format(no % 8), 'value': no}
+                         for no in range(100)]}
+    return [('dispatch', lambda: cls.fromjson(record))]
+
+
+def fromjson_many_feature():
+    # Timings of worker processes depend on CPUs, see workers_report()
+    records = make_documents(100, items=5)
+    return [('serial', lambda: Document.fromjson_many(records, workers=1))]
+
+
+FEATURES = [
+    ('collect', collect_feature),
+    ('view', view_feature),
+    ('projection', projection_feature),
+    ('dump', dump_feature),
+    ('columns', columns_feature),
+    ('datetime_field', datetime_feature),
+    ('collection', collection_feature),
+    ('path_access', path_feature),
+    ('ndjson_store', ndjson_store_feature),
+    ('variants', variants_feature),
+    ('fromjson_many', fromjson_many_feature),
+]
+
+
+def best_of(func, args):
+    """Return best average time of a call, for reports"""
+    func()
+    number = max(1, int(args.budget / max(measure_once(func, 1), 1e-9)))
+    return min(measure_once(func, number) for _ in range(args.samples))
+
+
+def workers_report(args):
+    """fromjson_many() throughput by number of worker processes, depends on
+    CPUs available so it's not gated.
+    """
+    records = make_documents(500 if args.quick else 5000, items=10)
+    yield '{} CPUs available'.format(multiprocessing.cpu_count())
+    serial = None
+    for workers in [1, 2, 4, 8]:
+        pool = multiprocessing.Pool(workers) if workers > 1 else None
+        try:
+            elapsed = best_of(functools.partial(
+                Document.fromjson_many, records, workers=workers, pool=pool),
+                args)
+        finally:
+            if pool is not None:
+                pool.terminate()
+                pool.join()
+        serial = serial or elapsed
+        yield '{:2} workers {:10.0f} records/s {:6.2f}x'.format(
+            workers, len(records) / elapsed, serial / elapsed)
+
+
+def generic_validate(obj):
+    for field in obj._fields.values():
+        field.validate(obj)
+
+
+def compiled_report(args):
+    """fromjson() with compiled per-class validators against the generic
+    loop calling ``validate()`` of every field.
+    """
+    record = make_documents(1)[0]
+
+    def generic():
+        obj = Document()
+        obj.update(record)
+        generic_validate(obj)
+
+    def generic_fromjson():
+        # Nested objects are validated with the generic loop as well
+        saved = Item.validate, Document.validate
+        Item.validate = Document.validate = generic_validate
+        try:
+            generic()
+        finally:
+            Item.validate, Document.validate = saved
+
+    results = [best_of(generic_fromjson, args),
+               best_of(lambda: Document.fromjson(record), args)]
+    yield 'generic  {:8.2f} us/doc'.format(results[0] * 1e6)
+    yield 'compiled {:8.2f} us/doc {:6.2f}x'.format(
+        results[1] * 1e6, results[0] / results[1])
+
+
+def generic_jsonize(obj):
+    json = {}
+    for field in obj._fields.values():
+        if field.key in obj:
+            json[field.key] = field.jsonize(obj)
+    return json
+
+
+def jsonize_report(args):
+    """jsonize() with compiled per-class jsonizers against the generic loop
+    calling ``jsonize()`` of every field.
+    """
+    obj = Document.fromjson(make_documents(1)[0])
+
+    def generic():
+        saved = Item.jsonize, Document.jsonize
+        Item.jsonize = Document.jsonize = generic_jsonize
+        try:
+            obj.jsonize()
+        finally:
+            Item.jsonize, Document.jsonize = saved
+
+    results = [best_of(generic, args), best_of(obj.jsonize, args)]
+    yield 'generic  {:8.2f} us/doc'.format(results[0] * 1e6)
+    yield 'compiled {:8.2f} us/doc {:6.2f}x'.format(
+        results[1] * 1e6, results[0] / results[1])
+
+
+def path_report(args):
+    """Key path construction with cached child paths against building every
+    path again, as it was done before caching.
+    """
+    author = Document._fields['author']
+    items = Document._fields['items']
+
+    def uncached():
+        path = author._path_class()._new(author.key, author)
+        return path._child('name')
+
+    def uncached_item():
+        path = items._path_class()._new(items.key, items)
+        path = path._new(u'{}.{}'.format(path, 0), items, path, 0)
+        return path._child('price')
+
+    assert uncached() == Document.author.name
+    assert uncached_item() == Document.items[0].price
+    for name, before, after in [
+            ('Document.author.name', uncached,
+             lambda: Document.author.name),
+            ('Document.items[0].price', uncached_item,
+             lambda: Document.items[0].price)]:
+        results = [best_of(before, args), best_of(after, args)]
+        yield '{:24} before {:7.0f} ns  after {:5.0f} ns {:6.1f}x'.format(
+            name, results[0] * 1e9, results[1] * 1e9,
+            results[0] / results[1])
+
+
+def retained(make, count):
+    """Return bytes per record still allocated after ``make()`` built
+    ``count`` records, and the result keeping them alive.
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = make()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / float(count), result
+
+
+def memory_report(args):
+    """Retained memory per instance of DictObject and CompactObject"""
+    count = 10000 if args.quick else 100000
+    fields = [('id', dicty.IntegerField()),
+              ('name', dicty.StringField()),
+              ('score', dicty.FloatField(optional=True)),
+              ('active', dicty.BooleanField()),
+              ('created', dicty.DatetimeField())]
+    # Values are shared between records so only per-instance overhead counts
+    records = [{'id': 1, 'name': 'name', 'score': 1.5, 'active': True,
+                'created': '2020-01-02 03:04:05'}] * count
+    results = []
+    for cls in [make_class('Record', fields),
+                make_class('CompactRecord', fields, base=dicty.CompactObject)]:
+        size, _ = retained(
+            lambda: [cls.fromjson(record) for record in records], count)
+        results.append(size)
+        yield '{:14} {:6.0f} bytes/instance'.format(cls.__name__, size)
+    yield 'ratio          {:6.2f}x'.format(results[0] / results[1])
+
+
+def intern_report(args):
+    """Retained memory per record decoded from JSON with and without
+    interning of repeated strings.
+    """
+    count = 5000 if args.quick else 50000
+    fields = [('id', dicty.IntegerField()),
+              ('status', dicty.StringField()),
+              ('country', dicty.RegexpStringField(regexp='^[A-Z]{2}$')),
+              ('currency', dicty.StringField()),
+              ('plan', dicty.StringField()),
+              ('name', dicty.StringField(intern=False))]
+    statuses = ['active', 'suspended', 'cancelled']
+    countries = ['US', 'GB', 'DE', 'FR']
+    lines = [json.dumps({
+        'id': no,
+        'status': statuses[no % 3],
+        'country': countries[no % 4],
+        'currency': 'currency-{}'.format(no % 5),
+        'plan': 'plan-{}'.format(no % 7),
+        'name': 'customer {}'.format(no),
+    }) for no in range(count)]
+    interned = make_class('InternedRecord', fields + [
+        ('intern_strings', dicty.InternTable(max_size=1000))])
+    results = []
+    for cls in [make_class('Record', fields), interned]:
+        size, _ = retained(
+            lambda: [cls.fromjson(json.loads(line)) for line in lines], count)
+        results.append(size)
+        yield '{:14} {:6.0f} bytes/record'.format(cls.__name__, size)
+    yield 'saved          {:6.0f} bytes/record'.format(results[0] - results[1])
+    yield 'table          {}'.format(interned.intern_strings.stats())
+
+
+REPORTS = [
+    ('workers', workers_report),
+    ('compiled', compiled_report),
+    ('jsonize', jsonize_report),
+    ('path', path_report),
+    ('memory', memory_report),
+    ('intern', intern_report),
+]
+
+
+def report(args):
+    for name, make_report in REPORTS:
+        if args.filter and args.filter not in name:
+            continue
+        print('{}:'.format(name))
+        for line in make_report(args):
+            print('  ' + line)
+
+
+def operations(cls, record, paths):
+    obj = cls.fromjson(record)
+
+    def build_paths():
+        for path in paths:
+            path()
+    return [
+        ('fromjson', lambda: cls.fromjson(record)),
+        ('validate', obj.validate),
+        ('jsonize', obj.jsonize),
+        ('path', build_paths),
+    ]
+
+
+def measure_once(func, number):
+    start = time.perf_counter()
+    for _ in range(number):
+        func()
+    return (time.perf_counter() - start) / number
+
+
+def measure(func, samples, budget, calls):
+    """Return best average time per call, sorted times of single calls and
+    peak memory allocated by a call.
+    """
+    # Garbage collection pauses make timings unstable, as timeit does
+    # measure with the collector disabled
+    gc.collect()
+    gc.disable()
+    try:
+        return _measure(func, samples, budget, calls)
+    finally:
+        gc.enable()
+
+
+def _measure(func, samples, budget, calls):
+    # Pick number of calls per sample so every sample takes ~budget seconds
+    func()
+    single = measure_once(func, 1)
+    number = max(1, int(budget / max(single, 1e-9)))
+    best = min(measure_once(func, number) for _ in range(samples))
+    clock = time.perf_counter
+    latencies = []
+    for _ in range(calls):
+        start = clock()
+        func()
+        latencies.append(clock() - start)
+    latencies.sort()
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, latencies, peak
+
+
+def percentile(values, fraction):
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def case_operations(make_case, size):
+    return operations(*make_case(size))
+
+
+def benchmarks():
+    """Yield name prefix and callable returning (operation, func) pairs"""
+    for case_name, make_case in CASES:
+        for size in SIZES:
+            yield '{}/{}'.format(case_name, size), functools.partial(
+                case_operations, make_case, size)
+    for feature_name, make_feature in FEATURES:
+        yield 'feature/' + feature_name, make_feature
+
+
+def run(args, only=None):
+    results = {}
+    for prefix, make_operations in benchmarks():
+        # Retries don't set up benchmarks without suspects again
+        if only is not None and not any(name.startswith(prefix + '/')
+                                        for name in only):
+            continue
+        for op_name, func in make_operations():
+            name = '{}/{}'.format(prefix, op_name)
+            if args.filter and args.filter not in name:
+                continue
+            if only is not None and name not in only:
+                continue
+            best, latencies, peak = measure(
+                func, args.samples, args.budget, args.calls)
+            result = results[name] = {
+                'ops': 1.0 / best,
+                'p50': percentile(latencies, 0.5),
+                'p90': percentile(latencies, 0.9),
+                'p99': percentile(latencies, 0.99),
+                'seconds': best,
+                'peak': peak,
+            }
+            print('{:34} {:10.0f} ops/s  p50 {:9.2f} us  p90 {:9.2f} us'
+                  '  p99 {:9.2f} us  peak {:8d} B'.format(
+                      name, result['ops'], result['p50'] * 1e6,
+                      result['p90'] * 1e6, result['p99'] * 1e6, peak))
+    return results
+
+
+def compare(results, baseline, tolerance, memory_tolerance):
+    regressions = []
+    for name, result in sorted(results.items()):
+        if name not in baseline:
+            continue
+        base = baseline[name]
+        slowdown = result['seconds'] / base['seconds'] - 1
+        if slowdown > tolerance:
+            regressions.append(
+                (name, '{}: {:.0%} slower'.format(name, slowdown)))
+        # Ignore growth by a few small allocations
+        growth = (result['peak'] - base['peak']) / float(max(base['peak'], 1))
+        if growth > memory_tolerance and \
+           result['peak'] - base['peak'] > MEMORY_SLACK:
+            regressions.append(
+                (name, '{}: {:.0%} more memory'.format(name, growth)))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--quick', action='store_true',
+                        help='take fewer and shorter samples')
+    parser.add_argument('--filter', help='run benchmarks containing TEXT')
+    parser.add_argument('--baseline', default=BASELINE)
+    parser.add_argument('--save-baseline', action='store_true')
+    parser.add_argument('--tolerance', type=float, default=0.3,
+                        help='allowed relative slowdown, default 0.3')
+    parser.add_argument('--memory-tolerance', type=float, default=0.1,
+                        help='allowed peak memory growth, default 0.1')
+    parser.add_argument('--retries', type=int, default=2,
+                        help='times to measure suspected regressions again')
+    parser.add_argument('--report', action='store_true',
+                        help='print comparison reports instead')
+    args = parser.parse_args()
+    args.samples = 3 if args.quick else 7
+    args.budget = 0.005 if args.quick else 0.02
+    args.calls = 100 if args.quick else 1000
+
+    if args.report:
+        report(args)
+        return
+
+    results = run(args)
+    if args.save_baseline:
+        baseline = {}
+        if args.filter and os.path.exists(args.baseline):
+            with open(args.baseline) as fp:
+                baseline = json.load(fp)
+        baseline.update(
+            (name, {'seconds': result['seconds'], 'peak': result['peak']})
+            for name, result in results.items())
+        with open(args.baseline, 'w') as fp:
+            json.dump(baseline, fp, indent=2, sort_keys=True)
+            fp.write('\n')
+        print('Saved baseline to {}'.format(args.baseline))
+        return
+    if not os.path.exists(args.baseline):
+        print('No baseline at {}, run with --save-baseline'.format(
+            args.baseline))
+        return
+    with open(args.baseline) as fp:
+        baseline = json.load(fp)
+    regressions = compare(results, baseline, args.tolerance,
+                          args.memory_tolerance)
+    for _ in range(args.retries):
+        if not regressions:
+            break
+        # Timings are noisy, measure suspects again and keep the best result
+        print('\nRetrying {} suspected regressions'.format(len(regressions)))
+        retry = run(args, only=set(name for name, _ in regressions))
+        for name, result in retry.items():
+            if result['seconds'] < results[name]['seconds']:
+                results[name] = result
+        regressions = compare(results, baseline, args.tolerance,
+                              args.memory_tolerance)
+    if regressions:
+        print('\nREGRESSIONS:')
+        for _, message in regressions:
+            print('  ' + message)
+        sys.exit(1)
+    print('\nNo regressions against {}'.format(args.baseline))
+
+
+if __name__ == '__main__':
+    main()
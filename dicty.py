@@ -1,14 +1,33 @@
+import array
+import bisect
+import codecs
+import contextlib
 import datetime
+import functools
+import json
+import mmap
+import multiprocessing
+import operator
+import os
 import re
 import sys
+import threading
+import time
 
 import six
 
 
 class FieldError(Exception):
-    def __init__(self, message, path=None):
+    """Validation error, ``path`` is the formatted path of the invalid value
+    and ``steps`` the tuple of keys and list indexes leading to it.
+    """
+
+    def __init__(self, message, path=None, steps=None):
         super(FieldError, self).__init__(message)
         self.path = path
+        if steps is None:
+            steps = () if path is None else (path,)
+        self.steps = steps
 
     def __str__(self):
         if self.path:
@@ -16,7 +35,9 @@ class FieldError(Exception):
         else:
             return self.args[0]
 
-    def add_path_info(self, path):
+    def add_path_info(self, path, steps=None):
+        """Prepend ``path`` standing for ``steps``, a single key by default"""
+        self.steps = ((path,) if steps is None else steps) + self.steps
         if self.path:
             if self.path[:1] == '[':
                 path = path + self.path
@@ -24,6 +45,14 @@ class FieldError(Exception):
                 path = path + '.' + self.path
         self.path = path
 
+    def add_index(self, index):
+        """Prepend list index"""
+        self.add_path_info('[{}]'.format(index), (index,))
+
+    def add_key(self, key):
+        """Prepend key of a dict of values"""
+        self.add_path_info('[{!r}]'.format(key), (key,))
+
     @classmethod
     def raise_from(cls, exc, path=None):
         obj = cls(str(exc), path)
@@ -38,6 +67,72 @@ class DictyRuntimeError(RuntimeError):
     pass
 
 
+def _format_path(cls, path):
+    """Format tuple of keys and indexes the way `FieldError` does"""
+    result = ''
+    items = None
+    for step in path:
+        if items is not None:
+            if isinstance(items, TypedDictField):
+                result += '[{!r}]'.format(step)
+            else:
+                result += '[{}]'.format(step)
+            cls = items.type
+            items = None
+            continue
+        if isinstance(step, six.integer_types):
+            result += '[{}]'.format(step)
+            continue
+        result = '{}.{}'.format(result, step) if result else step
+        fields = getattr(cls, '_fields', {})
+        field = next((field for field in six.itervalues(fields)
+                      if field.key == step), None)
+        cls = None
+        if isinstance(field, (TypedListField, TypedDictField)):
+            items = field
+        elif isinstance(field, TypedObjectField):
+            cls = field.type
+    return result
+
+
+class ValidationResult(object):
+    """Result of ``try_fromjson()`` or ``validate(collect=True)``.
+
+    ``errors`` is a list of ``(path, message)`` pairs, where path is a
+    tuple of keys and list indexes, e.g. ``('items', 0, 'foo')``.
+    ``value`` is the validated object or ``None`` if decoding failed.
+    """
+
+    def __init__(self, type, value, errors):
+        self.type = type
+        self.value = value
+        self.errors = errors
+
+    @property
+    def ok(self):
+        return not self.errors
+
+    def __bool__(self):
+        return not self.errors
+    __nonzero__ = __bool__
+
+    def __repr__(self):
+        return '<ValidationResult {} errors={}>'.format(
+            self.type.__name__, len(self.errors))
+
+    def format_errors(self):
+        """Return list of errors formatted like ``str(FieldError)``"""
+        return [str(FieldError(message, _format_path(self.type, path), path))
+                for path, message in self.errors]
+
+    def raise_error(self):
+        """Raise `FieldError` for the first error, if any"""
+        if self.errors:
+            path, message = self.errors[0]
+            raise FieldError(message, _format_path(self.type, path) or None,
+                             path)
+
+
 class cached_property(object):
     def __init__(self, func, name=None):
         self.func = func
@@ -51,49 +146,465 @@ class cached_property(object):
         return value
 
 
+class _JSONStreamDecoder(object):
+    """Incremental decoder for newline-delimited JSON or a JSON array
+
+    Text is fed in chunks, complete top-level values (or array items) are
+    yielded as soon as they are available. Only the unparsed tail is kept
+    in the buffer.
+    """
+    whitespace = re.compile(r'[ \t\n\r]*')
+
+    def __init__(self):
+        self.buffer = u''
+        self.pos = 0
+        self.state = 'start'
+        self.retry_size = 0
+        self.raw_decode = json.JSONDecoder().raw_decode
+
+    def decode(self, text, final=False):
+        buf = self.buffer = self.buffer[self.pos:] + text
+        pos = self.pos = 0
+        while True:
+            pos = self.pos = self.whitespace.match(buf, pos).end()
+            if pos == len(buf):
+                break
+            state = self.state
+            if state == 'start':
+                if buf[pos] == '[':
+                    self.state = 'first'
+                    pos += 1
+                else:
+                    self.state = 'lines'
+            elif state == 'lines':
+                end = buf.find('\n', pos)
+                if end == -1:
+                    if not final:
+                        break
+                    end = len(buf)
+                line = buf[pos:end]
+                pos = self.pos = end
+                yield json.loads(line)
+            elif state == 'done':
+                raise ValueError(
+                    'Extra data after JSON array: {!r}'.format(
+                        buf[pos:pos + 20]))
+            elif state == 'after':
+                if buf[pos] == ',':
+                    self.state = 'value'
+                elif buf[pos] == ']':
+                    self.state = 'done'
+                else:
+                    raise ValueError(
+                        "Expecting ',' delimiter: {!r}".format(
+                            buf[pos:pos + 20]))
+                pos += 1
+            elif buf[pos] == ']':
+                if state != 'first':
+                    raise ValueError('Expecting value: trailing comma')
+                self.state = 'done'
+                pos += 1
+            else:
+                # Avoid reparsing incomplete value on every small chunk
+                if not final and len(buf) < self.retry_size:
+                    break
+                try:
+                    value, end = self.raw_decode(buf, pos)
+                except ValueError:
+                    if final:
+                        raise
+                    self.retry_size = 2 * (len(buf) - pos)
+                    break
+                # Number or literal at the end of buffer could be incomplete
+                if end == len(buf) and not final and buf[pos] not in '{["':
+                    break
+                self.retry_size = 0
+                self.state = 'after'
+                pos = self.pos = end
+                yield value
+        if final and self.state not in ('start', 'lines', 'done'):
+            raise ValueError('Unterminated JSON array')
+
+
+# Public attributes set on every path
+_PATH_ATTRS = frozenset(['key', 'attname'])
+
+
+class _ChildPath(object):
+    """Child path of a field named like a ``str`` method, e.g. ``count``,
+    found before the method. The path is cached in the instance dict, which
+    takes precedence over this descriptor afterwards.
+    """
+
+    def __init__(self, attname):
+        self.attname = attname
+
+    def __get__(self, path, type=None):
+        if path is None:
+            return self
+        child = path.__dict__[self.attname] = path._child(self.attname)
+        return child
+
+
+class _ClashingChildPath(object):
+    """Attribute of paths having a child field of the same name, e.g.
+    ``key``. The own value of the path is kept in the instance dict, reading
+    the attribute raises `DictyRuntimeError` as it's ambiguous.
+    """
+
+    def __init__(self, attname, owner):
+        self.attname = attname
+        self.owner = owner
+
+    def __get__(self, path, type=None):
+        if path is None:
+            return self
+        raise DictyRuntimeError(
+            'Field {!r} clashes with attribute of {}'.format(
+                self.attname, self.owner))
+
+    def __set__(self, path, value):
+        path.__dict__[self.attname] = value
+
+
+def _path_class_with_children(path_class, fields):
+    """Return subclass of ``path_class`` for paths having ``fields`` as
+    children. Fields named like private attributes of paths can't be
+    reached, ones named like public attributes raise `DictyRuntimeError`
+    when the attribute is read.
+    """
+    clashes = {}
+    for attname in fields:
+        if attname in _PATH_ATTRS:
+            clashes[attname] = _ClashingChildPath(attname,
+                                                  path_class.__name__)
+        elif attname.startswith('_'):
+            continue
+        elif hasattr(path_class, attname):
+            clashes[attname] = _ChildPath(attname)
+    if not clashes:
+        return path_class
+    return type(path_class.__name__, (path_class,), clashes)
+
+
 class DictyPath(six.text_type):
+    # Child paths are cached as instance attributes, so __getattr__() is
+    # only called once per (parent path, field) pair
     def __getattr__(self, attname):
+        if attname[:2] == '__' == attname[-2:]:
+            raise AttributeError(attname)
+        path = self._child(attname)
+        setattr(self, attname, path)
+        return path
+
+    def _child(self, attname):
         top = self._field
         if isinstance(top, BaseTypedField):
             field = top.type._fields[attname]
         else:
             field = top._fields[attname]
-        return self._new('{}.{}'.format(self, field.key), field)
+        return field._path_class()._new(u'{}.{}'.format(self, field.key),
+                                        field, self, field.key)
 
     @classmethod
-    def _new(cls, value, field):
-        # TODO: implement object caching and check for name clashing
+    def _new(cls, value, field, parent=None, step=None):
         obj = cls(value)
         obj.key = field.key
         obj.attname = field.attname
         obj._field = field
+        # Parent path and key or index leading from it to this path
+        obj._parent = parent
+        obj._step = field.key if step is None else step
         return obj
 
+    def _steps(self):
+        steps = []
+        path = self
+        while path is not None:
+            steps.append(path._step)
+            path = path._parent
+        steps.reverse()
+        return steps
+
+    def _is_item(self):
+        return self._parent is not None and self._parent._field is self._field
+
+    @cached_property
+    def _getter(self):
+        chain = self._chain()
+        if not self._is_item() and isinstance(self._field, ShadowField):
+            return _chain_getter(
+                [path._step for path in chain[:-1]],
+                operator.attrgetter(self.attname))
+        return _chain_getter([path._step for path in chain])
+
+    @cached_property
+    def _parent_getter(self):
+        return _chain_getter([path._step for path in self._chain()[:-1]])
+
+    def _chain(self):
+        chain = []
+        path = self
+        while path is not None:
+            chain.append(path)
+            path = path._parent
+        chain.reverse()
+        for path, child in zip(chain, chain[1:]):
+            if (isinstance(path, DictyItemPath) and not path._is_item() and
+                    not child._is_item()):
+                raise DictyRuntimeError(
+                    'Path {!r} has no index of {!r} items'.format(
+                        six.text_type(self), path._field.key))
+        return chain
+
 
 class DictyItemPath(DictyPath):
+    # Upper limit for number of cached item paths per parent path
+    items_cache_size = 1024
+
     def __iter__(self):
         return iter(six.text_type(self))
 
     def __getitem__(self, key):
+        # Item paths are cached apart from attribute ones, so
+        # ``path['foo']`` and ``path.foo`` never clash
+        try:
+            return self.__dict__['_items'][key]
+        except KeyError:
+            self.__dict__.setdefault('_items', {})
         if type(key) in (six.text_type, six.binary_type) and '.' in key:
             raise IndexError('Dot is not allowed in key')
-        return self._new('{}.{}'.format(self, key), self._field)
+        path = self._new(u'{}.{}'.format(self, key), self._field, self, key)
+        if len(self._items) < self.items_cache_size:
+            self._items[key] = path
+        return path
+
+
+def path_getter(path):
+    """Return callable returning value at ``path`` of given object, e.g. to
+    be used as a sort key. It is compiled once per path. Stored values are
+    looked up by keys and indexes directly, so defaults of fields are not
+    applied, except for a leaf `ShadowField` read as attribute to get
+    converted value.
+    """
+    return path._getter
+
+
+def path_get(path, obj, default=None):
+    """Return value at ``path`` of ``obj`` or ``default`` if some key or
+    index is missing, see `path_getter()`.
+    """
+    try:
+        return path._getter(obj)
+    except (LookupError, AttributeError, TypeError):
+        # TypeError is raised by None in the middle of the path
+        return default
+
+
+def path_set(path, obj, value):
+    """Set value at ``path`` of ``obj``, nested objects must exist"""
+    parent = path._parent_getter(obj)
+    if path._is_item():
+        parent[path._step] = value
+    else:
+        setattr(parent, path._field.attname, value)
+
+
+def _chain_getter(keys, last=None):
+    """Return callable looking up ``keys`` one by one and passing the result
+    to ``last``.
+    """
+    if last is not None:
+        if not keys:
+            return last
+        getter = _chain_getter(keys)
+        return lambda obj: last(getter(obj))
+    # Nested subscriptions are faster than a loop, chain them by three
+    if len(keys) == 0:
+        return lambda obj: obj
+    if len(keys) == 1:
+        return operator.itemgetter(keys[0])
+    if len(keys) == 2:
+        first, second = keys
+        return lambda obj: obj[first][second]
+    first, second, third = keys[:3]
+    if len(keys) == 3:
+        return lambda obj: obj[first][second][third]
+    rest = _chain_getter(keys[3:])
+    return lambda obj: rest(obj[first][second][third])
+
+
+def _inherits(obj, name, owner):
+    """Check that ``obj`` uses ``owner``'s implementation of method ``name``"""
+    return getattr(type(obj), name) == getattr(owner, name)
 
 
 def base_with_metaclass(meta):
     def new_class(cls):
-        return type.__new__(meta, cls.__name__, (cls,), {})
+        attrs = {}
+        if '__slots__' in cls.__dict__:
+            attrs['__slots__'] = ()
+        return type.__new__(meta, cls.__name__, (cls,), attrs)
     return new_class
 
 
+class InternTable(object):
+    """Bounded table of canonical string values
+
+    `intern()` returns the stored equal string if there is one, so decoded
+    objects share a single copy of repeated values. Once ``max_size``
+    values are stored new ones are returned as is, so high-cardinality
+    values don't make the table grow without bounds.
+    """
+
+    def __init__(self, max_size=65536):
+        self.max_size = max_size
+        self._values = {}
+        self.hits = 0
+        self.misses = 0
+        self.rejected = 0
+
+    def intern(self, value):
+        if not isinstance(value, (six.text_type, six.binary_type)):
+            return value
+        try:
+            value = self._values[value]
+            self.hits += 1
+        except KeyError:
+            if len(self._values) < self.max_size:
+                self._values[value] = value
+                self.misses += 1
+            else:
+                self.rejected += 1
+        return value
+
+    def __len__(self):
+        return len(self._values)
+
+    def clear(self):
+        self._values.clear()
+        self.hits = self.misses = self.rejected = 0
+
+    def stats(self):
+        return {'size': len(self._values), 'max_size': self.max_size,
+                'hits': self.hits, 'misses': self.misses,
+                'rejected': self.rejected}
+
+
+# Table used by ``intern=True`` and ``intern_strings = True``
+default_intern_table = InternTable()
+
+
+def _intern_table(policy):
+    if policy is True:
+        return default_intern_table
+    if policy is False:
+        return None
+    return policy
+
+
+_UNKNOWN_KEYS = ('keep', 'drop', 'reject')
+
+
+def _check_unknown_keys(policy):
+    if policy not in _UNKNOWN_KEYS:
+        raise DictyRuntimeError(
+            'Unknown keys policy must be one of {}, got {!r}'.format(
+                ', '.join(_UNKNOWN_KEYS), policy))
+
+
+class _DecodingState(threading.local):
+    # Policy given to the outermost fromjson() call, overrides policies of
+    # nested classes
+    unknown_keys = None
+
+
+_decoding = _DecodingState()
+
+
+def _with_unknown_keys(policy, func, *args):
+    """Call ``func`` with unknown keys ``policy`` for all objects decoded,
+    ``None`` keeps the current one.
+    """
+    if policy is None:
+        return func(*args)
+    _check_unknown_keys(policy)
+    previous = _decoding.unknown_keys
+    _decoding.unknown_keys = policy
+    try:
+        return func(*args)
+    finally:
+        _decoding.unknown_keys = previous
+
+
+class _Interning(object):
+    """Interning of keys and string values applied by ``fromjson()``"""
+
+    def __init__(self, keys, values):
+        self.keys = keys
+        self.values = values
+
+    @classmethod
+    def build(cls, obj, fields):
+        table = _intern_table(obj.intern_strings)
+        values = []
+        for field in six.itervalues(fields):
+            if field.intern is None:
+                if table is not None and isinstance(field, StringField):
+                    values.append((field.key, table.intern))
+            elif field.intern is not False:
+                values.append((field.key, _intern_table(field.intern).intern))
+        keys = None
+        if table is not None:
+            # Declared keys are replaced with field keys, others interned
+            declared = dict((field.key, field.key)
+                            for field in six.itervalues(fields))
+            intern = table.intern
+
+            def keys(json):
+                for key, value in six.iteritems(json):
+                    yield declared.get(key) or intern(key), value
+        if keys is None and not values:
+            return None
+        return cls(keys, tuple(values))
+
+    def apply(self, obj):
+        for key, intern in self.values:
+            if key in obj:
+                obj._setitem(key, intern(obj[key]))
+
+
 class JSONMetaObject(type):
     objects = {}
 
     def __new__(mcs, name, bases, attrs):
+        fields_index = mcs.collect_fields(bases, attrs)
+        attrs['_fields'] = fields_index
+        if attrs.get('track_dirty'):
+            _DirtyMutators.install(attrs)
+        obj = type.__new__(mcs, name, bases, attrs)
+        obj._validators = tuple(
+            field.compile_validator() for field in fields_index.values())
+        obj._jsonizers = tuple(
+            (field.key, field.compile_jsonizer())
+            for field in fields_index.values())
+        obj._interning = _Interning.build(obj, fields_index)
+        _check_unknown_keys(obj.unknown_keys)
+        obj._declared_keys = frozenset(
+            field.key for field in fields_index.values())
+        # Only fields with nested objects are worth dumping piece by piece
+        obj._streamed_keys = frozenset(
+            field.key for field in fields_index.values()
+            if not _inherits(field, 'iterdump', Field))
+        mcs.register_object(obj)
+        return obj
+
+    @classmethod
+    def collect_fields(mcs, bases, attrs):
         fields = []
         lookup_attrs = [attrs]
         for base in bases:
-            if issubclass(base, DictObject):
+            if isinstance(base, JSONMetaObject):
                 fields.extend(getattr(base, '_fields', {}).values())
             else:
                 lookup_attrs.append(base.__dict__)
@@ -123,10 +634,7 @@ class JSONMetaObject(type):
                 )
             fields_index[field.attname] = field
             keys_seen.add(field.key)
-        attrs['_fields'] = fields_index
-        obj = type.__new__(mcs, name, bases, attrs)
-        mcs.register_object(obj)
-        return obj
+        return fields_index
 
     @classmethod
     def register_object(cls, obj):
@@ -142,10 +650,15 @@ class JSONMetaObject(type):
                 'Cannot resolve type {}'.format(type_name))
 
 
-@base_with_metaclass(JSONMetaObject)
-class DictObject(dict):
+class _ObjectBase(object):
+    """Methods shared by `DictObject` and `CompactObject`"""
+    __slots__ = ()
+    # True or `InternTable` to intern keys and `StringField` values
+    intern_strings = None
+    # What fromjson() does with undeclared keys: 'keep', 'drop' or 'reject'
+    unknown_keys = 'keep'
+
     def __init__(self, **kwargs):
-        self._shadow = {}
         for key, value in six.iteritems(kwargs):
             if key not in self._fields:
                 raise AttributeError('Unknown field `{}` given'.format(key))
@@ -154,45 +667,1429 @@ class DictObject(dict):
     def hasattr(self, attname):
         return self._fields[attname].key in self
 
-    def validate(self):
-        for prop in six.itervalues(self._fields):
-            prop.validate(self)
+    def validate(self, collect=False):
+        """Validate the object.
+
+        With ``collect`` errors are not raised but returned, together with
+        the object, as a `ValidationResult`.
+        """
+        if collect:
+            errors = []
+            self._collect_errors(errors, ())
+            return ValidationResult(type(self), self, errors)
+        for validator in self._validators:
+            validator(self)
+
+    def _collect_errors(self, errors, path):
+        try:
+            collectors = type(self).__dict__['_collectors']
+        except KeyError:
+            collectors = type(self)._build_collectors()
+        for collector in collectors:
+            collector(self, errors, path)
+
+    @classmethod
+    def _build_collectors(cls):
+        # Built on first use, as typed fields may refer to classes declared
+        # later
+        if cls.validate in (_ObjectBase.validate, DictObject.validate):
+            cls._collectors = tuple(
+                field.compile_collector(validator) for field, validator in
+                zip(six.itervalues(cls._fields), cls._validators))
+        else:
+            # Overridden validate() is opaque, it can only be run as a whole
+            def collector(obj, errors, path):
+                try:
+                    obj.validate()
+                except FieldError as exc:
+                    errors.append((path + exc.steps, exc.args[0]))
+            cls._collectors = (collector,)
+        return cls._collectors
+
+    @classmethod
+    def try_fromjson(cls, json, unknown_keys=None):
+        """Decode object collecting all errors instead of raising the first.
+
+        Return `ValidationResult`, its ``value`` is set only if there are no
+        errors. ``unknown_keys`` is handled as by ``fromjson()``.
+        """
+        if unknown_keys is not None:
+            return _with_unknown_keys(unknown_keys, cls.try_fromjson, json)
+        errors = []
+        obj = cls._try_fromjson(json, errors, ())
+        if errors:
+            return ValidationResult(cls, None, errors)
+        if getattr(cls, 'track_changes', False):
+            obj._baseline = _copy_json(dict(json))
+        return ValidationResult(cls, obj, errors)
+
+    @classmethod
+    def _try_fromjson(cls, json, errors, path):
+        interning = cls._interning
+        if interning is not None and interning.keys is not None:
+            json = dict(interning.keys(json))
+        count = len(errors)
+        try:
+            obj = cls._load(json)
+        except FieldError:
+            # Report all rejected keys and check the declared ones
+            declared = cls._declared_keys
+            errors.extend((path + (key,), 'Unknown key')
+                          for key in json if key not in declared)
+            obj = cls._load(dict((key, value)
+                                 for key, value in six.iteritems(json)
+                                 if key in declared))
+        obj._collect_errors(errors, path)
+        if interning is not None and len(errors) == count:
+            interning.apply(obj)
+        return obj
+
+    @classmethod
+    def _known(cls, json):
+        """Apply unknown keys policy to ``json`` about to be loaded"""
+        policy = _decoding.unknown_keys or cls.unknown_keys
+        declared = cls._declared_keys
+        if policy == 'keep' or declared.issuperset(json):
+            return json
+        if policy == 'reject':
+            key = next(key for key in json if key not in declared)
+            raise FieldError('Unknown key', key)
+        # Undeclared values are never copied into the object
+        return dict((key, value) for key, value in six.iteritems(json)
+                    if key in declared)
+
+    def materialize(self):
+        """Validate and instantiate all lazily decoded subtrees"""
+        for field in six.itervalues(self._fields):
+            field.materialize(self)
+        return self
 
     def jsonize(self):
         json = {}
-        for field in six.itervalues(self._fields):
-            if field.key in self:
-                json[field.key] = field.jsonize(self)
+        for key, jsonize in self._jsonizers:
+            if key in self:
+                if jsonize is None:
+                    json[key] = self[key]
+                else:
+                    json[key] = jsonize(self)
         return json
 
+    def iterdump(self, **options):
+        """Encode object to JSON piece by piece without building the result
+        of ``jsonize()``. Joined pieces are the same as
+        ``json.dumps(self.jsonize(), **options)``.
+        """
+        return self._iterdump(_JSONDumper(**options), 0)
+
+    def dump(self, fp, chunk_size=65536, **options):
+        """Write JSON to file object ``fp`` in chunks of ``chunk_size``"""
+        _write_chunks(fp, self.iterdump(**options), chunk_size)
+
+    @classmethod
+    def iterdump_many(cls, objects, **options):
+        """Encode iterable of objects as JSON array piece by piece"""
+        return _JSONDumper(**options).iterobjects(objects, 0)
+
+    @classmethod
+    def dump_many(cls, objects, fp, chunk_size=65536, **options):
+        """Write iterable of objects to ``fp`` as JSON array, the same as
+        ``json.dump([obj.jsonize() for obj in objects], fp, **options)``.
+        """
+        _write_chunks(fp, cls.iterdump_many(objects, **options), chunk_size)
+
+    def _iterdump(self, dumper, level):
+        # Iterating gives keys even if a field named "keys" shadows keys()
+        if not _inherits(self, 'jsonize', _ObjectBase) or \
+           self._streamed_keys.isdisjoint(self):
+            return iter([dumper.encode(self.jsonize(), level)])
+        return dumper.iterdict(
+            [(field.key, functools.partial(field.iterdump, self, dumper))
+             for field in six.itervalues(self._fields) if field.key in self],
+            level)
+
+    @classmethod
+    def to_columns(cls, objects, fields=None):
+        """Convert objects to a dictionary of NumPy arrays keyed by paths.
+
+        ``fields`` is a list of paths like ``[Cls.a, Cls.b.c]``, all
+        top-level fields by default. Paths going through lists or dicts of
+        objects need an index, e.g. ``Cls.items[0].price``, otherwise
+        `DictyRuntimeError` is raised. Array dtype is taken from
+        ``numpy_dtype`` of the field, missing and ``None`` values are masked.
+        Aware datetimes are converted to UTC for ``datetime64`` columns.
+        """
+        numpy = _import_numpy()
+        if fields is None:
+            fields = [field._path for field in six.itervalues(cls._fields)]
+        columns = []
+        for path in fields:
+            field = path._field
+            dtype = None if path._is_item() else field.numpy_dtype
+            # _chain() rejects paths going through a list without an index
+            steps = [step._step for step in path._chain()]
+            columns.append((path, steps, field, dtype, []))
+        masks = [[] for _ in columns]
+        # Single pass over objects collecting values of all columns
+        for obj in objects:
+            for (_, steps, field, dtype, values), mask in zip(columns, masks):
+                container = obj
+                try:
+                    for step in steps[:-1]:
+                        container = container[step]
+                    value = _column_value(field, container, steps[-1])
+                except (KeyError, IndexError, TypeError):
+                    value = None
+                values.append(value)
+                mask.append(value is None)
+
+        result = {}
+        for (path, _, _, dtype, values), mask in zip(columns, masks):
+            if dtype is None:
+                array = numpy.empty(len(values), dtype=object)
+                for no, value in enumerate(values):
+                    array[no] = value
+            else:
+                if any(mask):
+                    fill = numpy.zeros(1, dtype=dtype)[0]
+                    values = [fill if value is None else value
+                              for value in values]
+                if numpy.dtype(dtype).kind == 'M':
+                    values = [_naive_utc(value) for value in values]
+                array = numpy.fromiter(values, dtype=dtype, count=len(values))
+            if any(mask):
+                array = numpy.ma.masked_array(array, mask=mask)
+            result[six.text_type(path)] = array
+        return result
+
+    @classmethod
+    def from_columns(cls, columns):
+        """Build objects from a dictionary of columns keyed by field keys.
+
+        NumPy arrays are checked a whole column at once where the field
+        supports it (see ``Field.column_fromjson()``), other columns and
+        sequences are validated row by row. Masked values are treated as
+        missing keys. Errors are the same as ``fromjson()`` raises for the
+        first failing row, with row index prepended to the path.
+        """
+        numpy = _import_numpy()
+        fields = dict((field.key, field)
+                      for field in six.itervalues(cls._fields))
+        size = None
+        converted = []
+        vectorized = set()
+        for key, column in six.iteritems(columns):
+            try:
+                field = fields[key]
+            except KeyError:
+                raise DictyRuntimeError('Unknown column {!r}'.format(key))
+            data, mask = _column_array(numpy, column)
+            if size is None:
+                size = len(data)
+            elif len(data) != size:
+                raise DictyRuntimeError('Columns have different lengths')
+            if mask is not None and not field.optional:
+                values = None
+            elif mask is not None:
+                values = field.column_fromjson(data[~mask], numpy)
+            else:
+                values = field.column_fromjson(data, numpy)
+            raw = data.tolist()
+            if values is None:
+                converted.append((key, None, raw, None, mask))
+                continue
+            vectorized.add(key)
+            if mask is not None:
+                values = iter(values)
+                values = [None if missing else next(values)
+                          for missing in mask.tolist()]
+            if isinstance(field, ShadowField):
+                converted.append((key, field.attname, raw, values, mask))
+            else:
+                converted.append((key, None, values, None, mask))
+
+        if cls.validate in (_ObjectBase.validate, DictObject.validate):
+            validators = [
+                validator for field, validator in
+                zip(six.itervalues(cls._fields), cls._validators)
+                if field.key not in vectorized]
+        else:
+            validators = None
+        objects = []
+        for row in six.moves.range(size or 0):
+            obj = cls()
+            for key, attname, raw, values, mask in converted:
+                if mask is not None and mask[row]:
+                    continue
+                obj._setitem(key, raw[row])
+                if attname is not None:
+                    obj._shadow[attname] = values[row]
+            try:
+                if validators is None:
+                    obj.validate()
+                else:
+                    for validator in validators:
+                        validator(obj)
+            except FieldError as exc:
+                exc.add_index(row)
+                raise
+            objects.append(obj)
+        return objects
+
+    @classmethod
+    def fromjson_many(cls, records, workers=None, chunksize=None, pool=None,
+                      unknown_keys=None):
+        """Decode list of records using a pool of worker processes.
+
+        Result preserves order of ``records``, and the first failing record
+        raises the same `FieldError` as sequential ``fromjson()`` would.
+        Class must be importable by workers, i.e. declared on module level.
+        ``pool`` is an optional ``multiprocessing.Pool`` to reuse.
+        ``unknown_keys`` is handled as by ``fromjson()``.
+        """
+        records = list(records)
+        # Workers don't see the policy of this thread, it is passed to them
+        unknown_keys = unknown_keys or _decoding.unknown_keys
+        if workers is None:
+            workers = multiprocessing.cpu_count()
+        if pool is None and (workers <= 1 or len(records) <= 1):
+            return _fromjson_chunk(cls, unknown_keys, records)
+        if chunksize is None:
+            chunksize = max(1, len(records) // (workers * 4))
+        chunks = [records[i:i + chunksize]
+                  for i in six.moves.range(0, len(records), chunksize)]
+        func = functools.partial(_fromjson_chunk, cls, unknown_keys)
+        own_pool = pool is None
+        if own_pool:
+            pool = multiprocessing.Pool(workers)
+        try:
+            # imap() yields chunks in order, so the first failed record
+            # raises, not the first one to fail in time
+            result = [obj for chunk in pool.imap(func, chunks)
+                      for obj in chunk]
+        finally:
+            if own_pool:
+                pool.terminate()
+                pool.join()
+        return result
+
+    @classmethod
+    def iter_fromjson(cls, fileobj, chunk_size=65536):
+        """Lazily decode objects from a file with newline-delimited JSON
+        or a single JSON array.
+
+        File is read in ``chunk_size`` pieces, so memory usage does not
+        depend on the file size. Record index is prepended to the path of
+        raised `FieldError`.
+        """
+        decoder = _JSONStreamDecoder()
+        text_decoder = None
+        index = 0
+        while True:
+            chunk = fileobj.read(chunk_size)
+            final = not chunk
+            if isinstance(chunk, six.binary_type):
+                if text_decoder is None:
+                    text_decoder = codecs.getincrementaldecoder('utf-8')()
+                chunk = text_decoder.decode(chunk, final)
+            for value in decoder.decode(chunk, final):
+                try:
+                    obj = cls.fromjson(value)
+                except FieldError as exc:
+                    exc.add_index(index)
+                    raise
+                index += 1
+                yield obj
+            if final:
+                break
+
+    @classmethod
+    def afromjson_stream(cls, reader, **kwargs):
+        """Coroutine reading JSON document from ``asyncio.StreamReader``
+        and decoding it, see `dicty_asyncio.afromjson_stream()`.
+        """
+        return _import_asyncio().afromjson_stream(cls, reader, **kwargs)
+
     @classmethod
-    def fromjson(cls, json):
+    def aiter_fromjson(cls, reader, **kwargs):
+        """Asynchronous iterator decoding objects from
+        ``asyncio.StreamReader``, see `dicty_asyncio.aiter_fromjson()`.
+        """
+        return _import_asyncio().aiter_fromjson(cls, reader, **kwargs)
+
+    def adump(self, writer, **kwargs):
+        """Coroutine writing JSON to ``asyncio.StreamWriter``, see
+        `dicty_asyncio.adump()`.
+        """
+        return _import_asyncio().adump(self, writer, **kwargs)
+
+    @classmethod
+    def adump_many(cls, objects, writer, **kwargs):
+        """Coroutine writing JSON array of objects to
+        ``asyncio.StreamWriter``, see `dicty_asyncio.adump_many()`.
+        """
+        return _import_asyncio().adump_many(cls, objects, writer, **kwargs)
+
+    @classmethod
+    def fromobject(cls, other):
+        """Convert between `DictObject` and `CompactObject` classes sharing
+        field declarations. Values are copied as is, without validation.
+        """
+        obj = cls()
+        shadow = other._shadow
+        for field in six.itervalues(cls._fields):
+            if field.key in other:
+                obj[field.key] = other[field.key]
+            if field.attname in shadow:
+                obj._shadow[field.attname] = shadow[field.attname]
+        return obj
+
+    @classmethod
+    def projection(cls, only):
+        """Return Mongo projection document selecting fields ``only``, the
+        same fields ``fromjson(json, only=only)`` decodes.
+        """
+        return dict(cls._projection(only).mongo)
+
+    @classmethod
+    def _projection(cls, only):
+        # Projections are usually few and static, compile each one once
+        try:
+            projections = cls.__dict__['_projections']
+        except KeyError:
+            projections = cls._projections = {}
+        only = tuple(only)
+        key = []
+        for path in only:
+            if not isinstance(path, DictyPath):
+                raise DictyRuntimeError(
+                    'Projection expects key paths, got {!r}'.format(path))
+            # Equal paths of other classes must not hit the cache, so
+            # fields are part of the key
+            steps = []
+            while path is not None:
+                steps.append((path._field, path._step))
+                path = path._parent
+            key.append(tuple(steps))
+        key = tuple(key)
+        try:
+            return projections[key]
+        except KeyError:
+            pass
+        projection = _Projection(cls, _projection_tree(cls, only))
+        if len(projections) < _Projection.cache_size:
+            projections[key] = projection
+        return projection
+
+    @classmethod
+    def view(cls, json):
+        """Wrap decoded JSON dict into read-only `ObjectView` without copying
+        it. Fields are validated on first access. Classes overriding
+        ``validate()`` can't be viewed.
+        """
+        return cls._view_type()(json)
+
+    @classmethod
+    def _view_type(cls):
+        try:
+            return cls.__dict__['_view_class']
+        except KeyError:
+            pass
+        if cls.validate not in (_ObjectBase.validate, DictObject.validate):
+            raise DictyRuntimeError(
+                "{} overrides validate(), views can't run it, use fromjson()"
+                .format(cls.__name__))
+        attrs = {'__slots__': (), '_type': cls, '_keys': {}}
+        for index, field in enumerate(six.itervalues(cls._fields)):
+            attrs[field.attname] = attrs['_keys'][field.key] = \
+                _ViewAttribute(field, index, field.compile_viewer())
+        cls._view_class = type(cls.__name__ + 'View', (ObjectView,), attrs)
+        return cls._view_class
+
+
+def _import_asyncio():
+    if sys.version_info < (3, 6):
+        raise DictyRuntimeError('asyncio support requires Python 3.6+')
+    import dicty_asyncio
+    return dicty_asyncio
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise DictyRuntimeError('numpy is required for columnar conversion')
+    return numpy
+
+
+def _column_value(field, container, key):
+    value = container[key]
+    if isinstance(field, ShadowField) and value is not None:
+        if isinstance(container, _ObjectBase):
+            return container._shadow[field.attname]
+        # Raw JSON of lazily decoded subtree
+        return field.fromjson(value)
+    return value
+
+
+def _naive_utc(value):
+    """Convert aware datetime to naive UTC, datetime64 has no time zone"""
+    if isinstance(value, datetime.datetime) and value.tzinfo is not None:
+        return value.replace(tzinfo=None) - value.utcoffset()
+    return value
+
+
+def _column_array(numpy, column):
+    """Return column data as 1-D array and mask of missing values or None"""
+    if isinstance(column, numpy.ndarray) and column.ndim == 1:
+        if isinstance(column, numpy.ma.MaskedArray):
+            mask = numpy.ma.getmaskarray(column)
+            if mask.any():
+                return numpy.ma.getdata(column), mask
+            return numpy.ma.getdata(column), None
+        return column, None
+    # Sequences of Python objects are never coerced to a common type
+    data = numpy.empty(len(column), dtype=object)
+    for no, value in enumerate(column):
+        data[no] = value
+    return data, None
+
+
+class _JSONDumper(object):
+    """Produce JSON containers piece by piece the same way as
+    `json.JSONEncoder` configured with ``options`` does.
+    """
+
+    batch_size = 100
+
+    def __init__(self, cls=None, **options):
+        encoder = (cls or json.JSONEncoder)(**options)
+        self.encode_value = encoder.encode
+        self.sort_keys = encoder.sort_keys
+        indent = encoder.indent
+        if indent is not None and not isinstance(indent, six.string_types):
+            indent = ' ' * indent
+        self.indent = indent
+        self.item_separator = encoder.item_separator
+        self.key_separator = encoder.key_separator
+
+    def encode(self, value, level):
+        text = self.encode_value(value)
+        if self.indent:
+            # Nested containers are indented relative to the current level,
+            # strings can't contain raw newlines
+            text = text.replace('\n', '\n' + self.indent * level)
+        return text
+
+    def _separators(self, level):
+        if self.indent is None:
+            return '', self.item_separator, ''
+        newline = '\n' + self.indent * (level + 1)
+        return (newline, self.item_separator + newline,
+                '\n' + self.indent * level)
+
+    def iterdict(self, items, level):
+        """Encode ``(key, dump)`` pairs, ``dump(level)`` yields value"""
+        if not items:
+            yield '{}'
+            return
+        if self.sort_keys:
+            items = sorted(items, key=lambda item: item[0])
+        first, separator, last = self._separators(level)
+        encode_key = self.encode_value
+        key_separator = self.key_separator
+        prefix = '{' + first
+        for key, dump in items:
+            yield prefix + encode_key(key) + key_separator
+            for chunk in dump(level + 1):
+                yield chunk
+            prefix = separator
+        yield last + '}'
+
+    def iterlist(self, items, level):
+        """Encode values, every item is ``dump(level)`` yielding value"""
+        first, separator, last = self._separators(level)
+        prefix = '[' + first
+        for dump in items:
+            yield prefix
+            for chunk in dump(level + 1):
+                yield chunk
+            prefix = separator
+        if prefix is separator:
+            yield last + ']'
+        else:
+            yield '[]'
+
+    def iterobjects(self, objects, level):
+        """Encode objects as list, runs of objects without nested objects
+        are encoded by ``batch_size`` at once.
+        """
+        return self.iterlist(self._group_objects(objects), level)
+
+    def _group_objects(self, objects):
+        batch = []
+        for obj in objects:
+            if _inherits(obj, 'jsonize', _ObjectBase) and \
+               obj._streamed_keys.isdisjoint(obj):
+                batch.append(obj.jsonize())
+                if len(batch) >= self.batch_size:
+                    yield functools.partial(self._encode_items, batch)
+                    batch = []
+                continue
+            if batch:
+                yield functools.partial(self._encode_items, batch)
+                batch = []
+            yield functools.partial(obj._iterdump, self)
+        if batch:
+            yield functools.partial(self._encode_items, batch)
+
+    def _encode_items(self, values, level):
+        # Encode values as list one level up and strip the brackets, what is
+        # left is the items joined the same way iterlist() joins them
+        first, _, last = self._separators(level - 1)
+        yield self.encode(values, level - 1)[len(first) + 1:-len(last) - 1]
+
+
+def _projection_tree(cls, only):
+    """Merge selectors into a tree of keys, ``None`` selects whole value"""
+    tree = {}
+    for path in only:
+        chain = []
+        while path is not None:
+            if path._is_item():
+                raise DictyRuntimeError(
+                    'Indexed path {!r} can not be used in projection'
+                    .format(six.text_type(path)))
+            chain.append(path)
+            path = path._parent
+        chain.reverse()
+        if cls._fields.get(chain[0]._field.attname) is not chain[0]._field:
+            raise DictyRuntimeError('Path {!r} does not belong to {}'.format(
+                six.text_type(chain[-1]), cls.__name__))
+        node = tree
+        for path in chain[:-1]:
+            node = node.setdefault(path._field.key, {})
+            if node is None:
+                break
+        else:
+            node[chain[-1]._field.key] = None
+    return tree
+
+
+class _Projection(object):
+    """Compiled selection of fields decoded by ``fromjson(json, only=...)``
+
+    Fields selected as a whole are checked with their validators, nested
+    objects with only some of their fields selected are decoded with the
+    projection of their type. Classes overriding ``validate()`` are decoded
+    and validated as a whole, as the override may check any field.
+    """
+    # Upper limit for number of cached projections per class
+    cache_size = 128
+
+    def __init__(self, cls, tree):
+        self.cls = cls
+        self.entries = []
+        self.mongo = []
+        self.whole = cls.validate not in (_ObjectBase.validate,
+                                          DictObject.validate)
+        if self.whole:
+            return
+        for index, field in enumerate(six.itervalues(cls._fields)):
+            if field.key not in tree:
+                continue
+            subtree = tree[field.key]
+            decode = nested = None
+            # Only typed fields have paths to nested fields, variants are
+            # selected whole
+            if subtree is not None and isinstance(field.type, JSONMetaObject):
+                nested = _Projection(field.type, subtree)
+                if not nested.whole:
+                    decode = field.compile_projection(nested)
+            self.entries.append((field.key, index, field.optional, decode))
+            # Mongo can't select the same key of every value of a dict
+            if decode is None or isinstance(field, TypedDictField):
+                self.mongo.append((field.key, 1))
+            else:
+                self.mongo.extend(('{}.{}'.format(field.key, key), value)
+                                  for key, value in nested.mongo)
+
+    def fromjson(self, json):
+        cls = self.cls
+        if self.whole:
+            return cls.fromjson(json)
+        obj = cls()
+        validators = cls._validators
+        for key, index, optional, decode in self.entries:
+            if key not in json:
+                if not optional:
+                    raise FieldError('Is required', key)
+                continue
+            if decode is None:
+                obj._setitem(key, json[key])
+                validators[index](obj)
+                continue
+            try:
+                obj._setitem(key, decode(json[key]))
+            except FieldError as exc:
+                exc.add_path_info(key)
+                raise
+        if cls._interning is not None:
+            cls._interning.apply(obj)
+        if getattr(cls, 'track_changes', False):
+            obj._baseline = _copy_json(obj.jsonize())
+        return obj
+
+    def load(self, value):
+        """Decode nested object"""
+        if not isinstance(value, dict):
+            raise FieldError('must be dictionary')
+        return self.fromjson(value)
+
+
+def _write_chunks(fp, chunks, chunk_size):
+    buffer = []
+    size = 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        size += len(chunk)
+        if size >= chunk_size:
+            fp.write(''.join(buffer))
+            buffer = []
+            size = 0
+    if buffer:
+        fp.write(''.join(buffer))
+
+
+def _fromjson_chunk(cls, unknown_keys, records):
+    return _with_unknown_keys(unknown_keys, _fromjson_records, cls, records)
+
+
+def _fromjson_records(cls, records):
+    return [cls.fromjson(record) for record in records]
+
+
+def _copy_json(value):
+    if isinstance(value, dict):
+        return dict((key, _copy_json(item))
+                    for key, item in six.iteritems(value))
+    if isinstance(value, (list, tuple)):
+        return [_copy_json(item) for item in value]
+    return value
+
+
+def _is_path_key(key):
+    return (isinstance(key, six.string_types) and key and
+            '.' not in key and not key.startswith('$'))
+
+
+def _diff_json(old, new, prefix, update_set, update_unset):
+    for key, value in six.iteritems(new):
+        path = prefix + key
+        if key in old:
+            _diff_value(old[key], value, path, update_set, update_unset)
+        else:
+            update_set[path] = value
+    for key in old:
+        if key not in new:
+            update_unset.append(prefix + key)
+
+
+def _diff_value(old, new, path, update_set, update_unset):
+    if isinstance(old, dict) and isinstance(new, dict):
+        if all(_is_path_key(key) for key in old) and \
+           all(_is_path_key(key) for key in new):
+            _diff_json(old, new, path + '.', update_set, update_unset)
+            return
+    elif isinstance(old, (list, tuple)) and isinstance(new, (list, tuple)):
+        # Lists can't be shrunk or grown by path, replace them as a whole
+        if len(old) == len(new):
+            for index, (old_item, new_item) in enumerate(zip(old, new)):
+                _diff_value(old_item, new_item, u'{}.{}'.format(path, index),
+                            update_set, update_unset)
+            return
+    if type(old) is not type(new) or old != new:
+        update_set[path] = new
+
+
+class _DirtyMutators(object):
+    """Dict mutators installed into `DictObject` classes with
+    ``track_dirty`` enabled
+    """
+
+    def __setitem__(self, key, value):
+        dict.__setitem__(self, key, value)
+        dirty = self._dirty
+        if dirty is None:
+            self._dirty = {key}
+        else:
+            dirty.add(key)
+
+    def __delitem__(self, key):
+        dict.__delitem__(self, key)
+        self._touch((key,))
+
+    def update(self, *args, **kwargs):
+        other = dict(*args, **kwargs)
+        dict.update(self, other)
+        self._touch(other)
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return dict.__getitem__(self, key)
+
+    def pop(self, key, *args):
+        if key in self:
+            self._touch((key,))
+        return dict.pop(self, key, *args)
+
+    def popitem(self):
+        key, value = dict.popitem(self)
+        self._touch((key,))
+        return key, value
+
+    def clear(self):
+        self._touch(self)
+        dict.clear(self)
+
+    @classmethod
+    def install(cls, attrs):
+        for name in ('__setitem__', '__delitem__', 'update', 'setdefault',
+                     'pop', 'popitem', 'clear'):
+            attrs.setdefault(name, cls.__dict__[name])
+
+
+@base_with_metaclass(JSONMetaObject)
+class DictObject(_ObjectBase, dict):
+    # Record keys modified since creation or the last mark_clean() call,
+    # every item assignment pays for it, so it is opt-in
+    track_dirty = False
+    _dirty = None
+    # Keep a copy of the decoded document to compute changes()
+    track_changes = False
+    _baseline = None
+
+    def __init__(self, **kwargs):
+        self._shadow = {}
+        _ObjectBase.__init__(self, **kwargs)
+
+    # Validators store converted values without marking keys dirty
+    _setitem = dict.__setitem__
+
+    def _touch(self, keys):
+        if self._dirty is None:
+            self._dirty = set(keys)
+        else:
+            self._dirty.update(keys)
+
+    def __reduce_ex__(self, protocol):
+        # Default implementation calls self.items(), which may be shadowed
+        # by a field with the same name. Items are restored before the
+        # state, so keep the dirty set explicit to not mark everything.
+        state = dict(self.__dict__, _dirty=set(self._dirty or ()) or None)
+        return (six.moves.copyreg.__newobj__, (type(self),), state,
+                None, iter(dict.items(self)))
+
+    def dirty_keys(self):
+        """Return set of keys modified since object was created or marked
+        clean, including keys of nested objects that have modifications.
+        Objects not tracking modifications, like `CompactObject` or classes
+        without ``track_dirty``, are never counted as modified.
+        """
+        dirty = set(self._dirty or ())
+        for field in six.itervalues(self._fields):
+            if field.key not in dirty:
+                for _, nested in field.iter_nested(self):
+                    if isinstance(nested, DictObject) and \
+                       nested.dirty_keys():
+                        dirty.add(field.key)
+                        break
+        return dirty
+
+    def mark_clean(self):
+        """Forget modifications, including ones of nested objects"""
+        self.__dict__.pop('_dirty', None)
+        for field in six.itervalues(self._fields):
+            for _, nested in field.iter_nested(self):
+                if isinstance(nested, DictObject):
+                    nested.mark_clean()
+
+    def validate(self, changed_only=False, collect=False):
+        """Validate the object.
+
+        With ``changed_only`` only fields listed in ``dirty_keys()`` are
+        checked: modified fields are validated as usual and for nested
+        objects with modifications their changed fields are validated.
+        Nested objects not tracking modifications are validated whole.
+        ``changed_only`` requires ``track_dirty`` to be enabled.
+        ``collect`` is handled as by `CompactObject`, it can't be combined
+        with ``changed_only``.
+        """
+        if not changed_only:
+            # Typed fields are instantiated again, remember which of them
+            # hold modified objects
+            dirty = self.dirty_keys()
+            result = _ObjectBase.validate(self, collect)
+            if dirty:
+                self._touch(dirty)
+            return result
+        if collect:
+            raise DictyRuntimeError(
+                'collect and changed_only can not be used together')
+        if not self.track_dirty:
+            raise DictyRuntimeError(
+                'changed_only requires track_dirty to be enabled')
+        dirty = self._dirty or ()
+        for field, validator in zip(six.itervalues(self._fields),
+                                    self._validators):
+            if field.key in dirty:
+                validator(self)
+                continue
+            for index, nested in field.iter_nested(self):
+                try:
+                    if isinstance(nested, DictObject) and \
+                       nested.track_dirty:
+                        nested.validate(changed_only=True)
+                    else:
+                        nested.validate()
+                except FieldError as exc:
+                    if isinstance(index, six.integer_types):
+                        exc.add_index(index)
+                    elif index is not None:
+                        exc.add_key(index)
+                    exc.add_path_info(field.key)
+                    raise
+
+    @classmethod
+    def _load(cls, json):
+        obj = cls()
+        dict.update(obj, cls._known(json))
+        return obj
+
+    @classmethod
+    def fromjson(cls, json, only=None, unknown_keys=None):
+        """Decode and validate object.
+
+        ``only`` is a list of key paths, e.g. ``[Cls.id, Cls.items.price]``,
+        then only selected fields are decoded, others are dropped.
+        ``unknown_keys`` overrides `unknown_keys` policy of the class and of
+        nested objects for this call.
+        """
+        if unknown_keys is not None:
+            # Not cls.fromjson(), overrides may pass unknown_keys again
+            return _with_unknown_keys(unknown_keys,
+                                      DictObject.fromjson.__func__,
+                                      cls, json, only)
+        if only is not None:
+            return cls._projection(only).fromjson(json)
+        if _decoding.unknown_keys is not None or cls.unknown_keys != 'keep':
+            json = cls._known(json)
         obj = cls()
-        obj.update(json)
+        interning = cls._interning
+        if interning is not None and interning.keys is not None:
+            dict.update(obj, interning.keys(json))
+        else:
+            dict.update(obj, json)
+        if cls.validate == DictObject.validate:
+            # Nothing is modified yet, no need to track nested objects
+            _ObjectBase.validate(obj)
+        else:
+            obj.validate()
+        if interning is not None:
+            interning.apply(obj)
+        if cls.track_changes:
+            obj._baseline = _copy_json(dict(json))
+        return obj
+
+    def changes(self):
+        """Return Mongo-style update turning the baseline into ``jsonize()``.
+
+        Result has ``'$set'`` mapping dotted paths to new values and
+        ``'$unset'`` listing removed paths, empty parts are omitted. Baseline
+        is the document given to ``fromjson()`` of a class with
+        ``track_changes`` enabled, or the state saved by ``commit()``.
+        """
+        if self._baseline is None:
+            raise DictyRuntimeError(
+                'No baseline to compare with, enable track_changes or '
+                'call commit() first')
+        update_set = {}
+        update_unset = []
+        _diff_json(self._baseline, self.jsonize(), '',
+                   update_set, update_unset)
+        update = {}
+        if update_set:
+            update['$set'] = update_set
+        if update_unset:
+            update['$unset'] = update_unset
+        return update
+
+    def commit(self):
+        """Use current state as the baseline and mark object clean"""
+        self._baseline = _copy_json(self.jsonize())
+        self.mark_clean()
+
+
+class CompactMetaObject(JSONMetaObject):
+    def __new__(mcs, name, bases, attrs):
+        fields = mcs.collect_fields(bases, attrs)
+        inherited = set()
+        for base in bases:
+            inherited.update(getattr(base, '_slots', {}).values())
+            inherited.update(getattr(base, '_shadow_slots', {}).values())
+        slots = {}
+        shadow_slots = {}
+        for field in six.itervalues(fields):
+            slots[field.key] = '_v_' + field.attname
+            if isinstance(field, ShadowField):
+                shadow_slots[field.attname] = '_s_' + field.attname
+        attrs['_slots'] = slots
+        attrs['_shadow_slots'] = shadow_slots
+        attrs['__slots__'] = tuple(attrs.get('__slots__', ())) + tuple(
+            slot for slot in sorted(
+                set(slots.values()) | set(shadow_slots.values()))
+            if slot not in inherited)
+        return super(CompactMetaObject, mcs).__new__(mcs, name, bases, attrs)
+
+
+class _ShadowSlots(object):
+    """Mapping of shadow values stored in `CompactObject` slots"""
+    __slots__ = ('obj',)
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __getitem__(self, attname):
+        try:
+            return getattr(self.obj, self.obj._shadow_slots[attname])
+        except AttributeError:
+            raise KeyError(attname)
+
+    def __setitem__(self, attname, value):
+        setattr(self.obj, self.obj._shadow_slots[attname], value)
+
+    def __delitem__(self, attname):
+        try:
+            delattr(self.obj, self.obj._shadow_slots[attname])
+        except AttributeError:
+            raise KeyError(attname)
+
+    def __contains__(self, attname):
+        slot = self.obj._shadow_slots.get(attname)
+        return slot is not None and hasattr(self.obj, slot)
+
+
+@base_with_metaclass(CompactMetaObject)
+class CompactObject(_ObjectBase):
+    """Memory efficient counterpart of `DictObject`
+
+    Values are kept in ``__slots__`` instead of a dictionary, only declared
+    fields can be stored. Instance still supports item access by key.
+    """
+    __slots__ = ()
+
+    @property
+    def _shadow(self):
+        return _ShadowSlots(self)
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, self._slots[key])
+        except AttributeError:
+            raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        setattr(self, self._slots[key], value)
+
+    _setitem = __setitem__
+
+    def __delitem__(self, key):
+        try:
+            delattr(self, self._slots[key])
+        except AttributeError:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        slot = self._slots.get(key)
+        return slot is not None and hasattr(self, slot)
+
+    def __iter__(self):
+        for key in self._slots:
+            if key in self:
+                yield key
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __eq__(self, other):
+        if isinstance(other, CompactObject):
+            if type(self) is not type(other):
+                return False
+        elif not isinstance(other, dict):
+            return NotImplemented
+        return dict(self.items()) == dict(other.items())
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '{}({!r})'.format(type(self).__name__, dict(self.items()))
+
+    def __getstate__(self):
+        return (dict(self.items()),
+                {attname: self._shadow[attname]
+                 for attname in self._shadow_slots
+                 if attname in self._shadow})
+
+    def __setstate__(self, state):
+        items, shadow = state
+        for key, value in six.iteritems(items):
+            self[key] = value
+        for attname, value in six.iteritems(shadow):
+            self._shadow[attname] = value
+
+    def keys(self):
+        return list(self)
+
+    def values(self):
+        return [self[key] for key in self]
+
+    def items(self):
+        return [(key, self[key]) for key in self]
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def update(self, other):
+        for key, value in six.iteritems(dict(other)):
+            self[key] = value
+
+    @classmethod
+    def fromjson(cls, json, only=None, unknown_keys=None):
+        """Undeclared keys are dropped, there is no place to keep them,
+        unless `unknown_keys` policy is ``'reject'``.
+        """
+        if unknown_keys is not None:
+            return _with_unknown_keys(unknown_keys,
+                                      CompactObject.fromjson.__func__,
+                                      cls, json, only)
+        if only is not None:
+            return cls._projection(only).fromjson(json)
+        obj = cls._load(json)
         obj.validate()
+        if cls._interning is not None:
+            cls._interning.apply(obj)
+        return obj
+
+    @classmethod
+    def _load(cls, json):
+        if (_decoding.unknown_keys or cls.unknown_keys) == 'reject':
+            cls._known(json)
+        obj = cls()
+        for key, slot in six.iteritems(cls._slots):
+            if key in json:
+                setattr(obj, slot, json[key])
         return obj
 
 
+# Values decoded by nested object fields, compact objects are decoded
+# again by validate()
+_DECODED_TYPES = (dict, CompactObject)
+
+
+class _ViewAttribute(object):
+    """Descriptor of `ObjectView` field, ``index`` points to the validator"""
+    __slots__ = ('field', 'index', 'viewer')
+
+    def __init__(self, field, index, viewer):
+        self.field = field
+        self.index = index
+        self.viewer = viewer
+
+    def __get__(self, view, type=None):
+        if view is None:
+            return self.field._path
+        return view._get(self)
+
+    def __set__(self, view, value):
+        view._read_only()
+
+    def __delete__(self, view):
+        view._read_only()
+
+
+class ObjectView(object):
+    """Read-only object wrapping decoded JSON dict without copying it
+
+    Fields are validated one by one on first access, nested typed objects
+    are wrapped into views as well, so the cost depends on fields actually
+    read. Missing fields are never created: optional ones give the same
+    default as the object would and others raise `AttributeError`. Call `toobject()` to get a regular
+    object that can be modified.
+    """
+    __slots__ = ('_raw', '_values', '_shadow', '_path', '_steps')
+    _type = None
+    _keys = {}
+
+    def __init__(self, json, path='', steps=()):
+        set = object.__setattr__
+        set(self, '_raw', json)
+        set(self, '_values', {})
+        set(self, '_shadow', {})
+        set(self, '_path', path)
+        set(self, '_steps', steps)
+
+    def _get(self, attr):
+        field = attr.field
+        if field.key not in self._values:
+            if field.key not in self._raw:
+                return field.view_default(self)
+            self._load(attr)
+        return field.__get__(self, type(self))
+
+    def _load(self, attr):
+        key = attr.field.key
+        values = self._values
+        try:
+            if attr.viewer is not None:
+                path = '{}.{}'.format(self._path, key) if self._path else key
+                try:
+                    values[key] = attr.viewer(self._raw[key], path,
+                                              self._steps + (key,))
+                except FieldError as exc:
+                    exc.add_path_info(key)
+                    raise
+            else:
+                # Validator reads the raw value and stores the result with
+                # _setitem()
+                values[key] = self._raw[key]
+                try:
+                    self._type._validators[attr.index](self)
+                except Exception:
+                    del values[key]
+                    raise
+        except FieldError as exc:
+            if self._path:
+                exc.add_path_info(self._path, self._steps)
+            raise
+
+    def _setitem(self, key, value):
+        self._values[key] = value
+
+    def _read_only(self, *args):
+        raise TypeError('{} is read-only, use toobject() to modify it'
+                        .format(type(self).__name__))
+
+    __setattr__ = __delattr__ = __setitem__ = __delitem__ = _read_only
+
+    def __getitem__(self, key):
+        try:
+            return self._values[key]
+        except KeyError:
+            attr = self._keys.get(key)
+            if attr is None or key not in self._raw:
+                return self._raw[key]
+        self._load(attr)
+        return self._values[key]
+
+    def __contains__(self, key):
+        return key in self._raw
+
+    def __iter__(self):
+        return iter(self._raw)
+
+    def __len__(self):
+        return len(self._raw)
+
+    def __repr__(self):
+        return '{}({!r})'.format(type(self).__name__, self._raw)
+
+    def keys(self):
+        return list(self._raw)
+
+    def values(self):
+        return [self[key] for key in self._raw]
+
+    def items(self):
+        return [(key, self[key]) for key in self._raw]
+
+    def get(self, key, default=None):
+        if key in self._raw:
+            return self[key]
+        return default
+
+    def hasattr(self, attname):
+        return self._type._fields[attname].key in self._raw
+
+    def validate(self):
+        """Validate all fields not accessed yet, nested views included"""
+        for attr in six.itervalues(self._keys):
+            if attr.field.key in self._raw:
+                value = self[attr.field.key]
+                if isinstance(value, (ObjectView, _ViewSequence)):
+                    value.validate()
+                elif isinstance(value, _ViewMapping):
+                    for item in six.itervalues(value):
+                        item.validate()
+
+    def toobject(self):
+        """Decode wrapped dict into a regular object of the viewed class"""
+        return self._type.fromjson(self._raw)
+
+
+class _ViewSequence(object):
+    """Read-only list of raw JSON dicts wrapped into views on access"""
+    __slots__ = ('_raw', '_view', '_path', '_steps', '_items')
+
+    def __init__(self, json, view, path, steps):
+        self._raw = json
+        self._view = view
+        self._path = path
+        self._steps = steps
+        self._items = {}
+
+    def _item(self, index):
+        if index < 0:
+            index += len(self._raw)
+        try:
+            return self._items[index]
+        except KeyError:
+            pass
+        value = self._raw[index]
+        path = '{}[{}]'.format(self._path, index)
+        steps = self._steps + (index,)
+        if not isinstance(value, dict):
+            raise FieldError('must be dictionary', path, steps)
+        item = self._items[index] = self._view(value, path, steps)
+        return item
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._item(i)
+                    for i in six.moves.range(*index.indices(len(self)))]
+        return self._item(index)
+
+    def __iter__(self):
+        for index in six.moves.range(len(self._raw)):
+            yield self._item(index)
+
+    def __len__(self):
+        return len(self._raw)
+
+    def __repr__(self):
+        return '{}({!r})'.format(type(self).__name__, self._raw)
+
+    def validate(self):
+        for item in self:
+            item.validate()
+
+
+class _ViewMapping(object):
+    """Read-only dict of raw JSON dicts wrapped into views on access"""
+    __slots__ = ('_raw', '_view', '_path', '_steps', '_items')
+
+    def __init__(self, json, view, path, steps):
+        self._raw = json
+        self._view = view
+        self._path = path
+        self._steps = steps
+        self._items = {}
+
+    def __getitem__(self, key):
+        try:
+            return self._items[key]
+        except KeyError:
+            pass
+        value = self._raw[key]
+        path = '{}[{!r}]'.format(self._path, key)
+        steps = self._steps + (key,)
+        if not isinstance(value, dict):
+            raise FieldError('must be dictionary', path, steps)
+        item = self._items[key] = self._view(value, path, steps)
+        return item
+
+    def __contains__(self, key):
+        return key in self._raw
+
+    def __iter__(self):
+        return iter(self._raw)
+
+    def __len__(self):
+        return len(self._raw)
+
+    def __repr__(self):
+        return '{}({!r})'.format(type(self).__name__, self._raw)
+
+    def keys(self):
+        return list(self._raw)
+
+    def values(self):
+        return [self[key] for key in self._raw]
+
+    def items(self):
+        return [(key, self[key]) for key in self._raw]
+
+    def get(self, key, default=None):
+        if key in self._raw:
+            return self[key]
+        return default
+
+
+# Set by `instrument()`. Compiled validators call ``hook(field, filter,
+# func, *args)`` instead of ``func(*args)`` while it is not ``None``, where
+# ``filter`` is ``None`` for the validator itself.
+_validation_hook = None
+
+
+def _hooked_validator(field, validate):
+    """Wrap ``validate(obj)`` into validator checking `_validation_hook`"""
+    def validator(obj, hooked=False):
+        hook = _validation_hook
+        if hook is not None and not hooked:
+            return hook(field, None, validator, obj, True)
+        return validate(obj)
+    return validator
+
+
 class Field(object):
     attname = None   # Python attribute name
     key = None       # Dictionary key
     path_class = DictyPath
+    numpy_dtype = None  # Array type used by to_columns(), None for objects
 
     def __init__(self, key=None, filters=(), optional=False, override=False,
-                 default=None, default_func=None):
+                 default=None, default_func=None, intern=None):
         self.key = key
         self.optional = optional
         self.override = override
         self.filters = filters
         self._default = default
         self._default_func = default_func
+        # True, `InternTable` or False to opt out of class intern_strings
+        self.intern = intern
 
     def __set__(self, obj, value):
         obj[self.key] = value
 
+    @cached_property
+    def _path(self):
+        return self._path_class()._new(self.key, self)
+
+    def _path_class(self):
+        """Return class of paths of this field"""
+        return self.path_class
+
     def __get__(self, obj, type=None):
         if obj is None:
-            return self.path_class._new(self.key, self)
+            return self._path
         try:
             return obj[self.key]
         except KeyError:
@@ -214,6 +2111,12 @@ class Field(object):
             return self._default
         raise self.not_set_error
 
+    def view_default(self, view):
+        """Return value of the field missing in `ObjectView` ``view``, same
+        as `getdefault()` but never stored, views are read-only
+        """
+        return self.getdefault(view)
+
     @property
     def not_set_error(self):
         return AttributeError('field {} is not set'.format(self.attname))
@@ -225,7 +2128,7 @@ class Field(object):
         value = self.fromjson(obj[self.key])
         for filter in self.filters:
             value = filter(value)
-        obj[self.key] = value
+        obj._setitem(self.key, value)
 
     def validate(self, obj):
         if self.key in obj:
@@ -240,9 +2143,125 @@ class Field(object):
             if not self.optional:
                 raise FieldError('Is required', self.key)
 
+    def materialize(self, obj):
+        pass
+
+    def iter_nested(self, obj):
+        """Yield ``(index, object)`` pairs for nested objects stored in the
+        field, ``index`` is ``None`` for the field value itself.
+        """
+        return ()
+
+    def compile_fromjson(self):
+        """Return callable doing the same as ``fromjson()``.
+
+        Subclasses may return a specialized closure as long as ``fromjson()``
+        itself is not overridden further down the hierarchy.
+        """
+        return self.fromjson
+
+    def column_fromjson(self, array, numpy):
+        """Convert NumPy array of JSON values at once.
+
+        Return list of converted values, or ``None`` when the column can't
+        be checked as a whole and values are validated one by one.
+        """
+        return None
+
+    def compile_collector(self, validator):
+        """Return callable ``collector(obj, errors, path)`` doing the same as
+        ``validator`` but appending errors to a list instead of raising.
+        """
+        key = self.key
+
+        def collector(obj, errors, path):
+            try:
+                validator(obj)
+            except FieldError as exc:
+                errors.append((path + (exc.steps or (key,)), exc.args[0]))
+        return collector
+
+    def _is_plain(self, fromjson_owner, run_filters_owner=None):
+        return (not self.filters and
+                _inherits(self, 'fromjson', fromjson_owner) and
+                _inherits(self, 'validate', Field) and
+                _inherits(self, 'run_filters', run_filters_owner or Field))
+
+    def compile_validator(self):
+        """Return callable doing the same as ``validate(obj)``.
+
+        Used by `JSONMetaObject` to build per-class validation fast path.
+        """
+        if not (_inherits(self, 'validate', Field) and
+                _inherits(self, 'run_filters', Field)):
+            return _hooked_validator(self, self.validate)
+        return self._build_validator(shadow=False)
+
+    def _build_validator(self, shadow):
+        field = self
+        key = self.key
+        attname = self.attname
+        optional = self.optional
+        filters = self.filters
+        fromjson = self.compile_fromjson()
+
+        def validator(obj, hooked=False):
+            hook = _validation_hook
+            if hook is not None and not hooked:
+                return hook(field, None, validator, obj, True)
+            if key not in obj:
+                if not optional:
+                    raise FieldError('Is required', key)
+                return
+            try:
+                value = fromjson(obj[key])
+                if hook is None:
+                    for filter in filters:
+                        value = filter(value)
+                else:
+                    for filter in filters:
+                        value = hook(field, filter, filter, value)
+            except ValueError as exc:
+                FieldError.raise_from(exc, key)
+            except FieldError as exc:
+                exc.add_path_info(key)
+                raise
+            if shadow:
+                obj._shadow[attname] = value
+            else:
+                obj._setitem(key, value)
+        return validator
+
     def jsonize(self, obj):
         return obj[self.key]
 
+    def iterdump(self, obj, dumper, level):
+        """Yield JSON pieces of the field value, see `_ObjectBase.iterdump`"""
+        yield dumper.encode(self.jsonize(obj), level)
+
+    def compile_jsonizer(self):
+        """Return callable doing the same as ``jsonize(obj)``.
+
+        ``None`` means that stored value is passed through as is.
+        """
+        if _inherits(self, 'jsonize', Field):
+            return None
+        return self.jsonize
+
+    def compile_projection(self, projection):
+        """Return callable decoding raw value with only some fields of the
+        nested objects, selected by `_Projection` of the field type.
+        ``None`` means that the value is validated as a whole.
+        """
+        return None
+
+    def compile_viewer(self):
+        """Return callable ``viewer(value, path, steps)`` wrapping raw JSON
+        value for `ObjectView`, ``None`` means that the value is validated with
+        the field validator instead.
+        """
+        return None
+
 
 class ShadowField(Field):
     def tojson(self, value):
@@ -254,6 +2273,12 @@ class ShadowField(Field):
             value = filter(value)
         obj._shadow[self.attname] = value
 
+    def compile_validator(self):
+        if not (_inherits(self, 'validate', Field) and
+                _inherits(self, 'run_filters', ShadowField)):
+            return _hooked_validator(self, self.validate)
+        return self._build_validator(shadow=True)
+
     def __set__(self, obj, value):
         json_value = self.tojson(value)
         obj._shadow[self.attname] = value
@@ -261,7 +2286,7 @@ class ShadowField(Field):
 
     def __get__(self, obj, type=None):
         if obj is None:
-            return self.path_class._new(self.key, self)
+            return self._path
         try:
             return obj._shadow[self.attname]
         except KeyError:
@@ -270,29 +2295,351 @@ class ShadowField(Field):
             raise self.not_set_error
 
 
+# strptime() directives supported by the fast datetime parser, in the order
+# of datetime() arguments, with regexps matching their zero-padded form
+_DATETIME_DIRECTIVES = [
+    ('Y', 'year', '([0-9]{4})', '%04d'),
+    ('m', 'month', '([0-9]{2})', '%02d'),
+    ('d', 'day', '([0-9]{2})', '%02d'),
+    ('H', 'hour', '([0-9]{2})', '%02d'),
+    ('M', 'minute', '([0-9]{2})', '%02d'),
+    ('S', 'second', '([0-9]{2})', '%02d'),
+    ('f', 'microsecond', '([0-9]{1,6})', '%06d'),
+]
+
+
+def _parse_datetime_format(format):
+    """Split format into literal parts and `_DATETIME_DIRECTIVES` entries.
+
+    Return ``None`` unless format consists of year, month and day followed
+    by optional hour, minute, second and microsecond in this order.
+    """
+    parts = re.split('%(.)', format)
+    directives = parts[1::2]
+    names = [name for name, _, _, _ in _DATETIME_DIRECTIVES]
+    if directives != names[:len(directives)] or len(directives) < 3:
+        return None
+    return parts[0::2], _DATETIME_DIRECTIVES[:len(directives)]
+
+
+def _build_datetime_parser(format):
+    """Return a fast equivalent of ``datetime.strptime(value, format)``.
+
+    Zero-padded values are parsed with a regexp, anything else including
+    invalid dates is passed to ``strptime()`` to get the same result or
+    error.
+    """
+    strptime = datetime.datetime.strptime
+    parsed = _parse_datetime_format(format)
+    if parsed is None:
+        return lambda value: strptime(value, format)
+    literals, directives = parsed
+    pattern = []
+    for literal, (_, _, regexp, _) in zip(literals, directives):
+        pattern.append(re.escape(literal))
+        pattern.append(regexp)
+    pattern.append(re.escape(literals[-1]))
+    match = re.compile(''.join(pattern) + r'\Z').match
+    make = datetime.datetime
+    microseconds = directives[-1][0] == 'f'
+
+    def parse(value):
+        try:
+            groups = match(value)
+        except TypeError:
+            groups = None
+        if groups is not None:
+            groups = groups.groups()
+            if microseconds:
+                groups = groups[:-1] + (groups[-1].ljust(6, '0'),)
+            try:
+                return make(*map(int, groups))
+            except ValueError:
+                pass
+        return strptime(value, format)
+    return parse
+
+
+def _build_datetime_formatter(format):
+    """Return a fast equivalent of ``value.strftime(format)``.
+
+    Only exact `datetime.datetime` and `datetime.date` values are formatted
+    with ``%`` operator, the rest including years before 1000, that
+    ``strftime()`` doesn't pad on all platforms, go to ``strftime()``.
+    """
+    parsed = _parse_datetime_format(format)
+    if parsed is None:
+        return lambda value: value.strftime(format)
+    literals, directives = parsed
+    template = []
+    attrs = []
+    for literal, (_, attr, _, spec) in zip(literals, directives):
+        template.append(literal.replace('%', '%%'))
+        template.append(spec)
+        attrs.append(attr)
+    template.append(literals[-1].replace('%', '%%'))
+    template = ''.join(template)
+    fields = operator.attrgetter(*attrs)
+    if len(attrs) > 3:
+        types = (datetime.datetime,)
+    else:
+        types = (datetime.datetime, datetime.date)
+
+    def strftime(value):
+        if type(value) in types and value.year >= 1000:
+            return template % fields(value)
+        return value.strftime(format)
+    return strftime
+
+
 class DatetimeField(ShadowField):
+    numpy_dtype = 'datetime64[us]'
     format = '%Y-%m-%d %H:%M:%S'
+    # Formats NumPy can parse, mapped to datetime64 unit
+    _column_units = {'%Y-%m-%d %H:%M:%S': 's', '%Y-%m-%d': 'D'}
 
     def __init__(self, *args, **kwargs):
         self.format = kwargs.pop('format', self.format)
         super(DatetimeField, self).__init__(*args, **kwargs)
 
+    @cached_property
+    def _parse(self):
+        return _build_datetime_parser(self.format)
+
+    @cached_property
+    def _format(self):
+        return _build_datetime_formatter(self.format)
+
     def fromjson(self, value):
-        return datetime.datetime.strptime(value, self.format)
+        return self._parse(value)
+
+    def compile_fromjson(self):
+        if not _inherits(self, 'fromjson', DatetimeField):
+            return super(DatetimeField, self).compile_fromjson()
+        return self._parse
+
+    def column_fromjson(self, array, numpy):
+        if not self._is_plain(DatetimeField, ShadowField):
+            return None
+        return self._column_parse(array, numpy, 'datetime64[us]')
+
+    def _column_parse(self, array, numpy, dtype):
+        # NumPy parses ISO 8601 only, formats matching it are checked by
+        # converting parsed values back to strings
+        unit = self._column_units.get(self.format)
+        if unit is None or array.dtype.kind != 'U':
+            return None
+        try:
+            parsed = array.astype('datetime64[{}]'.format(unit))
+        except ValueError:
+            return None
+        if numpy.isnat(parsed).any():
+            return None
+        strings = numpy.datetime_as_string(parsed, unit=unit)
+        if not (numpy.char.replace(strings, 'T', ' ') == array).all():
+            return None
+        return parsed.astype(dtype).tolist()
 
     def tojson(self, value):
-        return value.strftime(self.format)
+        return self._format(value)
 
 
 class DateField(DatetimeField):
+    numpy_dtype = 'datetime64[D]'
     format = '%Y-%m-%d'
 
     def fromjson(self, value):
         return super(DateField, self).fromjson(value).date()
 
+    def compile_fromjson(self):
+        if not _inherits(self, 'fromjson', DateField):
+            return super(DateField, self).compile_fromjson()
+        parse = self._parse
+
+        def fromjson(value):
+            return parse(value).date()
+        return fromjson
+
+    def column_fromjson(self, array, numpy):
+        if not self._is_plain(DateField, ShadowField):
+            return None
+        return self._column_parse(array, numpy, 'datetime64[D]')
+
+
+class LazyList(list):
+    """List keeping raw JSON items until they are accessed
+
+    Items are validated and instantiated on first access and replaced in
+    place with the result. Unknown keys policy given to the ``fromjson()``
+    call decoding the list is applied to items as well. Copies, and results
+    of ``+`` and ``*``, are lazy lists sharing the raw items. Comparison
+    operators compare raw items.
+    """
+    __slots__ = ('field', 'unknown_keys')
+
+    def __init__(self, field, items=(), unknown_keys=None):
+        if isinstance(items, LazyList):
+            # Copy items as they are, e.g. when validate() decodes again
+            unknown_keys = unknown_keys or items.unknown_keys
+            items = list.__iter__(items)
+        super(LazyList, self).__init__(items)
+        self.field = field
+        self.unknown_keys = unknown_keys
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+    def _materialize(self, index):
+        item = list.__getitem__(self, index)
+        if isinstance(item, self.field.type):
+            return item
+        try:
+            item = _with_unknown_keys(self.unknown_keys,
+                                      self.field.instantiate, item)
+        except FieldError as exc:
+            if index < 0:
+                index += len(self)
+            exc.add_index(index)
+            exc.add_path_info(self.field.key)
+            raise
+        list.__setitem__(self, index, item)
+        return item
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._materialize(i)
+                    for i in six.moves.range(*index.indices(len(self)))]
+        return self._materialize(index)
+
+    def __iter__(self):
+        for index in six.moves.range(len(self)):
+            yield self._materialize(index)
+
+    def __reversed__(self):
+        for index in six.moves.range(len(self) - 1, -1, -1):
+            yield self._materialize(index)
+
+    def pop(self, index=-1):
+        self._materialize(index)
+        return list.pop(self, index)
+
+    def __contains__(self, value):
+        return any(item == value for item in self)
+
+    def index(self, value, *args):
+        return list(self).index(value, *args)
+
+    def count(self, value):
+        return list(self).count(value)
+
+    def copy(self):
+        return LazyList(self.field, self)
+
+    __copy__ = copy
+
+    def __add__(self, other):
+        result = self.copy()
+        result.extend(other)
+        return result
+
+    def __radd__(self, other):
+        # Called before list.__add__(), which would copy raw items
+        return LazyList(self.field, list(other) + list(list.__iter__(self)),
+                        self.unknown_keys)
+
+    def __mul__(self, count):
+        return LazyList(self.field, list.__mul__(self, count),
+                        self.unknown_keys)
+
+    __rmul__ = __mul__
+
+    def materialize(self):
+        for index in six.moves.range(len(self)):
+            self._materialize(index)
+        return self
+
+
+class _LazyObject(dict):
+    """Raw JSON of lazy `TypedObjectField` keeping unknown keys policy given
+    to the ``fromjson()`` call for the time it is instantiated
+    """
+    __slots__ = ('unknown_keys',)
+
+
+def _lazy_object(value):
+    if _decoding.unknown_keys is None:
+        return value
+    value = _LazyObject(value)
+    value.unknown_keys = _decoding.unknown_keys
+    return value
+
+
+class _Variants(object):
+    """Nested type of a typed field with ``discriminator``, values are
+    decoded with the type their discriminator key maps to.
+    """
+
+    def __init__(self, types, discriminator):
+        self.types = dict(types)
+        self.discriminator = discriminator
+
+    def __repr__(self):
+        return '<Variants {} {!r}>'.format(self.discriminator, self.types)
+
+    @cached_property
+    def _table(self):
+        # String type references are resolved on first use
+        table = {}
+        for tag, type in six.iteritems(self.types):
+            if isinstance(type, six.string_types):
+                type = JSONMetaObject.resolve_type(type)
+            # Otherwise the tag is dropped by jsonize() or rejected as an
+            # unknown key
+            if self.discriminator not in getattr(type, '_declared_keys', ()):
+                raise DictyRuntimeError(
+                    'Variant {!r} does not declare discriminator {!r}'
+                    .format(tag, self.discriminator))
+            table[tag] = type
+        return table
+
+    @cached_property
+    def _fields(self):
+        """Fields of all variants for key paths, first declared wins"""
+        fields = {}
+        for type in reversed(list(six.itervalues(self._table))):
+            fields.update(type._fields)
+        return fields
+
+    def fromjson(self, value):
+        if not isinstance(value, _DECODED_TYPES):
+            raise FieldError('must be dictionary')
+        try:
+            type = self._table[value[self.discriminator]]
+        except (KeyError, TypeError):
+            if self.discriminator not in value:
+                raise FieldError('Is required', self.discriminator)
+            raise FieldError(
+                'Unknown variant {!r}'.format(value[self.discriminator]),
+                self.discriminator)
+        return type.fromjson(value)
+
+    def jsonize(self, obj):
+        return obj.jsonize()
+
 
 class BaseTypedField(Field):
+    lazy = False
+    discriminator = None
+
     def __init__(self, type, *args, **kwargs):
+        discriminator = kwargs.pop('discriminator', None)
+        if discriminator is not None:
+            # Objects of several types told apart by the discriminator key
+            self.discriminator = discriminator
+            type = _Variants(type, discriminator)
+        elif isinstance(type, dict):
+            raise DictyRuntimeError(
+                'Mapping of types requires discriminator')
         if isinstance(type, six.string_types):
             self.type_reference = type
         else:
@@ -300,10 +2647,80 @@ class BaseTypedField(Field):
         self.is_json_object = hasattr(type, 'fromjson')
         super(BaseTypedField, self).__init__(*args, **kwargs)
 
+    def _init_lazy(self, lazy):
+        if lazy and not (hasattr(self, 'type_reference') or
+                         isinstance(self.type, JSONMetaObject)):
+            raise DictyRuntimeError(
+                'Lazy field {!r} requires DictObject type'.format(self.type))
+        self.lazy = lazy
+
     @cached_property
     def type(self):
         return JSONMetaObject.resolve_type(self.type_reference)
 
+    def _path_class(self):
+        try:
+            return self.__dict__['_child_path_class']
+        except KeyError:
+            pass
+        try:
+            fields = getattr(self.type, '_fields', {})
+        except DictyRuntimeError:
+            # Type reference isn't resolvable yet, e.g. the root path of a
+            # field referring to a class declared later
+            return self.path_class
+        cls = _path_class_with_children(self.path_class, fields)
+        self.__dict__['_child_path_class'] = cls
+        return cls
+
+    def _can_collect(self, owner):
+        """Check that nested objects can be decoded by ``_collect_value()``
+        of ``owner`` instead of the field validator.
+        """
+        fromjson = getattr(self.type, 'fromjson', None)
+        return (not self.lazy and self.is_json_object and
+                self._is_plain(owner) and
+                _inherits(self, 'instantiate', BaseTypedField) and
+                _inherits(self, 'compile_validator', Field) and
+                getattr(fromjson, '__func__', None) in (
+                    DictObject.fromjson.__func__,
+                    CompactObject.fromjson.__func__))
+
+    @cached_property
+    def _plain_view(self):
+        """Check that nested objects can be wrapped into views, overridden
+        ``validate()`` needs the whole decoded object instead.
+        """
+        return (self._plain_collect and
+                self.type.validate in (_ObjectBase.validate,
+                                       DictObject.validate))
+
+    def compile_collector(self, validator):
+        if not self._plain_collect:
+            return super(BaseTypedField, self).compile_collector(validator)
+        key = self.key
+        optional = self.optional
+        collect_value = self._collect_value
+
+        def collector(obj, errors, path):
+            if key not in obj:
+                if not optional:
+                    errors.append((path + (key,), 'Is required'))
+                return
+            count = len(errors)
+            value = collect_value(obj[key], errors, path + (key,))
+            if len(errors) == count:
+                obj._setitem(key, value)
+        return collector
+
+    def _collect_item(self, item, errors, path):
+        if isinstance(item, _DECODED_TYPES):
+            return self.type._try_fromjson(item, errors, path)
+        try:
+            return self.instantiate(item)
+        except FieldError as exc:
+            errors.append((path + exc.steps, exc.args[0]))
+
     def instantiate(self, value):
         if self.is_json_object:
             return self.type.fromjson(value)
@@ -314,44 +2731,274 @@ class BaseTypedField(Field):
 
 
 class TypedObjectField(BaseTypedField):
+    def __init__(self, type, *args, **kwargs):
+        lazy = kwargs.pop('lazy', False)
+        super(TypedObjectField, self).__init__(type, *args, **kwargs)
+        self._init_lazy(lazy)
+
+    def __get__(self, obj, type=None):
+        value = super(TypedObjectField, self).__get__(obj, type)
+        if (self.lazy and isinstance(value, dict) and
+                not isinstance(value, self.type)):
+            try:
+                value = _with_unknown_keys(
+                    getattr(value, 'unknown_keys', None), self.instantiate,
+                    value)
+            except FieldError as exc:
+                exc.add_path_info(self.key)
+                raise
+            obj._setitem(self.key, value)
+        return value
+
     def getdefault(self, obj):
+        if self.discriminator is not None:
+            # No variant to create by default
+            return super(TypedObjectField, self).getdefault(obj)
         value = self.type()
         obj[self.key] = value
         return value
 
+    def view_default(self, view):
+        if self.discriminator is not None:
+            return super(TypedObjectField, self).getdefault(view)
+        return self.type()
+
     def fromjson(self, value):
-        if not isinstance(value, dict):
+        if not isinstance(value, _DECODED_TYPES):
             raise FieldError('must be dictionary')
+        if self.lazy:
+            return _lazy_object(value)
         return self.instantiate(value)
 
+    def iter_nested(self, obj):
+        # Not obj.get(), fields may be named "get"
+        value = obj[self.key] if self.key in obj else None
+        if isinstance(value, _ObjectBase):
+            yield None, value
+
+    @cached_property
+    def _plain_collect(self):
+        return self._can_collect(TypedObjectField)
+
+    def _collect_value(self, value, errors, path):
+        if not isinstance(value, _DECODED_TYPES):
+            errors.append((path, 'must be dictionary'))
+            return
+        return self._collect_item(value, errors, path)
+
+    def compile_projection(self, projection):
+        if not self._plain_collect:
+            return None
+        return projection.load
+
+    def compile_viewer(self):
+        if not self._plain_view:
+            return None
+        # View type is looked up on use, as types may refer to each other
+        type = self.type
+
+        def viewer(value, path, steps):
+            if not isinstance(value, dict):
+                raise FieldError('must be dictionary')
+            return type._view_type()(value, path, steps)
+        return viewer
+
+    def materialize(self, obj):
+        if self.key not in obj:
+            return
+        value = self.__get__(obj)
+        if isinstance(value, _ObjectBase):
+            try:
+                value.materialize()
+            except FieldError as exc:
+                exc.add_path_info(self.key)
+                raise
+
+    def compile_fromjson(self):
+        if not (_inherits(self, 'fromjson', TypedObjectField) and
+                _inherits(self, 'instantiate', BaseTypedField)):
+            return super(TypedObjectField, self).compile_fromjson()
+        field = self
+
+        def fromjson(value):
+            if not isinstance(value, _DECODED_TYPES):
+                raise FieldError('must be dictionary')
+            if field.lazy:
+                return _lazy_object(value)
+            if field.is_json_object:
+                return field.type.fromjson(value)
+            return field.instantiate(value)
+        return fromjson
+
     def jsonize(self, obj):
-        return obj[self.key].jsonize()
+        value = obj[self.key]
+        if self.lazy and not isinstance(value, self.type):
+            return value
+        return value.jsonize()
+
+    def iterdump(self, obj, dumper, level):
+        value = obj[self.key]
+        if not (_inherits(self, 'jsonize', TypedObjectField) and
+                isinstance(value, _ObjectBase)):
+            return super(TypedObjectField, self).iterdump(obj, dumper, level)
+        return value._iterdump(dumper, level)
+
+    def compile_jsonizer(self):
+        if not _inherits(self, 'jsonize', TypedObjectField):
+            return super(TypedObjectField, self).compile_jsonizer()
+        if self.lazy:
+            return self.jsonize
+        key = self.key
+
+        def jsonize(obj):
+            return obj[key].jsonize()
+        return jsonize
 
 
 class TypedListField(BaseTypedField):
     path_class = DictyItemPath
 
+    def __init__(self, type, *args, **kwargs):
+        lazy = kwargs.pop('lazy', False)
+        super(TypedListField, self).__init__(type, *args, **kwargs)
+        self._init_lazy(lazy)
+
     def fromjson(self, value):
         if not isinstance(value, list):
             raise FieldError('must be list')
+        if self.lazy:
+            return LazyList(self, value, _decoding.unknown_keys)
         retval = []
         for no, item in enumerate(value):
             try:
                 retval.append(self.instantiate(item))
             except FieldError as exc:
-                exc.add_path_info('[{}]'.format(no))
+                exc.add_index(no)
                 raise
         return retval
 
+    def compile_fromjson(self):
+        if not (_inherits(self, 'fromjson', TypedListField) and
+                _inherits(self, 'instantiate', BaseTypedField)):
+            return super(TypedListField, self).compile_fromjson()
+        field = self
+
+        def fromjson(value):
+            if not isinstance(value, list):
+                raise FieldError('must be list')
+            if field.lazy:
+                return LazyList(field, value, _decoding.unknown_keys)
+            if field.is_json_object:
+                instantiate = field.type.fromjson
+            else:
+                instantiate = field.instantiate
+            retval = []
+            append = retval.append
+            no = 0
+            try:
+                for no, item in enumerate(value):
+                    append(instantiate(item))
+            except FieldError as exc:
+                exc.add_index(no)
+                raise
+            return retval
+        return fromjson
+
     def getdefault(self, obj):
         value = []
         obj[self.key] = value
         return value
 
+    def view_default(self, view):
+        return []
+
+    def iter_nested(self, obj):
+        items = obj[self.key] if self.key in obj else None
+        if isinstance(items, list):
+            for no, item in enumerate(list.__iter__(items)):
+                if isinstance(item, _ObjectBase):
+                    yield no, item
+
+    @cached_property
+    def _plain_collect(self):
+        return self._can_collect(TypedListField)
+
+    def _collect_value(self, value, errors, path):
+        if not isinstance(value, list):
+            errors.append((path, 'must be list'))
+            return
+        return [self._collect_item(item, errors, path + (no,))
+                for no, item in enumerate(value)]
+
+    def compile_projection(self, projection):
+        if not self._plain_collect:
+            return None
+        load = projection.load
+
+        def fromjson(value):
+            if not isinstance(value, list):
+                raise FieldError('must be list')
+            retval = []
+            for no, item in enumerate(value):
+                try:
+                    retval.append(load(item))
+                except FieldError as exc:
+                    exc.add_index(no)
+                    raise
+            return retval
+        return fromjson
+
+    def compile_viewer(self):
+        if not self._plain_view:
+            return None
+        type = self.type
+
+        def viewer(value, path, steps):
+            if not isinstance(value, list):
+                raise FieldError('must be list')
+            return _ViewSequence(value, type._view_type(), path, steps)
+        return viewer
+
+    def materialize(self, obj):
+        if self.key not in obj:
+            return
+        items = obj[self.key]
+        if isinstance(items, LazyList):
+            items.materialize()
+        for no, item in enumerate(items):
+            if isinstance(item, _ObjectBase):
+                try:
+                    item.materialize()
+                except FieldError as exc:
+                    exc.add_index(no)
+                    exc.add_path_info(self.key)
+                    raise
+
     def jsonize(self, obj):
-        if self.key is None:
-            return [i.jsonize() for i in obj]
-        return [i.jsonize() for i in obj[self.key]]
+        items = obj if self.key is None else obj[self.key]
+        if self.lazy:
+            # Pass raw items through as is
+            type = self.type
+            return [i.jsonize() if isinstance(i, type) else i
+                    for i in list.__iter__(items)]
+        return [i.jsonize() for i in items]
+
+    def iterdump(self, obj, dumper, level):
+        if self.lazy or not (_inherits(self, 'jsonize', TypedListField) and
+                             self.is_json_object):
+            return super(TypedListField, self).iterdump(obj, dumper, level)
+        return dumper.iterobjects(obj[self.key], level)
+
+    def compile_jsonizer(self):
+        if not _inherits(self, 'jsonize', TypedListField):
+            return super(TypedListField, self).compile_jsonizer()
+        if self.lazy:
+            return self.jsonize
+        key = self.key
+
+        def jsonize(obj):
+            return [i.jsonize() for i in obj[key]]
+        return jsonize
 
 
 class TypedDictField(BaseTypedField):
@@ -365,21 +3012,128 @@ class TypedDictField(BaseTypedField):
             try:
                 retval[key] = self.instantiate(item)
             except FieldError as exc:
-                exc.add_path_info('[{!r}]'.format(key))
+                exc.add_key(key)
                 raise
         return retval
 
+    def compile_fromjson(self):
+        if not (_inherits(self, 'fromjson', TypedDictField) and
+                _inherits(self, 'instantiate', BaseTypedField)):
+            return super(TypedDictField, self).compile_fromjson()
+        field = self
+
+        def fromjson(value):
+            if not isinstance(value, dict):
+                raise FieldError('must be dict')
+            if field.is_json_object:
+                instantiate = field.type.fromjson
+            else:
+                instantiate = field.instantiate
+            retval = {}
+            key = None
+            try:
+                for key, item in six.iteritems(value):
+                    retval[key] = instantiate(item)
+            except FieldError as exc:
+                exc.add_key(key)
+                raise
+            return retval
+        return fromjson
+
     def getdefault(self, obj):
         value = {}
         obj[self.key] = value
         return value
 
+    def view_default(self, view):
+        return {}
+
+    def iter_nested(self, obj):
+        items = obj[self.key] if self.key in obj else None
+        if isinstance(items, dict):
+            for key, item in six.iteritems(items):
+                if isinstance(item, _ObjectBase):
+                    yield key, item
+
+    @cached_property
+    def _plain_collect(self):
+        return self._can_collect(TypedDictField)
+
+    def _collect_value(self, value, errors, path):
+        if not isinstance(value, dict):
+            errors.append((path, 'must be dict'))
+            return
+        return dict((key, self._collect_item(item, errors, path + (key,)))
+                    for key, item in six.iteritems(value))
+
+    def compile_projection(self, projection):
+        if not self._plain_collect:
+            return None
+        load = projection.load
+
+        def fromjson(value):
+            if not isinstance(value, dict):
+                raise FieldError('must be dict')
+            retval = {}
+            for key, item in six.iteritems(value):
+                try:
+                    retval[key] = load(item)
+                except FieldError as exc:
+                    exc.add_key(key)
+                    raise
+            return retval
+        return fromjson
+
+    def compile_viewer(self):
+        if not self._plain_view:
+            return None
+        type = self.type
+
+        def viewer(value, path, steps):
+            if not isinstance(value, dict):
+                raise FieldError('must be dict')
+            return _ViewMapping(value, type._view_type(), path, steps)
+        return viewer
+
+    def materialize(self, obj):
+        if self.key not in obj:
+            return
+        for key, item in six.iteritems(obj[self.key]):
+            if isinstance(item, _ObjectBase):
+                try:
+                    item.materialize()
+                except FieldError as exc:
+                    exc.add_key(key)
+                    exc.add_path_info(self.key)
+                    raise
+
     def jsonize(self, obj):
         return {key: self.type.jsonize(value)
                 for key, value in six.iteritems(obj[self.key])}
 
+    def iterdump(self, obj, dumper, level):
+        if not (_inherits(self, 'jsonize', TypedDictField) and
+                self.is_json_object):
+            return super(TypedDictField, self).iterdump(obj, dumper, level)
+        return dumper.iterdict(
+            [(key, functools.partial(value._iterdump, dumper))
+             for key, value in six.iteritems(obj[self.key])], level)
+
+    def compile_jsonizer(self):
+        if not _inherits(self, 'jsonize', TypedDictField):
+            return super(TypedDictField, self).compile_jsonizer()
+        field = self
+        key = self.key
+
+        def jsonize(obj):
+            item_jsonize = field.type.jsonize
+            return {k: item_jsonize(v) for k, v in six.iteritems(obj[key])}
+        return jsonize
+
 
 class BasicTypeField(Field):
+    column_kinds = ''  # NumPy dtype kinds always passing the type check
+
     def __init__(self, types, *args, **kwargs):
         self.types = types if type(types) in (tuple, list) else (types,)
         super(BasicTypeField, self).__init__(*args, **kwargs)
@@ -396,24 +3150,117 @@ class BasicTypeField(Field):
             )
         return value
 
+    def compile_fromjson(self):
+        if not _inherits(self, 'fromjson', BasicTypeField):
+            return super(BasicTypeField, self).compile_fromjson()
+        return self._build_type_check()
+
+    def _build_type_check(self):
+        types = self.types
+        optional = self.optional
+
+        def fromjson(value):
+            if value is None and optional:
+                return None
+            if not isinstance(value, types):
+                raise FieldError(
+                    'Must be of {} type got {} instead'.format(
+                        types, type(value)))
+            return value
+        return fromjson
+
+    def column_fromjson(self, array, numpy):
+        if not self._is_plain(BasicTypeField):
+            return None
+        return self._column_type_check(array, numpy)
+
+    def compile_collector(self, validator):
+        if not (self._is_plain(BasicTypeField) and
+                _inherits(self, 'compile_validator', BasicTypeField)):
+            return super(BasicTypeField, self).compile_collector(validator)
+        # Same checks as the validator, without raising exceptions
+        key = self.key
+        types = self.types
+        optional = self.optional
+
+        def collector(obj, errors, path):
+            if key not in obj:
+                if not optional:
+                    errors.append((path + (key,), 'Is required'))
+                return
+            value = obj[key]
+            if not isinstance(value, types):
+                if value is None and optional:
+                    return
+                errors.append((path + (key,),
+                               'Must be of {} type got {} instead'.format(
+                                   types, type(value))))
+        return collector
+
+    def _column_type_check(self, array, numpy):
+        if array.dtype.kind not in self.column_kinds:
+            return None
+        return array.tolist()
+
+    def compile_validator(self):
+        if not (_inherits(self, 'fromjson', BasicTypeField) and
+                _inherits(self, 'validate', Field) and
+                _inherits(self, 'run_filters', Field)):
+            return super(BasicTypeField, self).compile_validator()
+        if self.filters:
+            return self._build_validator(shadow=False)
+        # Type check is the only thing to do, value is left as is
+        field = self
+        key = self.key
+        types = self.types
+        optional = self.optional
+
+        def validator(obj, hooked=False):
+            hook = _validation_hook
+            if hook is not None and not hooked:
+                return hook(field, None, validator, obj, True)
+            if key not in obj:
+                if not optional:
+                    raise FieldError('Is required', key)
+                return
+            value = obj[key]
+            if not isinstance(value, types):
+                if value is None and optional:
+                    return
+                raise FieldError(
+                    'Must be of {} type got {} instead'.format(
+                        types, type(value)), key)
+        return validator
+
 
 class IntegerField(BasicTypeField):
+    numpy_dtype = 'int64'
+    column_kinds = 'iub'
+
     def __init__(self, *args, **kwargs):
         super(IntegerField, self).__init__(six.integer_types, *args, **kwargs)
 
 
 class NumericField(BasicTypeField):
+    numpy_dtype = 'float64'
+    column_kinds = 'iubf'
+
     def __init__(self, *args, **kwargs):
         super(NumericField, self).__init__(
             six.integer_types + (float,), *args, **kwargs)
 
 
 class FloatField(BasicTypeField):
+    numpy_dtype = 'float64'
+    column_kinds = 'f'
+
     def __init__(self, *args, **kwargs):
         super(FloatField, self).__init__((float,), *args, **kwargs)
 
 
 class StringField(BasicTypeField):
+    column_kinds = 'US'
+
     def __init__(self, *args, **kwargs):
         super(StringField, self).__init__(
             (six.text_type, six.binary_type), *args, **kwargs)
@@ -437,14 +3284,51 @@ class RegexpStringField(StringField):
                 raise FieldError('Does not match regular expression')
         return value
 
+    def compile_fromjson(self):
+        if not _inherits(self, 'fromjson', RegexpStringField):
+            return super(RegexpStringField, self).compile_fromjson()
+        check_type = self._build_type_check()
+        if self.regexp is None:
+            return check_type
+        match = self.regexp.match
+
+        def fromjson(value):
+            value = check_type(value)
+            if not match(value):
+                raise FieldError('Does not match regular expression')
+            return value
+        return fromjson
+
+    def column_fromjson(self, array, numpy):
+        if not self._is_plain(RegexpStringField):
+            return None
+        values = self._column_type_check(array, numpy)
+        if values is None or self.regexp is None:
+            return values
+        # NumPy has no vectorized regexp matching, map() at least avoids
+        # per-row validator calls
+        if not all(map(self.regexp.match, values)):
+            return None
+        return values
+
 
 class NativeDatetimeField(BasicTypeField):
+    numpy_dtype = 'datetime64[us]'
+
     def __init__(self, *args, **kwargs):
         super(NativeDatetimeField, self).__init__(
             (datetime.datetime,), *args, **kwargs)
 
+    def column_fromjson(self, array, numpy):
+        if (array.dtype.kind != 'M' or numpy.isnat(array).any() or
+                not self._is_plain(BasicTypeField)):
+            return None
+        return array.astype('datetime64[us]').tolist()
+
 
 class NativeDateField(BasicTypeField):
+    numpy_dtype = 'datetime64[D]'
+
     def __init__(self, *args, **kwargs):
         super(NativeDateField, self).__init__((datetime.date,), *args, **kwargs)
 
@@ -466,5 +3350,458 @@ class DictField(BasicTypeField):
 
 
 class BooleanField(BasicTypeField):
+    numpy_dtype = 'bool'
+    column_kinds = 'b'
+
     def __init__(self, *args, **kwargs):
         super(BooleanField, self).__init__((bool,), *args, **kwargs)
+
+
+class Collection(object):
+    """Container of objects of ``type`` indexed by key paths
+
+    ``index`` paths get hash indexes for equality lookups with `find()`,
+    ``sorted_index`` paths get sorted indexes usable by `find()` and
+    `range()`. Objects missing the value are indexed by ``None`` in hash
+    indexes and left out of sorted ones. Indexes are updated on `add()` and
+    `remove()`, after an indexed value of a contained object is modified
+    call `reindex()`.
+    """
+
+    def __init__(self, type, index=(), sorted_index=(), objects=()):
+        self.type = type
+        self._objects = {}
+        # Keys the object is indexed by, with a sequence number keeping
+        # sorted index entries unique
+        self._entries = {}
+        self._seq = 0
+        self._hash = [(functools.partial(path_get, path), {})
+                      for path in index]
+        self._sorted = [(functools.partial(path_get, path), [], [])
+                        for path in sorted_index]
+        self._hash_paths = dict(zip(map(six.text_type, index), self._hash))
+        self._sorted_paths = dict(
+            zip(map(six.text_type, sorted_index), self._sorted))
+        self.extend(objects)
+
+    def __len__(self):
+        return len(self._objects)
+
+    def __iter__(self):
+        return iter(list(self._objects.values()))
+
+    def __contains__(self, obj):
+        return id(obj) in self._objects
+
+    def add(self, obj):
+        if id(obj) in self._objects:
+            return
+        self._index(obj)
+        self._objects[id(obj)] = obj
+
+    def extend(self, objects):
+        """Add ``objects``, none of them is added if any of their indexed
+        values can't be hashed or compared
+        """
+        # Inserting into sorted lists one by one moves their tails every
+        # time, append entries and sort once instead
+        sizes = [len(keys) for _, keys, _ in self._sorted]
+        added = []
+        try:
+            for obj in objects:
+                if id(obj) not in self._objects:
+                    self._index(obj, append=True)
+                    self._objects[id(obj)] = obj
+                    added.append(obj)
+            entries = [sorted(zip(keys, index_objects),
+                              key=operator.itemgetter(0))
+                       for _, keys, index_objects in self._sorted]
+        except Exception:
+            # Appended entries are at the tails of sorted indexes
+            for (_, keys, index_objects), size in zip(self._sorted, sizes):
+                del keys[size:]
+                del index_objects[size:]
+            for obj in added:
+                del self._objects[id(obj)]
+                self._unhash(obj, self._entries.pop(id(obj))[0])
+            raise
+        for (_, keys, index_objects), index_entries in zip(self._sorted,
+                                                           entries):
+            keys[:] = [key for key, _ in index_entries]
+            index_objects[:] = [obj for _, obj in index_entries]
+
+    def remove(self, obj):
+        """Remove object, raise `KeyError` if it's not in the collection"""
+        del self._objects[id(obj)]
+        self._unindex(obj)
+
+    def discard(self, obj):
+        if id(obj) in self._objects:
+            self.remove(obj)
+
+    def reindex(self, obj=None):
+        """Update indexes of modified ``obj``, or of all objects"""
+        if obj is None:
+            for obj in list(self._objects.values()):
+                self.reindex(obj)
+            return
+        if id(obj) not in self._objects:
+            raise KeyError(obj)
+        hash_keys, sorted_keys = self._entries[id(obj)]
+        self._unindex(obj)
+        try:
+            self._index(obj)
+        except Exception:
+            # Index the object by its previous values again
+            self._entries[id(obj)] = (hash_keys, sorted_keys)
+            for (_, buckets), key in zip(self._hash, hash_keys):
+                buckets.setdefault(key, {})[id(obj)] = obj
+            for (_, keys, objects), key in zip(self._sorted, sorted_keys):
+                if key is not None:
+                    pos = bisect.bisect_left(keys, key)
+                    keys.insert(pos, key)
+                    objects.insert(pos, obj)
+            raise
+
+    def find(self, path, value):
+        """Return list of objects having ``value`` at ``path``"""
+        path = six.text_type(path)
+        if path in self._hash_paths:
+            buckets = self._hash_paths[path][1]
+            return list(buckets.get(value, {}).values())
+        _, keys, objects = self._sorted_index(path)
+        return objects[bisect.bisect_left(keys, (value,)):
+                       bisect.bisect_left(keys, (value, _LAST_SEQ))]
+
+    def range(self, path, start=None, stop=None):
+        """Return objects with value at ``path`` from ``start`` up to, but not
+        including, ``stop`` ordered by the value. ``None`` means no limit.
+        """
+        _, keys, objects = self._sorted_index(six.text_type(path))
+        lo = 0 if start is None else bisect.bisect_left(keys, (start,))
+        hi = len(keys) if stop is None else bisect.bisect_left(keys, (stop,))
+        return objects[lo:hi]
+
+    def _sorted_index(self, path):
+        try:
+            return self._sorted_paths[path]
+        except KeyError:
+            raise DictyRuntimeError('No sorted index of {!r}'.format(path))
+
+    def _index(self, obj, append=False):
+        seq = self._seq
+        self._seq += 1
+        hash_keys = []
+        sorted_keys = []
+        self._entries[id(obj)] = (hash_keys, sorted_keys)
+        try:
+            for get, buckets in self._hash:
+                key = get(obj)
+                buckets.setdefault(key, {})[id(obj)] = obj
+                hash_keys.append(key)
+            for get, keys, objects in self._sorted:
+                key = get(obj)
+                if key is not None:
+                    key = (key, seq)
+                    pos = (len(keys) if append
+                           else bisect.bisect_left(keys, key))
+                    keys.insert(pos, key)
+                    objects.insert(pos, obj)
+                sorted_keys.append(key)
+        except Exception:
+            # Unhashable or incomparable value, drop entries added so far
+            self._unindex(obj)
+            raise
+
+    def _unhash(self, obj, hash_keys):
+        for (_, buckets), key in zip(self._hash, hash_keys):
+            bucket = buckets[key]
+            del bucket[id(obj)]
+            if not bucket:
+                del buckets[key]
+
+    def _unindex(self, obj):
+        hash_keys, sorted_keys = self._entries.pop(id(obj))
+        self._unhash(obj, hash_keys)
+        for (_, keys, objects), key in zip(self._sorted, sorted_keys):
+            if key is not None:
+                pos = bisect.bisect_left(keys, key)
+                del keys[pos]
+                del objects[pos]
+
+
+# Greater than any sequence number of `Collection` sorted index entries
+_LAST_SEQ = float('inf')
+
+
+class NDJSONStore(object):
+    """Random access to objects of ``type`` kept in a newline-delimited JSON
+    file
+
+    File is memory-mapped and only the requested record is decoded. Record
+    offsets, and with ``key`` path the position of the first record with
+    every value at the path, are collected by a single pass over the file
+    and saved to ``index_filename`` (``filename + '.idx'`` by default). The
+    saved index is used as long as the size and modification time of the
+    file don't change, the store works without it if it can't be written.
+    Records with a value at ``key`` that can't be a dict key, like a list,
+    or that aren't valid JSON are left out of the key index. Invalid JSON
+    raises `ValueError` naming the record index when the record is decoded,
+    with or without ``key``.
+    """
+    index_version = 2
+    # 'q' is not available on Python 2, doubles hold offsets up to 2 ** 53
+    offset_typecode = 'q' if six.PY3 else 'd'
+
+    def __init__(self, type, filename, key=None, index_filename=None,
+                 persist=True):
+        self.type = type
+        self.filename = filename
+        self.key = key
+        self.index_filename = index_filename or filename + '.idx'
+        self._file = open(filename, 'rb')
+        try:
+            stat = os.fstat(self._file.fileno())
+            if stat.st_size:
+                self._data = mmap.mmap(self._file.fileno(), 0,
+                                       access=mmap.ACCESS_READ)
+            else:
+                # Empty file can't be mapped
+                self._data = b''
+            signature = {
+                'version': self.index_version,
+                'size': stat.st_size,
+                'mtime': stat.st_mtime,
+                'key': None if key is None else six.text_type(key),
+                'byteorder': sys.byteorder,
+                'typecode': self.offset_typecode,
+            }
+            index = self._load_index(signature)
+            if index is None:
+                index = self._build_index()
+                if persist:
+                    self._save_index(signature, index)
+        except Exception:
+            self.close()
+            raise
+        self._starts, self._ends, self._keys = index
+
+    def _load_index(self, signature):
+        """Read index saved as a JSON header line followed by offsets"""
+        try:
+            with open(self.index_filename, 'rb') as fp:
+                header = json.loads(fp.readline().decode('utf-8'))
+                count = header.pop('count')
+                keys = header.pop('keys')
+                if header != signature:
+                    return None
+                starts = array.array(self.offset_typecode)
+                starts.fromfile(fp, count)
+                ends = array.array(self.offset_typecode)
+                ends.fromfile(fp, count)
+        except (EnvironmentError, EOFError, ValueError, KeyError,
+                TypeError, AttributeError):
+            # Missing, truncated or foreign index is built again
+            return None
+        if keys is not None:
+            keys = dict((value, index) for value, index in keys)
+        return starts, ends, keys
+
+    def _save_index(self, signature, index):
+        starts, ends, keys = index
+        header = dict(signature, count=len(starts), keys=None if keys is None
+                      else list(six.iteritems(keys)))
+        try:
+            with open(self.index_filename, 'wb') as fp:
+                fp.write(json.dumps(header).encode('utf-8') + b'\n')
+                starts.tofile(fp)
+                ends.tofile(fp)
+        except EnvironmentError:
+            # Read-only directory or full disk, index is built every time
+            pass
+
+    def _build_index(self):
+        data = self._data
+        size = len(data)
+        starts = array.array(self.offset_typecode)
+        ends = array.array(self.offset_typecode)
+        keys = None
+        if self.key is not None:
+            # Values are looked up in raw JSON, keys stay as they are
+            getter = _chain_getter([path._step for path in self.key._chain()])
+            keys = {}
+        pos = 0
+        while pos < size:
+            end = data.find(b'\n', pos)
+            if end == -1:
+                end = size
+            line = data[pos:end]
+            if line.strip():
+                if keys is not None:
+                    try:
+                        keys.setdefault(
+                            getter(json.loads(line.decode('utf-8'))),
+                            len(starts))
+                    except (LookupError, TypeError, ValueError):
+                        # Missing or unhashable value or invalid JSON,
+                        # reported when the record is decoded
+                        pass
+                starts.append(pos)
+                ends.append(end)
+            pos = end + 1
+        return starts, ends, keys
+
+    def close(self):
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return len(self._starts)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._decode(i)
+                    for i in six.moves.range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('Record index out of range')
+        return self._decode(index)
+
+    def __iter__(self):
+        for index in six.moves.range(len(self)):
+            yield self._decode(index)
+
+    def get(self, value, default=None):
+        """Decode the first record with ``value`` at the ``key`` path"""
+        if self._keys is None:
+            raise DictyRuntimeError('Store has no key index')
+        index = self._keys.get(value)
+        if index is None:
+            return default
+        return self._decode(index)
+
+    def _decode(self, index):
+        line = self._data[int(self._starts[index]):int(self._ends[index])]
+        try:
+            json_value = json.loads(line.decode('utf-8'))
+        except ValueError as exc:
+            raise ValueError('{}: record {}: {}'.format(
+                self.filename, index, exc))
+        try:
+            return self.type.fromjson(json_value)
+        except FieldError as exc:
+            exc.add_index(index)
+            raise
+
+
+_clock = getattr(time, 'perf_counter', time.time)
+
+
+class _InstrumentationState(threading.local):
+    # Class of the object whose field is being validated, filters are
+    # accounted to it
+    cls = None
+
+
+class Instrumentation(object):
+    """Validation statistics collected by `instrument()`.
+
+    ``stats`` maps ``(class, attname, what)`` to ``[calls, seconds,
+    failures]``, where ``what`` is ``'validate'`` for the whole field
+    validation, including nested objects and filters, or ``'filter NAME'``
+    for a single filter.
+    """
+
+    def __init__(self, callback=None):
+        self.stats = {}
+        self.callback = callback
+        self._lock = threading.Lock()
+        self._state = _InstrumentationState()
+
+    def __call__(self, field, filter, func, *args):
+        """`_validation_hook` timing ``func(*args)``"""
+        state = self._state
+        outer = state.cls
+        if filter is None:
+            cls = type(args[0])
+            if issubclass(cls, ObjectView):
+                cls = cls._type
+            what = 'validate'
+            state.cls = cls
+        else:
+            cls = outer
+            what = 'filter {}'.format(getattr(filter, '__name__', filter))
+        failed = True
+        start = _clock()
+        try:
+            result = func(*args)
+            failed = False
+            return result
+        finally:
+            elapsed = _clock() - start
+            state.cls = outer
+            self._record((cls, field.attname, what), elapsed, failed)
+
+    def _record(self, key, elapsed, failed):
+        with self._lock:
+            stats = self.stats.get(key)
+            if stats is None:
+                stats = self.stats[key] = [0, 0.0, 0]
+            stats[0] += 1
+            stats[1] += elapsed
+            stats[2] += failed
+        if self.callback is not None:
+            self.callback(key[0], key[1], key[2], elapsed)
+
+    def report(self):
+        """Return statistics as text table sorted by time spent"""
+        lines = ['{:40} {:>10} {:>12} {:>12} {:>10}'.format(
+            'field', 'calls', 'total ms', 'per call us', 'failures')]
+        items = sorted(six.iteritems(self.stats),
+                       key=lambda item: item[1][1], reverse=True)
+        for (cls, attname, what), (calls, seconds, failures) in items:
+            if not calls:
+                continue
+            name = '{}.{}'.format(cls.__name__, attname)
+            if what != 'validate':
+                name = '{} {}'.format(name, what)
+            lines.append('{:40} {:10d} {:12.3f} {:12.3f} {:10d}'.format(
+                name, calls, seconds * 1e3, seconds / calls * 1e6, failures))
+        return '\n'.join(lines)
+
+
+_instrument_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def instrument(callback=None):
+    """Collect per field validation statistics within the block.
+
+    Compiled validators report to the `Instrumentation` through
+    `_validation_hook` while the block runs; outside of it they only check
+    the hook is unset. Validation in all threads is accounted.
+    ``callback(cls, attname, what, seconds)`` is called after every timed
+    call::
+
+        with dicty.instrument() as instrumentation:
+            MyDoc.fromjson(data)
+        print(instrumentation.report())
+    """
+    global _validation_hook
+    instrumentation = Instrumentation(callback)
+    with _instrument_lock:
+        if _validation_hook is not None:
+            raise DictyRuntimeError('Instrumentation is already active')
+        _validation_hook = instrumentation
+    try:
+        yield instrumentation
+    finally:
+        _validation_hook = None
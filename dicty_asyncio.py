@@ -0,0 +1,235 @@
+"""asyncio support for dicty objects, requires Python 3.6+
+
+Decoding and encoding are split into chunks with control given back to the
+event loop between them, CPU-heavy chunks can be run in an executor
+instead. Functions are also available as methods of dicty objects, e.g.
+``await Cls.afromjson_stream(reader)``.
+"""
+import asyncio
+import codecs
+import json
+
+import dicty
+
+
+async def _call(executor, func, *args):
+    if executor is None:
+        return func(*args)
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(executor, func, *args)
+
+
+def _fromjson_batch(cls, values, index, unknown_keys):
+    return dicty._with_unknown_keys(unknown_keys, _fromjson_values, cls,
+                                    values, index)
+
+
+def _fromjson_values(cls, values, index):
+    objects = []
+    for value in values:
+        try:
+            objects.append(cls.fromjson(value))
+        except dicty.FieldError as exc:
+            exc.add_index(index)
+            raise
+        index += 1
+    return objects
+
+
+def _instantiate_batch(cls, attname, items, index, unknown_keys):
+    return dicty._with_unknown_keys(unknown_keys, _instantiate_items, cls,
+                                    attname, items, index)
+
+
+def _instantiate_items(cls, attname, items, index):
+    # Field is looked up by name, so process pool executors only need to
+    # pickle the class
+    field = cls._fields[attname]
+    objects = []
+    for item in items:
+        try:
+            objects.append(field.instantiate(item))
+        except dicty.FieldError as exc:
+            exc.add_index(index)
+            exc.add_path_info(field.key)
+            raise
+        index += 1
+    return objects
+
+
+def _chunked_fields(cls, value, batch_size):
+    """Return typed list fields of ``value`` worth decoding in chunks"""
+    # Overridden validate() or fromjson() have to see the whole object
+    if not isinstance(value, dict) or \
+       cls.validate not in (dicty._ObjectBase.validate,
+                            dicty.DictObject.validate) or \
+       cls.fromjson.__func__ not in (dicty.DictObject.fromjson.__func__,
+                                     dicty.CompactObject.fromjson.__func__):
+        return []
+    return [field for field in cls._fields.values()
+            if isinstance(field, dicty.TypedListField) and
+            field._plain_collect and
+            isinstance(value.get(field.key), list) and
+            len(value[field.key]) > batch_size]
+
+
+def _fromjson(cls, value, unknown_keys):
+    return dicty._with_unknown_keys(unknown_keys, cls.fromjson, value)
+
+
+def _failed_field(cls, value, unknown_keys):
+    """Return index of the field failing first when ``value`` is decoded"""
+    return dicty._with_unknown_keys(unknown_keys, _failed_validator, cls,
+                                    value)
+
+
+def _failed_validator(cls, value):
+    try:
+        obj = cls._load(value)
+    except dicty.FieldError:
+        # Rejected unknown key, raised before any field is checked
+        return -1
+    for index, validator in enumerate(cls._validators):
+        try:
+            validator(obj)
+        except dicty.FieldError:
+            return index
+    return len(cls._validators)
+
+
+async def _decode_items(cls, field, items, batch_size, executor,
+                        unknown_keys):
+    decoded = []
+    for start in range(0, len(items), batch_size):
+        decoded.extend(await _call(
+            executor, _instantiate_batch, cls, field.attname,
+            items[start:start + batch_size], start, unknown_keys))
+        await asyncio.sleep(0)
+    return decoded
+
+
+async def afromjson(cls, value, batch_size=100, executor=None,
+                    unknown_keys=None):
+    """Decode object the same way as ``cls.fromjson(value)`` does.
+
+    Items of top-level `TypedListField` values longer than ``batch_size``
+    are decoded ``batch_size`` at a time giving control back to the event
+    loop between batches, or in ``executor`` if given. ``unknown_keys`` is
+    handled as by ``fromjson()``.
+    """
+    # Executors don't see the policy of this thread, it is passed to them
+    unknown_keys = unknown_keys or dicty._decoding.unknown_keys
+    fields = _chunked_fields(cls, value, batch_size)
+    if not fields:
+        return await _call(executor, _fromjson, cls, value, unknown_keys)
+    # The rest is decoded first with lists left empty, decoded items are put
+    # in place afterwards
+    rest = dict(value)
+    rest.update((field.key, []) for field in fields)
+    try:
+        obj = await _call(executor, _fromjson, cls, rest, unknown_keys)
+    except dicty.FieldError as exc:
+        error = exc
+    else:
+        error = None
+    if error is not None:
+        # Lists declared before the failing field are checked first, as
+        # fromjson() does
+        failed = await _call(executor, _failed_field, cls, rest,
+                             unknown_keys)
+        indexes = dict((id(field), index)
+                       for index, field in enumerate(cls._fields.values()))
+        for field in fields:
+            if indexes[id(field)] < failed:
+                await _decode_items(cls, field, value[field.key],
+                                    batch_size, executor, unknown_keys)
+        raise error
+    for field in fields:
+        obj._setitem(field.key, await _decode_items(
+            cls, field, value[field.key], batch_size, executor,
+            unknown_keys))
+    if getattr(cls, 'track_changes', False):
+        known = dicty._with_unknown_keys(unknown_keys, cls._known, value)
+        obj._baseline = dicty._copy_json(dict(known))
+    return obj
+
+
+async def afromjson_stream(cls, reader, batch_size=100, executor=None,
+                           unknown_keys=None):
+    """Read the whole JSON document from ``reader`` and decode it with
+    `afromjson()`.
+    """
+    unknown_keys = unknown_keys or dicty._decoding.unknown_keys
+    data = await reader.read()
+    value = await _call(executor, json.loads, data.decode('utf-8'))
+    return await afromjson(cls, value, batch_size, executor, unknown_keys)
+
+
+async def aiter_fromjson(cls, reader, chunk_size=65536, batch_size=100,
+                         executor=None, unknown_keys=None):
+    """Asynchronously decode objects read from ``reader`` with
+    newline-delimited JSON or a single JSON array.
+
+    Objects are decoded ``batch_size`` at a time, in ``executor`` if given,
+    giving control back to the event loop between batches. Record index is
+    prepended to the path of raised `FieldError`. ``unknown_keys`` is
+    handled as by ``fromjson()``.
+    """
+    unknown_keys = unknown_keys or dicty._decoding.unknown_keys
+    decoder = dicty._JSONStreamDecoder()
+    text_decoder = codecs.getincrementaldecoder('utf-8')()
+    index = 0
+    while True:
+        chunk = await reader.read(chunk_size)
+        final = not chunk
+        values = list(decoder.decode(text_decoder.decode(chunk, final),
+                                     final))
+        for start in range(0, len(values), batch_size):
+            batch = values[start:start + batch_size]
+            for obj in await _call(executor, _fromjson_batch, cls, batch,
+                                   index, unknown_keys):
+                yield obj
+            index += len(batch)
+            await asyncio.sleep(0)
+        if final:
+            break
+
+
+def _take(pieces, size):
+    """Join next pieces of JSON until there are at least ``size`` chars"""
+    buffer = []
+    total = 0
+    for piece in pieces:
+        buffer.append(piece)
+        total += len(piece)
+        if total >= size:
+            break
+    return ''.join(buffer)
+
+
+async def _write(pieces, writer, chunk_size, executor):
+    while True:
+        text = await _call(executor, _take, pieces, chunk_size)
+        if not text:
+            break
+        writer.write(text.encode('utf-8'))
+        await writer.drain()
+        await asyncio.sleep(0)
+
+
+async def adump(obj, writer, chunk_size=65536, executor=None, **options):
+    """Write ``obj`` as JSON to ``writer``, output is the same as of
+    ``json.dumps(obj.jsonize(), **options)`` encoded to UTF-8.
+
+    JSON is encoded ``chunk_size`` chars at a time, in ``executor`` if
+    given, waiting for the writer to drain after each chunk. Encoder state
+    stays in this process, so ``executor`` has to be a thread pool.
+    """
+    await _write(obj.iterdump(**options), writer, chunk_size, executor)
+
+
+async def adump_many(cls, objects, writer, chunk_size=65536, executor=None,
+                     **options):
+    """Write ``objects`` as JSON array to ``writer``, see `adump()`"""
+    await _write(cls.iterdump_many(objects, **options), writer, chunk_size,
+                 executor)
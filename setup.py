@@ -12,8 +12,9 @@ setup(
     description='A library for mapping dictionaries to Python objects',
     long_description=long_description,
     url='https://github.com/vitek/dicty',
-    py_modules=['dicty'],
+    py_modules=['dicty', 'dicty_asyncio'],
     install_requires=['six'],
+    extras_require={'numpy': ['numpy']},
     setup_requires=['pytest-runner'],
     tests_require=['pytest'],
     test_suite='tests',
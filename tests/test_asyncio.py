@@ -0,0 +1,206 @@
+import asyncio
+import concurrent.futures
+import json
+import socket
+
+import pytest
+
+import dicty
+import dicty_asyncio
+
+
+class Item(dicty.DictObject):
+    foo = dicty.IntegerField()
+
+
+class Object(dicty.DictObject):
+    name = dicty.StringField(optional=True)
+    items = dicty.TypedListField(Item, optional=True)
+
+
+class Tracked(Object):
+    track_changes = True
+
+
+async def connect():
+    """Return reader of one end of a socket pair and writer of the other,
+    unused halves are kept open until the writer is closed.
+    """
+    left, right = socket.socketpair()
+    reader, left_writer = await asyncio.open_connection(sock=left)
+    _, writer = await asyncio.open_connection(sock=right)
+    return reader, writer, left_writer
+
+
+async def feed(data, chunk_size=7):
+    reader, writer, other = await connect()
+
+    async def send():
+        for start in range(0, len(data), chunk_size):
+            writer.write(data[start:start + chunk_size])
+            await writer.drain()
+        writer.close()
+        await writer.wait_closed()
+        other.close()
+    return reader, asyncio.ensure_future(send())
+
+
+async def read_all(coro_func):
+    reader, writer, other = await connect()
+    reading = asyncio.ensure_future(reader.read())
+    await coro_func(writer)
+    writer.close()
+    data = await reading
+    other.close()
+    return data.decode('utf-8')
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+@pytest.mark.parametrize('data', [
+    b'{"foo": 1}\n{"foo": 2}\n\n{"foo": 3}',
+    b'[{"foo": 1}, {"foo": 2},\n {"foo": 3}]',
+])
+def test_aiter_fromjson(data):
+    async def main():
+        reader, sending = await feed(data)
+        objects = [obj async for obj in Item.aiter_fromjson(
+            reader, chunk_size=5, batch_size=2)]
+        await sending
+        return objects
+    objects = run(main())
+    assert objects == [{'foo': 1}, {'foo': 2}, {'foo': 3}]
+    assert all(type(obj) is Item for obj in objects)
+
+
+def test_aiter_fromjson_error():
+    async def main():
+        reader, sending = await feed(b'{"foo": 1}\n{"foo": "x"}\n')
+        try:
+            async for _ in Item.aiter_fromjson(reader, batch_size=1):
+                pass
+        finally:
+            await sending
+    with pytest.raises(dicty.FieldError) as exc:
+        run(main())
+    assert exc.value.path == '[1].foo'
+
+
+def test_afromjson_stream():
+    data = {'name': u'ф', 'items': [{'foo': no} for no in range(25)]}
+
+    async def main(cls, **kwargs):
+        reader, sending = await feed(json.dumps(data).encode('utf-8'), 100)
+        obj = await cls.afromjson_stream(reader, batch_size=10, **kwargs)
+        await sending
+        return obj
+
+    obj = run(main(Object))
+    assert obj == data
+    assert isinstance(obj.items[24], Item)
+    assert obj.dirty_keys() == set()
+
+    with concurrent.futures.ThreadPoolExecutor(1) as executor:
+        obj = run(main(Tracked, executor=executor))
+    assert obj == data
+    assert obj.changes() == {}
+
+
+def test_afromjson_errors():
+    async def main():
+        return await dicty_asyncio.afromjson(Object, data, batch_size=2)
+
+    data = {'items': [{'foo': 1}] * 5 + [{'foo': 'x'}]}
+    with pytest.raises(dicty.FieldError) as exc:
+        run(main())
+    assert exc.value.path == 'items[5].foo'
+
+    data = {'name': 1, 'items': [{'foo': 1}] * 5}
+    with pytest.raises(dicty.FieldError) as exc:
+        run(main())
+    assert exc.value.path == 'name'
+
+
+class Reversed(dicty.DictObject):
+    items = dicty.TypedListField(Item, optional=True)
+    name = dicty.StringField(optional=True)
+    extra = dicty.TypedListField(Item, optional=True)
+
+
+@pytest.mark.parametrize('cls', [Object, Reversed])
+@pytest.mark.parametrize('data', [
+    {'name': 1, 'items': [{'foo': 1}] * 4 + [{'foo': 'x'}]},
+    {'name': 1, 'items': [{'foo': 1}] * 5, 'extra': [{'foo': 'x'}] * 5},
+    {'name': 'a', 'items': [{'foo': 1}] * 4 + [{}]},
+])
+def test_afromjson_first_error(cls, data):
+    with pytest.raises(dicty.FieldError) as expected:
+        cls.fromjson(data)
+    with pytest.raises(dicty.FieldError) as exc:
+        run(dicty_asyncio.afromjson(cls, data, batch_size=2))
+    assert str(exc.value) == str(expected.value)
+
+def test_afromjson_yields_to_loop():
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(None)
+            await asyncio.sleep(0)
+
+    async def main():
+        task = asyncio.ensure_future(ticker())
+        await asyncio.sleep(0)
+        count = len(ticks)
+        await dicty_asyncio.afromjson(
+            Object, {'items': [{'foo': 1}] * 100}, batch_size=10)
+        task.cancel()
+        return len(ticks) - count
+
+    assert run(main()) >= 10
+
+
+@pytest.mark.parametrize('options', [{}, {'indent': 2, 'sort_keys': True}])
+def test_adump(options):
+    obj = Object.fromjson({'name': u'ф',
+                           'items': [{'foo': no} for no in range(50)]})
+    text = run(read_all(
+        lambda writer: obj.adump(writer, chunk_size=16, **options)))
+    assert text == json.dumps(obj.jsonize(), **options)
+
+    objects = [obj, Object(name='x')]
+    with concurrent.futures.ThreadPoolExecutor(1) as executor:
+        text = run(read_all(lambda writer: Object.adump_many(
+            objects, writer, executor=executor, **options)))
+    assert text == json.dumps([o.jsonize() for o in objects], **options)
+
+
+def test_afromjson_unknown_keys_in_executor():
+    data = {'name': 'a', 'extra': 1,
+            'items': [{'foo': no, 'blob': no} for no in range(5)]}
+    with concurrent.futures.ThreadPoolExecutor(1) as executor:
+        obj = run(dicty_asyncio.afromjson(
+            Object, data, batch_size=2, executor=executor,
+            unknown_keys='drop'))
+        assert 'extra' not in obj
+        assert [dict(item) for item in obj.items] == \
+            [{'foo': no} for no in range(5)]
+
+        with pytest.raises(dicty.FieldError) as exc:
+            run(dicty_asyncio.afromjson(
+                Object, dict(data, extra=None, name='b'), batch_size=2,
+                executor=executor, unknown_keys='reject'))
+        assert exc.value.path == 'extra'
+
+        async def read():
+            reader, sending = await feed(json.dumps(data['items']).encode())
+            objects = [obj async for obj in Item.aiter_fromjson(
+                reader, batch_size=2, executor=executor,
+                unknown_keys='drop')]
+            await sending
+            return objects
+
+        objects = run(read())
+    assert objects == [{'foo': no} for no in range(5)]
@@ -0,0 +1,109 @@
+import copy
+
+import pytest
+
+import dicty
+
+
+class Item(dicty.DictObject):
+    foo = dicty.IntegerField()
+    bar = dicty.StringField(optional=True)
+
+
+class Object(dicty.DictObject):
+    track_changes = True
+
+    name = dicty.StringField(optional=True)
+    tags = dicty.ListField(optional=True)
+    nested = dicty.TypedObjectField(Item, optional=True)
+    items = dicty.TypedListField(Item, optional=True)
+    mapping = dicty.TypedDictField(Item, optional=True)
+
+
+def apply_changes(doc, changes):
+    doc = copy.deepcopy(doc)
+    for path, value in changes.get('$set', {}).items():
+        parents = path.split('.')
+        key = parents.pop()
+        target = doc
+        for part in parents:
+            target = target[int(part) if isinstance(target, list) else part]
+        if isinstance(target, list):
+            target[int(key)] = value
+        else:
+            target[key] = value
+    for path in changes.get('$unset', []):
+        parents = path.split('.')
+        key = parents.pop()
+        target = doc
+        for part in parents:
+            target = target[int(part) if isinstance(target, list) else part]
+        del target[key]
+    return doc
+
+
+DOC = {
+    'name': 'foo',
+    'tags': ['a', 'b'],
+    'nested': {'foo': 1, 'bar': 'x'},
+    'items': [{'foo': 1}, {'foo': 2, 'bar': 'y'}],
+    'mapping': {'a': {'foo': 3}},
+}
+
+
+def test_no_changes():
+    obj = Object.fromjson(copy.deepcopy(DOC))
+    assert obj.changes() == {}
+
+
+def test_nested_changes():
+    doc = copy.deepcopy(DOC)
+    obj = Object.fromjson(doc)
+    # Changing the source document doesn't affect the baseline
+    doc['name'] = 'changed'
+
+    obj.items[0].bar = 'z'
+    del obj.items[1]['bar']
+    obj.nested.foo = 5
+    obj.mapping['a'].foo = 6
+    del obj['name']
+    assert obj.changes() == {
+        '$set': {'items.0.bar': 'z', 'nested.foo': 5, 'mapping.a.foo': 6},
+        '$unset': ['items.1.bar', 'name'],
+    }
+    assert apply_changes(DOC, obj.changes()) == obj.jsonize()
+
+
+def test_replaced_values():
+    obj = Object.fromjson(copy.deepcopy(DOC))
+    obj.tags.append('c')
+    obj.items = [Item(foo=1)]
+    # Keys with dots can't be used in paths
+    obj.mapping['b.c'] = Item(foo=7)
+    obj.nested = Item(foo=1)
+    changes = obj.changes()
+    assert changes == {'$set': {
+        'tags': ['a', 'b', 'c'],
+        'items': [{'foo': 1}],
+        'mapping': {'a': {'foo': 3}, 'b.c': {'foo': 7}},
+    }, '$unset': ['nested.bar']}
+    assert apply_changes(DOC, changes) == obj.jsonize()
+
+
+def test_commit():
+    obj = Object.fromjson(copy.deepcopy(DOC))
+    obj.name = 'bar'
+    obj.commit()
+    assert obj.changes() == {}
+    assert obj.dirty_keys() == set()
+
+    obj = Object(name='foo')
+    with pytest.raises(dicty.DictyRuntimeError):
+        obj.changes()
+    obj.commit()
+    obj.tags = ['x']
+    assert obj.changes() == {'$set': {'tags': ['x']}}
+
+
+def test_not_tracked():
+    assert Item.fromjson({'foo': 1})._baseline is None
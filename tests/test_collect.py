@@ -0,0 +1,126 @@
+import pytest
+
+import dicty
+
+
+class Item(dicty.DictObject):
+    foo = dicty.IntegerField()
+    name = dicty.StringField(optional=True)
+
+
+class Object(dicty.DictObject):
+    count = dicty.IntegerField()
+    when = dicty.DateField(optional=True)
+    nested = dicty.TypedObjectField(Item, optional=True)
+    items = dicty.TypedListField(Item, optional=True)
+    mapping = dicty.TypedDictField(Item, optional=True)
+
+
+def test_try_fromjson_ok():
+    result = Object.try_fromjson({'count': 1, 'items': [{'foo': 1}]})
+    assert result
+    assert result.ok
+    assert result.errors == []
+    assert result.value == Object.fromjson({'count': 1, 'items': [{'foo': 1}]})
+    assert isinstance(result.value.items[0], Item)
+    result.raise_error()
+
+
+def test_try_fromjson_collects_errors():
+    result = Object.try_fromjson({
+        'when': 'yesterday',
+        'nested': {'foo': 'x', 'name': 1},
+        'items': [{'foo': 1}, {}, {'foo': None}],
+        'mapping': {'a': {'foo': 1.5}},
+    })
+    assert not result
+    assert result.value is None
+    assert [path for path, _ in result.errors] == [
+        ('count',),
+        ('when',),
+        ('nested', 'foo'),
+        ('nested', 'name'),
+        ('items', 1, 'foo'),
+        ('items', 2, 'foo'),
+        ('mapping', 'a', 'foo'),
+    ]
+    formatted = result.format_errors()
+    assert formatted[0] == 'count: Is required'
+    assert formatted[2].startswith('nested.foo: Must be of')
+    assert formatted[4] == 'items[1].foo: Is required'
+    assert formatted[6].startswith("mapping['a'].foo: Must be of")
+
+
+def test_first_error_matches_fromjson():
+    data = {'count': 1, 'items': [{'foo': 1}, {'foo': 'x'}],
+            'mapping': {'a': {}}}
+    with pytest.raises(dicty.FieldError) as expected:
+        Object.fromjson(data)
+    with pytest.raises(dicty.FieldError) as exc:
+        Object.try_fromjson(data).raise_error()
+    assert exc.value.path == expected.value.path == 'items[1].foo'
+    assert exc.value.args == expected.value.args
+
+
+def test_validate_collect():
+    obj = Object.fromjson({'count': 1, 'items': [{'foo': 1}]})
+    result = obj.validate(collect=True)
+    assert result and result.value is obj
+
+    obj.count = 'x'
+    obj.items[0].foo = 'y'
+    result = obj.validate(collect=True)
+    assert result.value is obj
+    assert [path for path, _ in result.errors] == [
+        ('count',), ('items', 0, 'foo')]
+
+    with pytest.raises(dicty.DictyRuntimeError):
+        obj.validate(changed_only=True, collect=True)
+
+
+def test_compact_object_collect():
+    class Point(dicty.CompactObject):
+        x = dicty.IntegerField()
+        y = dicty.IntegerField()
+
+    result = Point.try_fromjson({'x': 'a'})
+    assert result.format_errors()[1] == 'y: Is required'
+    assert Point.try_fromjson({'x': 1, 'y': 2}).value == {'x': 1, 'y': 2}
+
+
+def test_overridden_validate():
+    class Custom(dicty.DictObject):
+        foo = dicty.IntegerField()
+
+        def validate(self, *args, **kwargs):
+            raise dicty.FieldError('Broken', 'foo')
+
+    class Parent(dicty.DictObject):
+        items = dicty.TypedListField(Custom)
+
+    result = Parent.try_fromjson({'items': [{'foo': 1}]})
+    assert result.errors == [(('items', 0, 'foo'), 'Broken')]
+
+
+def test_error_steps_keep_odd_keys():
+    class Custom(dicty.DictObject):
+        mapping = dicty.TypedDictField(Item)
+
+        def validate(self, *args, **kwargs):
+            return super(Custom, self).validate(*args, **kwargs)
+
+    class Parent(dicty.DictObject):
+        items = dicty.TypedListField(Custom)
+
+    key = "a.b['c"
+    data = {'items': [{'mapping': {key: {'foo': 'x'}}}]}
+    result = Parent.try_fromjson(data)
+    assert result.errors[0][0] == ('items', 0, 'mapping', key, 'foo')
+    with pytest.raises(dicty.FieldError) as exc:
+        Parent.fromjson(data)
+    assert exc.value.steps == ('items', 0, 'mapping', key, 'foo')
+    assert str(exc.value) == result.format_errors()[0]
+
+    with pytest.raises(dicty.FieldError) as exc:
+        Object.view({'mapping': {key: {'foo': 'x'}}}).mapping[key].foo
+    assert exc.value.steps == ('mapping', key, 'foo')
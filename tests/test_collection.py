@@ -0,0 +1,147 @@
+import datetime
+
+import pytest
+
+import dicty
+
+
+class Item(dicty.DictObject):
+    user_id = dicty.IntegerField(optional=True)
+    created = dicty.DatetimeField(optional=True)
+    tags = dicty.TypedDictField(int, optional=True)
+
+
+def make(user_id, day, **kwargs):
+    item = Item(user_id=user_id, **kwargs)
+    if day is not None:
+        item.created = datetime.datetime(2020, 1, day)
+    return item
+
+
+@pytest.fixture
+def items():
+    return [make(1, 3), make(2, 1), make(1, 2), make(None, None),
+            make(3, 2, tags={'a': 1})]
+
+
+def test_find(items):
+    collection = dicty.Collection(Item, index=[Item.user_id],
+                                  sorted_index=[Item.created], objects=items)
+    assert len(collection) == 5
+    assert collection.find(Item.user_id, 1) == [items[0], items[2]]
+    assert collection.find('user_id', 4) == []
+    assert collection.find(Item.user_id, None) == [items[3]]
+    assert collection.find(Item.created, datetime.datetime(2020, 1, 2)) == \
+        [items[2], items[4]]
+    with pytest.raises(dicty.DictyRuntimeError):
+        collection.find(Item.tags, 1)
+
+
+def test_range(items):
+    collection = dicty.Collection(Item, index=[Item.user_id],
+                                  sorted_index=[Item.created, Item.user_id],
+                                  objects=items)
+    assert collection.range(Item.created) == \
+        [items[1], items[2], items[4], items[0]]
+    assert collection.range(Item.created, datetime.datetime(2020, 1, 2),
+                            datetime.datetime(2020, 1, 3)) == \
+        [items[2], items[4]]
+    assert collection.range(Item.user_id, 2) == [items[1], items[4]]
+    assert collection.range(Item.user_id, stop=2) == [items[0], items[2]]
+
+    with pytest.raises(dicty.DictyRuntimeError):
+        dicty.Collection(Item, index=[Item.user_id]).range(Item.user_id)
+
+
+def test_remove_and_reindex(items):
+    collection = dicty.Collection(Item, index=[Item.user_id, Item.tags['a']],
+                                  sorted_index=[Item.created], objects=items)
+    assert collection.find(Item.tags['a'], 1) == [items[4]]
+
+    collection.remove(items[0])
+    assert items[0] not in collection
+    assert collection.find(Item.user_id, 1) == [items[2]]
+    assert collection.range(Item.created) == [items[1], items[2], items[4]]
+    with pytest.raises(KeyError):
+        collection.remove(items[0])
+    collection.discard(items[0])
+
+    items[2].user_id = 2
+    items[2].created = datetime.datetime(2020, 1, 9)
+    collection.reindex(items[2])
+    assert collection.find(Item.user_id, 1) == []
+    assert collection.find(Item.user_id, 2) == [items[1], items[2]]
+    assert collection.range(Item.created)[-1] is items[2]
+
+    items[1].user_id = 5
+    del items[4]['tags']
+    collection.reindex()
+    assert collection.find(Item.user_id, 5) == [items[1]]
+    assert collection.find(Item.tags['a'], None) == list(collection)
+
+    collection.add(items[0])
+    collection.add(items[0])
+    assert len(collection) == 5
+    assert collection.find(Item.user_id, 1) == [items[0]]
+
+
+class Entry(dicty.DictObject):
+    u = dicty.IntegerField(optional=True)
+    n = dicty.Field(optional=True)
+
+
+def check_consistent(collection, objects):
+    assert len(collection) == len(objects)
+    for obj in objects:
+        assert collection.find(Entry.u, obj.u) == [obj]
+        assert collection.find(Entry.n, obj.n) == [obj]
+    assert collection.range(Entry.n) == sorted(objects, key=lambda o: o.n)
+
+
+def test_add_is_atomic():
+    first = Entry(u=1, n=1)
+    collection = dicty.Collection(Entry, index=[Entry.u],
+                                  sorted_index=[Entry.n], objects=[first])
+    bad = Entry(u=2, n='x')
+    with pytest.raises(TypeError):
+        collection.add(bad)
+    assert bad not in collection
+    check_consistent(collection, [first])
+
+    unhashable = Entry(u=3, n=[1])
+    collection = dicty.Collection(Entry, index=[Entry.n], objects=[first])
+    with pytest.raises(TypeError):
+        collection.add(unhashable)
+    assert collection.find(Entry.n, 1) == [first]
+    collection.remove(first)
+    assert len(collection) == 0
+
+
+def test_extend_is_atomic():
+    first = Entry(u=1, n=1)
+    collection = dicty.Collection(Entry, index=[Entry.u],
+                                  sorted_index=[Entry.n], objects=[first])
+    second = Entry(u=2, n=2)
+    with pytest.raises(TypeError):
+        collection.extend([second, Entry(u=3, n='x')])
+    assert second not in collection
+    check_consistent(collection, [first])
+
+    collection.extend([second])
+    check_consistent(collection, [first, second])
+    collection.remove(first)
+    check_consistent(collection, [second])
+
+
+def test_failed_reindex_keeps_entries():
+    first = Entry(u=1, n=1)
+    second = Entry(u=2, n=2)
+    collection = dicty.Collection(Entry, index=[Entry.u],
+                                  sorted_index=[Entry.n],
+                                  objects=[first, second])
+    dict.__setitem__(second, 'n', 'x')
+    with pytest.raises(TypeError):
+        collection.reindex(second)
+    assert collection.range(Entry.n) == [first, second]
+    collection.remove(second)
+    check_consistent(collection, [first])
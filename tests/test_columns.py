@@ -0,0 +1,105 @@
+import datetime
+import warnings
+
+import pytest
+
+import dicty
+
+numpy = pytest.importorskip('numpy')
+
+
+class Point(dicty.DictObject):
+    x = dicty.IntegerField()
+    y = dicty.FloatField(optional=True)
+    when = dicty.DatetimeField(optional=True)
+
+
+class Row(dicty.DictObject):
+    name = dicty.StringField()
+    flag = dicty.BooleanField(optional=True)
+    day = dicty.DateField(optional=True)
+    point = dicty.TypedObjectField(Point, optional=True)
+    points = dicty.TypedListField(Point, optional=True, lazy=True)
+
+
+ROWS = [
+    {'name': 'a', 'flag': True, 'day': '2020-01-02',
+     'point': {'x': 1, 'y': 0.5, 'when': '2020-01-02 03:04:05'},
+     'points': [{'x': 10}]},
+    {'name': 'b', 'point': {'x': 2, 'y': None}},
+]
+
+
+def test_to_columns():
+    objects = [Row.fromjson(row) for row in ROWS]
+    columns = Row.to_columns(objects, [Row.name, Row.flag, Row.day,
+                                       Row.point.x, Row.point.y,
+                                       Row.point.when, Row.points[0].x])
+    assert sorted(columns) == ['day', 'flag', 'name', 'point.when',
+                               'point.x', 'point.y', 'points.0.x']
+
+    assert columns['name'].dtype == object
+    assert list(columns['name']) == ['a', 'b']
+    assert not isinstance(columns['name'], numpy.ma.MaskedArray)
+
+    assert columns['point.x'].dtype == numpy.int64
+    assert list(columns['point.x']) == [1, 2]
+
+    assert columns['flag'].dtype == numpy.bool_
+    assert list(columns['flag'].mask) == [False, True]
+    assert columns['point.y'].dtype == numpy.float64
+    assert columns['point.y'][0] == 0.5
+    assert columns['point.y'].mask[1]
+
+    assert columns['day'].dtype == numpy.dtype('datetime64[D]')
+    assert columns['day'][0] == numpy.datetime64('2020-01-02')
+    assert columns['point.when'].dtype == numpy.dtype('datetime64[us]')
+    assert columns['point.when'][0] == \
+        numpy.datetime64(datetime.datetime(2020, 1, 2, 3, 4, 5))
+    assert list(columns['points.0.x'].mask) == [False, True]
+    assert columns['points.0.x'][0] == 10
+
+
+def test_to_columns_defaults():
+    objects = [Row.fromjson(row) for row in ROWS]
+    columns = Row.to_columns(objects)
+    assert sorted(columns) == ['day', 'flag', 'name', 'point', 'points']
+    assert columns['point'].dtype == object
+    assert columns['point'][0] is objects[0].point
+
+    assert Row.to_columns([], [Row.point.x])['point.x'].shape == (0,)
+
+    with pytest.raises(dicty.DictyRuntimeError):
+        Row.to_columns(objects, [Row.points.x])
+
+
+def test_to_columns_field_named_key():
+    class Keyed(dicty.DictObject):
+        key = dicty.StringField()
+
+    class Outer(dicty.DictObject):
+        id = dicty.IntegerField()
+        inner = dicty.TypedObjectField(Keyed)
+
+    objects = [Outer.fromjson({'id': 1, 'inner': {'key': 'a'}})]
+    columns = Outer.to_columns(objects)
+    assert sorted(columns) == ['id', 'inner']
+    assert columns['inner'][0] is objects[0].inner
+
+
+@pytest.mark.skipif(not hasattr(datetime, 'timezone'),
+                    reason='datetime.timezone is not available')
+def test_to_columns_aware_datetimes():
+    class Event(dicty.DictObject):
+        when = dicty.NativeDatetimeField(optional=True)
+
+    zone = datetime.timezone(datetime.timedelta(hours=2))
+    objects = [Event(when=datetime.datetime(2020, 1, 2, 3, 4, 5,
+                                            tzinfo=zone)),
+               Event(when=datetime.datetime(2020, 1, 2, 3, 4, 5)),
+               Event()]
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        column = Event.to_columns(objects, [Event.when])['when']
+    assert column.tolist() == [datetime.datetime(2020, 1, 2, 1, 4, 5),
+                               datetime.datetime(2020, 1, 2, 3, 4, 5), None]
@@ -0,0 +1,92 @@
+import datetime
+import pickle
+
+import pytest
+
+import dicty
+
+
+class Nested(dicty.DictObject):
+    foo = dicty.IntegerField()
+
+
+class Fields(object):
+    __slots__ = ()
+    id = dicty.IntegerField()
+    name = dicty.StringField('fullName', optional=True)
+    created = dicty.DatetimeField(optional=True)
+    nested = dicty.TypedObjectField(Nested, optional=True)
+
+
+class Record(dicty.DictObject, Fields):
+    pass
+
+
+class CompactRecord(dicty.CompactObject, Fields):
+    pass
+
+
+JSON = {'id': 1, 'fullName': 'foo', 'created': '1985-06-12 11:22:33',
+        'nested': {'foo': 2}}
+
+
+def test_compact_object():
+    obj = CompactRecord.fromjson(dict(JSON, junk=True))
+    assert not hasattr(obj, '__dict__')
+    assert obj.id == 1
+    assert obj.name == 'foo'
+    assert obj['fullName'] == 'foo'
+    assert obj.created == datetime.datetime(1985, 6, 12, 11, 22, 33)
+    assert obj.nested.foo == 2
+    assert 'junk' not in obj
+    assert obj.jsonize() == JSON
+    assert obj == JSON
+
+    obj = CompactRecord(id=2)
+    assert obj.name is None
+    obj.created = datetime.datetime(2000, 1, 1)
+    assert obj['created'] == '2000-01-01 00:00:00'
+    assert obj.jsonize() == {'id': 2, 'created': '2000-01-01 00:00:00'}
+    del obj.id
+    with pytest.raises(AttributeError):
+        obj.id
+    with pytest.raises(KeyError):
+        obj['junk'] = 1
+
+    with pytest.raises(dicty.FieldError) as exc:
+        CompactRecord.fromjson({'id': 1, 'nested': {}})
+    assert exc.value.path == 'nested.foo'
+
+
+def test_paths():
+    assert CompactRecord.name == 'fullName'
+    assert CompactRecord.nested.foo == 'nested.foo'
+
+
+def test_subclass():
+    class Extended(CompactRecord):
+        extra = dicty.Field(optional=True)
+
+    obj = Extended.fromjson(dict(JSON, extra=[1]))
+    assert not hasattr(obj, '__dict__')
+    assert obj.extra == [1]
+    assert obj.created.year == 1985
+
+
+def test_conversion():
+    record = Record.fromjson(JSON)
+    compact = CompactRecord.fromobject(record)
+    assert compact.created == record.created
+    assert compact.jsonize() == record.jsonize()
+
+    record = Record.fromobject(compact)
+    assert isinstance(record, Record)
+    assert record == JSON
+    assert record._shadow == {'created': compact.created}
+
+
+def test_pickle():
+    obj = CompactRecord.fromjson(JSON)
+    copy = pickle.loads(pickle.dumps(obj, pickle.HIGHEST_PROTOCOL))
+    assert copy == obj
+    assert copy.created == obj.created
@@ -0,0 +1,129 @@
+import pytest
+
+import dicty
+
+
+def validate_generic(obj):
+    for field in obj._fields.values():
+        field.validate(obj)
+
+
+def check_same_error(cls, json):
+    with pytest.raises(dicty.FieldError) as exc:
+        cls.fromjson(json)
+    obj = cls()
+    obj.update(json)
+    with pytest.raises(dicty.FieldError) as generic_exc:
+        validate_generic(obj)
+    assert exc.value.path == generic_exc.value.path
+    assert exc.value.args == generic_exc.value.args
+    return exc.value
+
+
+def test_compiled_errors_match_generic():
+    class Nested(dicty.DictObject):
+        foo = dicty.IntegerField()
+        bar = dicty.RegexpStringField(regexp='^a+$', optional=True)
+
+    class Object(dicty.DictObject):
+        num = dicty.NumericField(optional=True)
+        nested = dicty.TypedObjectField(Nested, optional=True)
+        items = dicty.TypedListField(Nested, optional=True)
+        mapping = dicty.TypedDictField(Nested, optional=True)
+        when = dicty.DatetimeField(optional=True)
+
+    assert check_same_error(Object, {'num': 'x'}).path == 'num'
+    assert check_same_error(
+        Object, {'nested': {'foo': 'x'}}).path == 'nested.foo'
+    assert check_same_error(
+        Object, {'items': [{'foo': 1}, {'foo': 1, 'bar': 'b'}]}
+    ).path == 'items[1].bar'
+    assert check_same_error(
+        Object, {'mapping': {'x': {}}}).path == "mapping['x'].foo"
+    assert check_same_error(Object, {'when': 'now'}).path == 'when'
+    assert check_same_error(Object, {'items': {}}).args == ('must be list',)
+
+    obj = Object.fromjson({'num': None, 'items': [{'foo': 1, 'bar': 'aa'}],
+                           'when': '1985-06-12 11:22:33'})
+    assert isinstance(obj.items[0], Nested)
+    assert obj.when.year == 1985
+
+
+def test_overridden_methods_are_respected():
+    class UpperField(dicty.StringField):
+        def fromjson(self, value):
+            return super(UpperField, self).fromjson(value).upper()
+
+    class CheckedField(dicty.Field):
+        def validate(self, obj):
+            if self.key in obj:
+                raise dicty.FieldError('Always fails', self.key)
+
+    class Object(dicty.DictObject):
+        foo = UpperField()
+        bar = CheckedField(optional=True)
+
+    assert Object.fromjson({'foo': 'xxx'}).foo == 'XXX'
+    with pytest.raises(dicty.FieldError) as exc:
+        Object.fromjson({'foo': 'xxx', 'bar': 1})
+    assert exc.value.args == ('Always fails',)
+
+
+def test_object_validate_override():
+    class Object(dicty.DictObject):
+        foo = dicty.IntegerField()
+
+        def validate(self):
+            super(Object, self).validate()
+            if self.foo < 0:
+                raise dicty.FieldError('Must be positive', 'foo')
+
+    with pytest.raises(dicty.FieldError) as exc:
+        Object.fromjson({'foo': -1})
+    assert exc.value.args == ('Must be positive',)
+
+
+def jsonize_generic(obj):
+    json = {}
+    for field in obj._fields.values():
+        if field.key in obj:
+            json[field.key] = field.jsonize(obj)
+    return json
+
+
+def test_compiled_jsonize_matches_generic():
+    import datetime
+
+    class Nested(dicty.DictObject):
+        foo = dicty.IntegerField()
+        when = dicty.DateField(optional=True)
+
+    class Object(dicty.DictObject):
+        plain = dicty.Field('plainKey', optional=True)
+        when = dicty.DatetimeField(optional=True)
+        nested = dicty.TypedObjectField(Nested, optional=True)
+        items = dicty.TypedListField(Nested, optional=True)
+        mapping = dicty.TypedDictField(Nested, optional=True)
+        lists = dicty.TypedDictField(
+            dicty.TypedListField(Nested), optional=True)
+
+    obj = Object.fromjson({
+        'plainKey': [1, 2],
+        'when': '1985-06-12 11:22:33',
+        'nested': {'foo': 1, 'junk': 2},
+        'items': [{'foo': 2, 'when': '1985-06-12'}],
+        'mapping': {'x': {'foo': 3}},
+        'lists': {'y': [{'foo': 4}]},
+        'junk': True,
+    })
+    obj.when = datetime.datetime(2000, 1, 2, 3, 4, 5)
+    assert obj.jsonize() == jsonize_generic(obj)
+    assert obj.jsonize() == {
+        'plainKey': [1, 2],
+        'when': '2000-01-02 03:04:05',
+        'nested': {'foo': 1},
+        'items': [{'foo': 2, 'when': '1985-06-12'}],
+        'mapping': {'x': {'foo': 3}},
+        'lists': {'y': [{'foo': 4}]},
+    }
+    assert list(Object.fromjson({}).jsonize()) == []
@@ -50,3 +50,42 @@ def test_native_date():
     obj = Object.fromjson({'bDay': datetime.date(1985, 6, 12)})
     assert obj == {'bDay': datetime.date(1985, 6, 12)}
     assert obj.bday == datetime.date(1985, 6, 12)
+
+
+@pytest.mark.parametrize('format', [
+    '%Y-%m-%d %H:%M:%S', '%Y-%m-%d', '%Y-%m-%dT%H:%M:%S.%f',
+    '%Y%m%d', '%d.%m.%Y', '100%% %Y-%m-%d',
+])
+@pytest.mark.parametrize('value', [
+    '1985-06-12 11:22:33', '1985-6-12 1:2:3', '1985-02-30 00:00:00',
+    '1985-06-12', '1985-06-12T11:22:33.5', '1985-06-12T11:22:33.1234567',
+    '19850612', '12.06.1985', '100% 1985-06-12', '1985-06-12 11:22:33 ',
+    None, 5,
+])
+def test_datetime_parse_matches_strptime(format, value):
+    field = dicty.DatetimeField(format=format)
+    try:
+        expected = datetime.datetime.strptime(value, format)
+    except (TypeError, ValueError) as exc:
+        with pytest.raises(type(exc)) as error:
+            field.fromjson(value)
+        assert error.value.args == exc.args
+    else:
+        assert field.fromjson(value) == expected
+
+
+@pytest.mark.parametrize('format', [
+    '%Y-%m-%d %H:%M:%S', '%Y-%m-%d', '%Y-%m-%dT%H:%M:%S.%f', '%d.%m.%Y',
+])
+@pytest.mark.parametrize('value', [
+    datetime.datetime(1985, 6, 12, 11, 22, 33, 5),
+    datetime.datetime(999, 6, 12),
+    datetime.date(1985, 6, 12),
+])
+def test_datetime_format_matches_strftime(format, value):
+    field = dicty.DatetimeField(format=format)
+    try:
+        expected = value.strftime(format)
+    except ValueError:
+        return
+    assert field.tojson(value) == expected
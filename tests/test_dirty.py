@@ -0,0 +1,150 @@
+import pickle
+
+import pytest
+
+import dicty
+
+
+class Item(dicty.DictObject):
+    track_dirty = True
+    foo = dicty.IntegerField()
+
+
+class Object(dicty.DictObject):
+    track_dirty = True
+    name = dicty.StringField(optional=True)
+    count = dicty.IntegerField(optional=True)
+    nested = dicty.TypedObjectField(Item, optional=True)
+    items = dicty.TypedListField(Item, optional=True)
+    mapping = dicty.TypedDictField(Item, optional=True)
+
+
+def test_fromjson_is_clean():
+    obj = Object.fromjson({'name': 'foo', 'nested': {'foo': 1},
+                           'items': [{'foo': 2}], 'mapping': {'a': {'foo': 3}}})
+    assert obj.dirty_keys() == set()
+
+    obj = Object(name='foo')
+    assert obj.dirty_keys() == {'name'}
+
+
+def test_dirty_keys():
+    obj = Object.fromjson({'name': 'foo', 'count': 1})
+    obj.name = 'bar'
+    del obj['count']
+    assert obj.dirty_keys() == {'name', 'count'}
+
+    obj.mark_clean()
+    assert obj.dirty_keys() == set()
+
+    obj.update(count=2)
+    obj.setdefault('name', 'baz')
+    assert obj.dirty_keys() == {'count'}
+    obj.pop('name')
+    assert obj.dirty_keys() == {'count', 'name'}
+
+
+def test_nested_dirty_keys():
+    obj = Object.fromjson({'nested': {'foo': 1}, 'items': [{'foo': 2}],
+                           'mapping': {'a': {'foo': 3}}})
+    obj.items[0].foo = 5
+    assert obj.dirty_keys() == {'items'}
+    obj.mapping['a'].foo = 6
+    assert obj.dirty_keys() == {'items', 'mapping'}
+
+    obj.mark_clean()
+    assert obj.dirty_keys() == set()
+    assert obj.items[0].dirty_keys() == set()
+
+
+def test_validate_changed_only():
+    obj = Object.fromjson({'name': 'foo', 'items': [{'foo': 1}, {'foo': 2}]})
+    # Unchanged fields are not checked
+    dict.__setitem__(obj, 'count', 'bad')
+    obj.validate(changed_only=True)
+
+    obj.name = 123
+    with pytest.raises(dicty.FieldError) as exc:
+        obj.validate(changed_only=True)
+    assert exc.value.path == 'name'
+    obj.name = 'bar'
+
+    obj.items[1].foo = 'bad'
+    with pytest.raises(dicty.FieldError) as exc:
+        obj.validate(changed_only=True)
+    assert exc.value.path == 'items[1].foo'
+
+    with pytest.raises(dicty.FieldError) as exc:
+        obj.validate()
+    assert exc.value.path == 'count'
+
+
+def test_validate_keeps_dirty_keys():
+    obj = Object.fromjson({'nested': {'foo': 1}})
+    obj.nested.foo = 2
+    obj.validate()
+    assert obj.dirty_keys() == {'nested'}
+
+
+def test_pickle_keeps_dirty_keys():
+    obj = Object.fromjson({'name': 'foo', 'count': 1})
+    assert pickle.loads(pickle.dumps(obj)).dirty_keys() == set()
+    obj.count = 2
+    assert pickle.loads(pickle.dumps(obj)).dirty_keys() == {'count'}
+
+
+class CompactItem(dicty.CompactObject):
+    foo = dicty.IntegerField()
+
+
+class Mixed(dicty.DictObject):
+    track_dirty = True
+    name = dicty.StringField(optional=True)
+    item = dicty.TypedObjectField(CompactItem, optional=True)
+    items = dicty.TypedListField(CompactItem, optional=True)
+
+
+def test_nested_compact_objects():
+    obj = Mixed.fromjson({'item': {'foo': 1}, 'items': [{'foo': 2}]})
+    obj.validate()
+    assert obj.dirty_keys() == set()
+    obj.name = 'foo'
+    assert obj.dirty_keys() == {'name'}
+    obj.validate(changed_only=True)
+    obj.mark_clean()
+    assert obj.dirty_keys() == set()
+
+    # Compact objects don't track modifications, they are validated whole
+    obj.items[0].foo = 'bad'
+    with pytest.raises(dicty.FieldError) as exc:
+        obj.validate(changed_only=True)
+    assert exc.value.path == 'items[0].foo'
+
+
+class Untracked(dicty.DictObject):
+    name = dicty.StringField(optional=True)
+    item = dicty.TypedObjectField(Item, optional=True)
+
+
+def test_tracking_is_opt_in():
+    obj = Untracked.fromjson({'name': 'foo', 'item': {'foo': 1}})
+    obj.name = 'bar'
+    assert obj.dirty_keys() == set()
+    with pytest.raises(dicty.DictyRuntimeError):
+        obj.validate(changed_only=True)
+
+    # Modified nested objects tracking changes are still reported
+    obj.item.foo = 2
+    assert obj.dirty_keys() == {'item'}
+
+
+def test_untracked_nested_validated_whole():
+    class Parent(dicty.DictObject):
+        track_dirty = True
+        child = dicty.TypedObjectField(Untracked, optional=True)
+
+    obj = Parent.fromjson({'child': {'name': 'foo'}})
+    obj.child.name = 123
+    with pytest.raises(dicty.FieldError) as exc:
+        obj.validate(changed_only=True)
+    assert exc.value.path == 'child.name'
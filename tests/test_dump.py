@@ -0,0 +1,137 @@
+import io
+import json
+
+import pytest
+
+import dicty
+
+
+class Item(dicty.DictObject):
+    track_dirty = True
+    foo = dicty.IntegerField()
+    tags = dicty.ListField(optional=True)
+
+
+class Object(dicty.DictObject):
+    name = dicty.StringField('Name', optional=True)
+    extra = dicty.DictField(optional=True)
+    nested = dicty.TypedObjectField(Item, optional=True)
+    items = dicty.TypedListField(Item, optional=True)
+    mapping = dicty.TypedDictField(Item, optional=True)
+    lazy = dicty.TypedListField(Item, optional=True, lazy=True)
+    created = dicty.DatetimeField(optional=True)
+
+
+DATA = {
+    'Name': u'фoo',
+    'extra': {'b': [1, 2], 'a': {}},
+    'nested': {'foo': 1, 'tags': ['x', {'y': None}]},
+    'items': [{'foo': 2}, {'foo': 3, 'tags': []}],
+    'mapping': {'b': {'foo': 4}, 'a': {'foo': 5}},
+    'lazy': [{'foo': 6}],
+    'created': '2020-01-02 03:04:05',
+    'unknown': 1,
+}
+
+OPTIONS = [
+    {},
+    {'indent': 2},
+    {'indent': '\t'},
+    {'indent': 0},
+    {'sort_keys': True},
+    {'indent': 4, 'sort_keys': True},
+    {'separators': (',', ':')},
+    {'ensure_ascii': False},
+]
+
+
+@pytest.mark.parametrize('options', OPTIONS)
+def test_iterdump(options):
+    obj = Object.fromjson(DATA)
+    assert ''.join(obj.iterdump(**options)) == \
+        json.dumps(obj.jsonize(), **options)
+
+
+@pytest.mark.parametrize('options', OPTIONS)
+def test_iterdump_empty(options):
+    obj = Object.fromjson({'items': [], 'mapping': {}, 'nested': {'foo': 1}})
+    assert ''.join(obj.iterdump(**options)) == \
+        json.dumps(obj.jsonize(), **options)
+    assert ''.join(Object().iterdump(**options)) == json.dumps({}, **options)
+
+
+@pytest.mark.parametrize('options', OPTIONS)
+def test_dump_many(options):
+    objects = [Object.fromjson(DATA), Object(), Object.fromjson({'name': 'a'})]
+    fp = io.StringIO()
+    Object.dump_many(objects, fp, **options)
+    assert fp.getvalue() == \
+        json.dumps([obj.jsonize() for obj in objects], **options)
+
+    fp = io.StringIO()
+    Object.dump_many(iter([]), fp, **options)
+    assert fp.getvalue() == json.dumps([], **options)
+
+
+def test_dump_chunks():
+    class File(object):
+        def __init__(self):
+            self.writes = []
+
+        def write(self, text):
+            self.writes.append(text)
+
+    obj = Object.fromjson({'items': [{'foo': no} for no in range(1000)]})
+    fp = File()
+    obj.dump(fp, chunk_size=1000)
+    assert ''.join(fp.writes) == json.dumps(obj.jsonize())
+    assert len(fp.writes) > 10
+    assert all(len(chunk) < 3000 for chunk in fp.writes)
+
+
+@pytest.mark.parametrize('options', OPTIONS)
+def test_dump_mixed_batches(options):
+    items = [{'foo': no} for no in range(250)]
+    items[120]['tags'] = [1, [2]]
+    obj = Object.fromjson({'items': items, 'mapping': {'a': {'foo': 1}}})
+    objects = [obj] + [Object(name=str(no)) for no in range(150)]
+    assert ''.join(Object.iterdump_many(objects, **options)) == \
+        json.dumps([o.jsonize() for o in objects], **options)
+
+
+def test_dump_custom_jsonize():
+    class Custom(dicty.DictObject):
+        foo = dicty.IntegerField()
+
+        def jsonize(self):
+            return {'custom': self.foo}
+
+    class Parent(dicty.DictObject):
+        child = dicty.TypedObjectField(Custom)
+        children = dicty.TypedListField(Custom)
+
+    obj = Parent.fromjson({'child': {'foo': 1}, 'children': [{'foo': 2}]})
+    assert ''.join(obj.iterdump(indent=1)) == \
+        json.dumps(obj.jsonize(), indent=1)
+
+
+def test_fields_named_like_dict_methods():
+    class Shadowing(dicty.DictObject):
+        track_dirty = True
+        keys = dicty.IntegerField(optional=True)
+        get = dicty.TypedObjectField(Item, optional=True)
+        items = dicty.TypedListField(Item, optional=True)
+
+    obj = Shadowing.fromjson({'keys': 1, 'get': {'foo': 1},
+                              'items': [{'foo': 2}]})
+    assert ''.join(obj.iterdump()) == json.dumps(obj.jsonize())
+    fp = io.StringIO()
+    Shadowing.dump_many([obj, Shadowing(keys=2)], fp)
+    assert json.loads(fp.getvalue()) == [obj.jsonize(), {'keys': 2}]
+
+    obj.get.foo = 3
+    obj.items[0].foo = 4
+    assert obj.dirty_keys() == {'get', 'items'}
+    obj.validate(changed_only=True)
+    obj.mark_clean()
+    assert obj.dirty_keys() == set()
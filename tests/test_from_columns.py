@@ -0,0 +1,89 @@
+import datetime
+
+import pytest
+
+import dicty
+
+numpy = pytest.importorskip('numpy')
+
+
+class Item(dicty.DictObject):
+    foo = dicty.IntegerField()
+
+
+class Row(dicty.DictObject):
+    id = dicty.IntegerField()
+    score = dicty.FloatField(optional=True)
+    name = dicty.RegexpStringField(regexp=r'^[a-z]+$')
+    flag = dicty.BooleanField(optional=True)
+    when = dicty.DatetimeField(optional=True)
+    day = dicty.DateField(optional=True)
+    stamp = dicty.NativeDatetimeField(optional=True)
+    item = dicty.TypedObjectField(Item, optional=True)
+
+
+def test_from_columns():
+    columns = {
+        'id': numpy.array([1, 2], dtype='int64'),
+        'score': numpy.ma.masked_array([0.5, 0.0], mask=[False, True]),
+        'name': numpy.array(['foo', 'bar']),
+        'flag': numpy.array([True, False]),
+        'when': numpy.array(['2020-01-02 03:04:05', '2020-01-03 00:00:00']),
+        'day': numpy.array(['2020-01-02', '2020-01-03']),
+        'stamp': numpy.array(['2020-01-02T03:04:05', '2020-01-03'],
+                             dtype='datetime64[s]'),
+        'item': [{'foo': 1}, {'foo': 2}],
+    }
+    objects = Row.from_columns(columns)
+    rows = [
+        {'id': 1, 'score': 0.5, 'name': 'foo', 'flag': True,
+         'when': '2020-01-02 03:04:05', 'day': '2020-01-02',
+         'stamp': datetime.datetime(2020, 1, 2, 3, 4, 5), 'item': {'foo': 1}},
+        {'id': 2, 'name': 'bar', 'flag': False,
+         'when': '2020-01-03 00:00:00', 'day': '2020-01-03',
+         'stamp': datetime.datetime(2020, 1, 3), 'item': {'foo': 2}},
+    ]
+    assert objects == [Row.fromjson(row) for row in rows]
+    assert type(objects[0]['id']) is int
+    assert objects[0].when == datetime.datetime(2020, 1, 2, 3, 4, 5)
+    assert objects[1].day == datetime.date(2020, 1, 3)
+    assert isinstance(objects[0].item, Item)
+    assert objects[0].dirty_keys() == set()
+
+
+@pytest.mark.parametrize('columns,path,message', [
+    ({'id': numpy.array([1.0, 2.0])}, '[0].id', None),
+    ({'id': [1, 'x']}, '[1].id', None),
+    ({'id': numpy.ma.masked_array([1, 2], mask=[False, True])},
+     '[1].id', 'Is required'),
+    ({'name': numpy.array(['foo', 'Bar'])}, '[1].name',
+     'Does not match regular expression'),
+    ({'when': numpy.array(['2020-01-02 03:04:05', '2020-01-02T03:04:05'])},
+     '[1].when', None),
+    ({'item': [{'foo': 1}, {'foo': 'x'}]}, '[1].item.foo', None),
+])
+def test_from_columns_errors(columns, path, message):
+    full = {'id': numpy.array([1, 2]), 'name': numpy.array(['foo', 'bar'])}
+    full.update(columns)
+    with pytest.raises(dicty.FieldError) as exc:
+        Row.from_columns(full)
+    rows = [dict((key, value[row].item() if hasattr(value[row], 'item')
+                  else value[row])
+                 for key, value in full.items()
+                 if not numpy.ma.is_masked(value[row]))
+            for row in range(2)]
+    with pytest.raises(dicty.FieldError) as expected:
+        for row in rows:
+            Row.fromjson(row)
+    assert exc.value.path == path
+    assert exc.value.args[0] == expected.value.args[0]
+    if message:
+        assert exc.value.args[0] == message
+
+
+def test_from_columns_invalid():
+    with pytest.raises(dicty.DictyRuntimeError):
+        Row.from_columns({'unknown': [1]})
+    with pytest.raises(dicty.DictyRuntimeError):
+        Row.from_columns({'id': [1], 'name': ['a', 'b']})
+    assert Row.from_columns({}) == []
@@ -0,0 +1,47 @@
+import datetime
+import pickle
+
+import pytest
+
+import dicty
+
+
+class Item(dicty.DictObject):
+    id = dicty.IntegerField()
+    created = dicty.DatetimeField(optional=True)
+
+
+class Bag(dicty.DictObject):
+    items = dicty.TypedListField(Item)
+
+
+RECORDS = [{'items': [{'id': i, 'created': '1985-06-12 11:22:33'}]}
+           for i in range(50)]
+
+
+def test_pickle_keeps_shadow():
+    obj = Bag.fromjson(RECORDS[0])
+    copy = pickle.loads(pickle.dumps(obj, pickle.HIGHEST_PROTOCOL))
+    assert copy == obj
+    assert isinstance(copy.items[0], Item)
+    assert copy.items[0].created == datetime.datetime(1985, 6, 12, 11, 22, 33)
+
+
+@pytest.mark.parametrize('workers,chunksize', [(1, None), (2, None), (2, 7)])
+def test_fromjson_many(workers, chunksize):
+    result = Bag.fromjson_many(RECORDS, workers=workers, chunksize=chunksize)
+    assert result == [Bag.fromjson(record) for record in RECORDS]
+    assert [bag.items[0].id for bag in result] == list(range(50))
+    assert result[-1].items[0].created.year == 1985
+
+
+def test_first_error_is_raised():
+    records = list(RECORDS)
+    records[13] = {'items': [{'id': 'x'}]}
+    records[41] = {'items': [{}]}
+    with pytest.raises(dicty.FieldError) as serial:
+        [Bag.fromjson(record) for record in records]
+    with pytest.raises(dicty.FieldError) as exc:
+        Bag.fromjson_many(records, workers=2, chunksize=5)
+    assert exc.value.path == serial.value.path == 'items[0].id'
+    assert exc.value.args == serial.value.args
@@ -0,0 +1,92 @@
+import threading
+
+import pytest
+
+import dicty
+
+
+def strip(value):
+    return value.strip()
+
+
+class Item(dicty.DictObject):
+    foo = dicty.IntegerField()
+
+
+class Object(dicty.DictObject):
+    name = dicty.StringField(filters=[strip])
+    items = dicty.TypedListField(Item)
+
+
+def test_instrument():
+    validators = Object._validators
+    calls = []
+
+    def callback(cls, attname, what, seconds):
+        calls.append((cls, attname, what))
+
+    with dicty.instrument(callback) as instrumentation:
+        obj = Object.fromjson({'name': ' foo ', 'items': [{'foo': 1}] * 3})
+        assert obj.name == 'foo'
+        with pytest.raises(dicty.FieldError):
+            Object.fromjson({'name': 'foo', 'items': [{'foo': 'x'}]})
+        assert not Object.try_fromjson({'name': 'foo', 'items': [{}]})
+
+    stats = instrumentation.stats
+    assert stats[Object, 'name', 'validate'][0] == 3
+    assert stats[Object, 'name', 'filter strip'][0] == 3
+    assert stats[Object, 'items', 'validate'][:1] == [2]
+    assert stats[Object, 'items', 'validate'][2] == 1
+    assert stats[Item, 'foo', 'validate'][0] == 4
+    assert stats[Item, 'foo', 'validate'][2] == 1
+    assert stats[Object, 'items', 'validate'][1] >= \
+        stats[Item, 'foo', 'validate'][1] / 2
+    assert (Object, 'name', 'filter strip') in calls
+
+    report = instrumentation.report()
+    assert 'Object.name filter strip' in report
+    assert 'Item.foo' in report
+
+    # Everything is restored
+    assert Object._validators is validators
+    with dicty.instrument() as instrumentation:
+        pass
+    Object.fromjson({'name': 'foo', 'items': []})
+    assert not any(calls for calls, _, _ in instrumentation.stats.values())
+    assert not Object.try_fromjson({'name': 'foo', 'items': [{}]})
+
+
+def test_instrument_not_reentrant():
+    with dicty.instrument():
+        with pytest.raises(dicty.DictyRuntimeError):
+            with dicty.instrument():
+                pass
+
+
+def test_instrument_threads():
+    field = Object._fields['name']
+    validators = Object._validators
+
+    def decode():
+        for _ in range(50):
+            Object.fromjson({'name': ' foo ', 'items': [{'foo': 1}]})
+
+    with dicty.instrument() as instrumentation:
+        assert field.filters == [strip]
+        assert Object._validators is validators
+
+        class Late(dicty.DictObject):
+            bar = dicty.IntegerField()
+
+        Late.fromjson({'bar': 1})
+        threads = [threading.Thread(target=decode) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    stats = instrumentation.stats
+    assert stats[Late, 'bar', 'validate'][0] == 1
+    assert stats[Object, 'name', 'filter strip'][0] == 200
+    assert stats[Item, 'foo', 'validate'][0] == 200
+    assert dicty._validation_hook is None
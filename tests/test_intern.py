@@ -0,0 +1,102 @@
+import json
+
+import dicty
+
+
+class Item(dicty.DictObject):
+    intern_strings = dicty.InternTable()
+
+    status = dicty.StringField()
+    code = dicty.RegexpStringField(regexp='^[A-Z]+$', optional=True)
+    note = dicty.StringField(optional=True, intern=False)
+    count = dicty.IntegerField(optional=True)
+
+
+class Explicit(dicty.DictObject):
+    status = dicty.StringField(intern=True)
+    other = dicty.StringField(optional=True)
+
+
+class Compact(dicty.CompactObject):
+    intern_strings = True
+
+    status = dicty.StringField()
+
+
+def decode(cls, data, **kwargs):
+    # Separate json.loads() calls create separate copies of strings
+    return cls.fromjson(json.loads(json.dumps(data)), **kwargs)
+
+
+def test_intern_values():
+    data = {'status': 'active', 'code': 'ABC', 'note': 'note', 'count': 1}
+    first = decode(Item, data)
+    second = decode(Item, data)
+    assert first == second == data
+    assert first.status is second.status
+    assert first.code is second.code
+    assert first.note is not second.note
+
+
+def test_intern_keys():
+    first = decode(Item, {'status': 'active', 'extra_key': 1})
+    second = decode(Item, {'status': 'active', 'extra_key': 2})
+    keys = dict((key, key) for key in first)
+    assert all(keys[key] is key for key in second)
+    assert [key for key in first if key == 'status'][0] is \
+        Item._fields['status'].key
+
+
+def test_bounded():
+    table = dicty.InternTable(max_size=2)
+    for value in ['aa', 'bb', 'cc', 'aa', 'cc']:
+        table.intern(value)
+    assert len(table) == 2
+    assert table.stats() == {'size': 2, 'max_size': 2, 'hits': 1,
+                             'misses': 2, 'rejected': 2}
+    assert table.intern(1) == 1
+    table.clear()
+    assert table.stats() == {'size': 0, 'max_size': 2, 'hits': 0,
+                             'misses': 0, 'rejected': 0}
+
+
+def test_field_policy():
+    first = decode(Explicit, {'status': 'explicit', 'other': 'other'})
+    second = decode(Explicit, {'status': 'explicit', 'other': 'other'})
+    assert first.status is second.status
+    assert first.other is not second.other
+    assert 'explicit' in dicty.default_intern_table._values
+
+
+def test_compact_and_projection():
+    first = decode(Compact, {'status': 'compact'})
+    second = decode(Compact, {'status': 'compact'})
+    assert first.status is second.status
+
+    data = {'status': 'projected', 'code': 'X'}
+    first = decode(Item, data, only=[Item.status])
+    second = decode(Item, data, only=[Item.status])
+    assert first.status is second.status
+
+
+class Parent(dicty.DictObject):
+    item = dicty.TypedObjectField(Item)
+    items = dicty.TypedListField(Compact, optional=True)
+
+
+def try_decode(cls, data):
+    return cls.try_fromjson(json.loads(json.dumps(data))).value
+
+
+def test_try_fromjson():
+    data = {'item': {'status': 'tried', 'extra_key': 1},
+            'items': [{'status': 'tried compact'}]}
+    first = try_decode(Parent, data)
+    second = try_decode(Parent, data)
+    assert first == second == data
+    assert first.item.status is second.item.status
+    assert first.items[0].status is second.items[0].status
+    keys = dict((key, key) for key in first.item)
+    assert all(keys[key] is key for key in second.item)
+
+    assert Parent.try_fromjson({'item': {'status': 1}}).value is None
@@ -0,0 +1,71 @@
+import io
+import json
+
+import pytest
+
+import dicty
+
+
+class Item(dicty.DictObject):
+    id = dicty.IntegerField()
+    name = dicty.StringField(optional=True)
+
+
+RECORDS = [{'id': i, 'name': u'item №{}'.format(i)} for i in range(20)]
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 65536])
+def test_ndjson(chunk_size):
+    data = u'\n'.join(json.dumps(r) for r in RECORDS) + u'\n\n'
+    items = list(Item.iter_fromjson(io.StringIO(data), chunk_size))
+    assert items == RECORDS
+    assert all(isinstance(item, Item) for item in items)
+
+    # Binary file without trailing newline
+    data = u'\n'.join(json.dumps(r, ensure_ascii=False) for r in RECORDS)
+    items = list(Item.iter_fromjson(
+        io.BytesIO(data.encode('utf-8')), chunk_size))
+    assert items == RECORDS
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 65536])
+def test_json_array(chunk_size):
+    data = json.dumps(RECORDS, indent=2)
+    items = list(Item.iter_fromjson(io.StringIO(data), chunk_size))
+    assert items == RECORDS
+
+    items = list(Item.iter_fromjson(
+        io.BytesIO(data.encode('utf-8')), chunk_size))
+    assert items == RECORDS
+
+    assert list(Item.iter_fromjson(io.StringIO(u' [ ] '), chunk_size)) == []
+    assert list(Item.iter_fromjson(io.StringIO(u''), chunk_size)) == []
+
+
+def test_lazy_iteration():
+    data = io.StringIO(u''.join(json.dumps(r) + u'\n' for r in RECORDS))
+    iterator = Item.iter_fromjson(data, chunk_size=16)
+    assert next(iterator) == RECORDS[0]
+    assert data.tell() < len(data.getvalue())
+
+
+def test_record_index_in_error_path():
+    data = u'{"id": 1}\n{"id": 2}\n{"id": "3"}\n'
+    with pytest.raises(dicty.FieldError) as exc:
+        list(Item.iter_fromjson(io.StringIO(data)))
+    assert exc.value.path == '[2].id'
+
+    data = u'[{"id": 1}, {"name": "foo"}]'
+    with pytest.raises(dicty.FieldError) as exc:
+        list(Item.iter_fromjson(io.StringIO(data), chunk_size=3))
+    assert exc.value.path == '[1].id'
+    assert exc.value.args == ('Is required',)
+
+
+@pytest.mark.parametrize('data', [
+    u'[{"id": 1}', u'[{"id": 1},]', u'[{"id": 1}] {}', u'[{"id": 1} {}]',
+    u'{"id": 1}\n{"id": ',
+])
+def test_malformed(data):
+    with pytest.raises(ValueError):
+        list(Item.iter_fromjson(io.StringIO(data), chunk_size=4))
@@ -0,0 +1,133 @@
+import pytest
+
+import dicty
+
+
+class Item(dicty.DictObject):
+    foo = dicty.IntegerField()
+    when = dicty.DateField(optional=True)
+
+
+class Object(dicty.DictObject):
+    items = dicty.TypedListField(Item, lazy=True, optional=True)
+    nested = dicty.TypedObjectField(Item, lazy=True, optional=True)
+
+
+def test_lazy_list():
+    obj = Object.fromjson({'items': [{'foo': 1}, {'foo': 'bad'}]})
+    assert isinstance(obj.items, dicty.LazyList)
+    assert type(list.__getitem__(obj.items, 0)) is dict
+
+    item = obj.items[0]
+    assert isinstance(item, Item)
+    assert obj.items[0] is item
+    assert list.__getitem__(obj.items, 0) is item
+
+    with pytest.raises(dicty.FieldError) as exc:
+        obj.items[1]
+    assert exc.value.path == 'items[1].foo'
+
+    with pytest.raises(dicty.FieldError) as exc:
+        list(obj.items)
+    assert exc.value.path == 'items[1].foo'
+
+    with pytest.raises(dicty.FieldError) as exc:
+        Object.fromjson({'items': {}})
+    assert exc.value.args == ('must be list',)
+
+
+def test_validate_keeps_items_lazy():
+    obj = Object.fromjson({'items': [{'foo': 1}, {'foo': 'bad'}]})
+    first = obj.items[0]
+    obj.validate()
+    assert isinstance(obj.items, dicty.LazyList)
+    assert list.__getitem__(obj.items, 0) is first
+    assert type(list.__getitem__(obj.items, 1)) is dict
+
+    with pytest.raises(dicty.FieldError) as exc:
+        obj.items[1]
+    assert exc.value.path == 'items[1].foo'
+
+
+def test_lazy_object():
+    obj = Object.fromjson({'nested': {'foo': 1, 'when': '1985-06-12'}})
+    assert type(obj['nested']) is dict
+    assert obj.nested.when.year == 1985
+    assert isinstance(obj['nested'], Item)
+
+    obj = Object.fromjson({'nested': {'foo': 'bad'}})
+    with pytest.raises(dicty.FieldError) as exc:
+        obj.nested
+    assert exc.value.path == 'nested.foo'
+
+    assert isinstance(Object().nested, Item)
+
+
+def test_jsonize_passes_raw_items():
+    raw = {'foo': 1, 'junk': 2}
+    obj = Object.fromjson({'items': [raw, {'foo': 2, 'junk': 3}],
+                           'nested': raw})
+    obj.items[1]
+    json = obj.jsonize()
+    assert json == {'items': [raw, {'foo': 2}], 'nested': raw}
+    assert json['items'][0] is raw
+    assert json['nested'] is raw
+    assert type(list.__getitem__(obj.items, 0)) is dict
+
+
+def test_materialize():
+    class Outer(dicty.DictObject):
+        objects = dicty.TypedListField(Object)
+
+    obj = Outer.fromjson({'objects': [
+        {'items': [{'foo': 1}]},
+        {'items': [{'foo': 1}, {}]},
+    ]})
+    with pytest.raises(dicty.FieldError) as exc:
+        obj.materialize()
+    assert exc.value.path == 'objects[1].items[1].foo'
+    assert exc.value.args == ('Is required',)
+
+    obj = Object.fromjson({'items': [{'foo': 1}], 'nested': {'foo': 2}})
+    assert obj.materialize() is obj
+    assert isinstance(list.__getitem__(obj.items, 0), Item)
+    assert isinstance(obj['nested'], Item)
+
+
+def test_lazy_requires_object_type():
+    with pytest.raises(dicty.DictyRuntimeError):
+        dicty.TypedListField(int, lazy=True)
+
+
+def test_lazy_list_copies():
+    import copy
+
+    obj = Object.fromjson({'items': [{'foo': 1}, {'foo': 2}]})
+    first = obj.items[0]
+    for result in [obj.items.copy(), copy.copy(obj.items),
+                   obj.items + [], [] + obj.items, obj.items * 1]:
+        assert isinstance(result, dicty.LazyList)
+        assert result[0] is first
+        # Unaccessed items are shared raw and decoded by each list
+        assert isinstance(result[1], Item) and result[1].foo == 2
+    assert type(list.__getitem__(obj.items, 1)) is dict
+
+    combined = obj.items + [Item(foo=3)]
+    assert [item.foo for item in combined] == [1, 2, 3]
+    assert [item.foo for item in [Item(foo=0)] + obj.items] == [0, 1, 2]
+    assert len(obj.items * 2) == 4
+
+
+def test_lazy_list_contains():
+    class Compact(dicty.CompactObject):
+        foo = dicty.IntegerField()
+
+    class Container(dicty.DictObject):
+        items = dicty.TypedListField(Compact, lazy=True)
+
+    obj = Container.fromjson({'items': [{'foo': 1}, {'foo': 2}]})
+    item = Compact(foo=2)
+    assert item in obj.items
+    assert Compact(foo=3) not in obj.items
+    assert obj.items.index(item) == 1
+    assert obj.items.count(item) == 1
@@ -0,0 +1,162 @@
+import json
+import os
+
+import pytest
+
+import dicty
+
+
+class Item(dicty.DictObject):
+    id = dicty.StringField('_id')
+    foo = dicty.IntegerField()
+
+
+class Record(dicty.DictObject):
+    item = dicty.TypedObjectField(Item)
+
+
+RECORDS = [
+    {'_id': 'a', 'foo': 1},
+    {'_id': 'b', 'foo': 2},
+    {'_id': 'c', 'foo': 'bad'},
+    {'foo': 4},
+    {'_id': 'a', 'foo': 5},
+]
+
+
+@pytest.fixture
+def filename(tmpdir):
+    filename = str(tmpdir.join('items.ndjson'))
+    with open(filename, 'w') as fp:
+        for no, record in enumerate(RECORDS):
+            fp.write(json.dumps(record) + '\n')
+            if no == 1:
+                fp.write('\n')
+    return filename
+
+
+def test_positions(filename):
+    with dicty.NDJSONStore(Item, filename) as store:
+        assert len(store) == 5
+        assert store[0] == RECORDS[0]
+        assert type(store[1]) is Item
+        assert store[-1] == RECORDS[4]
+        assert store[:2] == RECORDS[:2]
+        with pytest.raises(IndexError):
+            store[5]
+        with pytest.raises(dicty.FieldError) as exc:
+            store[2]
+        assert exc.value.path == '[2].foo'
+        with pytest.raises(dicty.DictyRuntimeError):
+            store.get('a')
+
+
+def test_key_index(filename):
+    with dicty.NDJSONStore(Item, filename, key=Item.id) as store:
+        assert store.get('a') == RECORDS[0]
+        assert store.get('b').foo == 2
+        assert store.get('x') is None
+
+
+def test_nested_key(tmpdir):
+    filename = str(tmpdir.join('records.ndjson'))
+    with open(filename, 'w') as fp:
+        for record in RECORDS[:2]:
+            fp.write(json.dumps({'item': record}) + '\n')
+    with dicty.NDJSONStore(Record, filename, key=Record.item.id) as store:
+        assert store.get('b').item.foo == 2
+        assert list(store) == [{'item': record} for record in RECORDS[:2]]
+
+
+def test_saved_index(filename, monkeypatch):
+    dicty.NDJSONStore(Item, filename, key=Item.id).close()
+    assert os.path.exists(filename + '.idx')
+
+    def build_index(self):
+        raise AssertionError('index is built again')
+
+    with monkeypatch.context() as patch:
+        patch.setattr(dicty.NDJSONStore, '_build_index', build_index)
+        with dicty.NDJSONStore(Item, filename, key=Item.id) as store:
+            assert store.get('b').foo == 2
+        with pytest.raises(AssertionError):
+            dicty.NDJSONStore(Item, filename)
+
+    # Modified file is indexed again
+    with open(filename, 'a') as fp:
+        fp.write(json.dumps({'_id': 'd', 'foo': 6}))
+    with dicty.NDJSONStore(Item, filename, key=Item.id) as store:
+        assert len(store) == 6
+        assert store.get('d').foo == 6
+
+
+def test_empty_file(tmpdir):
+    filename = str(tmpdir.join('empty.ndjson'))
+    open(filename, 'w').close()
+    with dicty.NDJSONStore(Item, filename, persist=False) as store:
+        assert len(store) == 0
+        assert list(store) == []
+    assert not os.path.exists(filename + '.idx')
+
+
+def test_saved_index_format(filename):
+    dicty.NDJSONStore(Item, filename, key=Item.id).close()
+    with open(filename + '.idx', 'rb') as fp:
+        header = json.loads(fp.readline().decode('utf-8'))
+    assert header['count'] == 5
+    assert sorted(header['keys']) == [['a', 0], ['b', 1], ['c', 2]]
+
+    # Truncated index is built again
+    with open(filename + '.idx', 'rb+') as fp:
+        fp.truncate(os.path.getsize(filename + '.idx') - 8)
+    with dicty.NDJSONStore(Item, filename, key=Item.id) as store:
+        assert store[-1] == RECORDS[4]
+        assert store.get('b').foo == 2
+
+
+def test_double_offsets(filename):
+    # Offsets are kept in doubles on Python 2
+    class DoubleStore(dicty.NDJSONStore):
+        offset_typecode = 'd'
+
+    with DoubleStore(Item, filename, key=Item.id) as store:
+        assert store[1] == RECORDS[1]
+    with DoubleStore(Item, filename, key=Item.id) as store:
+        assert store._starts.typecode == 'd'
+        assert store[-1] == RECORDS[4]
+        assert store.get('b').foo == 2
+    # Index saved with other offsets is built again
+    with dicty.NDJSONStore(Item, filename, key=Item.id) as store:
+        assert store[-1] == RECORDS[4]
+
+
+def test_index_not_writable(tmpdir, filename):
+    index_filename = str(tmpdir.join('missing', 'items.idx'))
+    with dicty.NDJSONStore(Item, filename, key=Item.id,
+                           index_filename=index_filename) as store:
+        assert store.get('b').foo == 2
+    assert not os.path.exists(index_filename)
+
+
+def test_key_index_bad_lines(tmpdir):
+    filename = str(tmpdir.join('items.ndjson'))
+    with open(filename, 'w') as fp:
+        fp.write('{"_id": ["x"], "foo": 1}\n{"_id": {}, "foo": 2}\n'
+                 '{"_id": "a", "foo": 3}\n')
+    with dicty.NDJSONStore(Item, filename, key=Item.id) as store:
+        assert len(store) == 3
+        assert store.get('a').foo == 3
+
+    with open(filename, 'a') as fp:
+        fp.write('\n{"_id": "b", \n{"_id": "c", "foo": 4}\n')
+    # Invalid JSON fails on decoding, whether the file has a key index or not
+    for key in [Item.id, None]:
+        with dicty.NDJSONStore(Item, filename, key=key) as store:
+            assert len(store) == 5
+            with pytest.raises(ValueError) as exc:
+                store[3]
+            assert 'record 3' in str(exc.value)
+            assert store[4].foo == 4
+            if key is not None:
+                assert store.get('b') is None
+                assert store.get('c').foo == 4
@@ -58,3 +58,83 @@ def test_dict_items_indexes():
 
     with pytest.raises(IndexError):
         assert Foo.nested['x.y'].foo_bar
+
+
+def test_path_caching():
+    class Foo(dicty.DictObject):
+        class Bar(dicty.DictObject):
+            foo = dicty.DictField()
+            items = dicty.TypedListField('tests.test_path.Bar', optional=True)
+
+        nested = dicty.TypedObjectField(Bar)
+        lst = dicty.TypedListField(Bar)
+
+    assert Foo.nested is Foo.nested
+    assert Foo.nested.foo is Foo.nested.foo
+    assert Foo.lst[0].foo is Foo.lst[0].foo
+    assert Foo.lst[0] is not Foo.lst[1]
+    assert Foo.lst.foo is Foo.lst.foo
+
+    # Attribute and item paths have the same value but not the same meaning
+    assert Foo.lst['foo'] == Foo.lst.foo == 'lst.foo'
+    assert Foo.lst['foo'] is not Foo.lst.foo
+    assert Foo.lst['foo'].attname == 'lst'
+    assert Foo.lst.foo.attname == 'foo'
+
+    # Nested list is indexable
+    assert Foo.nested.items[1].foo == 'nested.items.1.foo'
+
+    with pytest.raises(AttributeError):
+        Foo.nested.__private__
+
+
+def test_path_name_clashes():
+    class Bar(dicty.DictObject):
+        count = dicty.IntegerField()
+        title = dicty.StringField('Title')
+        _hidden = dicty.StringField('hidden')
+
+    class Foo(dicty.DictObject):
+        nested = dicty.TypedObjectField(Bar)
+        lst = dicty.TypedListField(Bar)
+
+    # Fields are found before str methods with the same name
+    assert Foo.nested.count == 'nested.count'
+    assert Foo.nested.count is Foo.nested.count
+    assert Foo.nested.count.attname == 'count'
+    assert Foo.lst[0].title == 'lst.0.Title'
+    assert Foo.nested._hidden == 'nested.hidden'
+    assert Foo.lst.upper() == 'LST'
+
+    class Baz(dicty.DictObject):
+        key = dicty.StringField()
+
+    class Private(dicty.DictObject):
+        _step = dicty.IntegerField(optional=True)
+
+    class Clashing(dicty.DictObject):
+        nested = dicty.TypedObjectField(Baz)
+        private = dicty.TypedObjectField(Private, optional=True)
+
+    # Only reading the ambiguous attribute raises
+    assert Clashing.nested == 'nested'
+    assert Clashing.nested._steps() == ['nested']
+    with pytest.raises(dicty.DictyRuntimeError):
+        Clashing.nested.key
+    obj = Clashing.fromjson({'nested': {'key': 'a'}})
+    assert dicty.path_get(Clashing.nested, obj) == {'key': 'a'}
+    dicty.path_set(Clashing.nested, obj, Baz(key='b'))
+    assert obj.nested.key == 'b'
+    assert Clashing._projection([Clashing.nested]).fromjson(
+        {'nested': {'key': 'c'}}) == {'nested': {'key': 'c'}}
+    # Private path attributes win over fields
+    assert Clashing.private._step == 'private'
+
+
+def test_item_paths_cache_is_bounded():
+    class Foo(dicty.DictObject):
+        nested = dicty.TypedListField(dicty.DictObject)
+
+    for i in range(dicty.DictyItemPath.items_cache_size + 10):
+        assert Foo.nested[i] == 'nested.{}'.format(i)
+    assert len(Foo.nested._items) == dicty.DictyItemPath.items_cache_size
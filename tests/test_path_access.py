@@ -0,0 +1,121 @@
+import datetime
+
+import pytest
+
+import dicty
+
+
+class Item(dicty.DictObject):
+    track_dirty = True
+    price = dicty.IntegerField('Price', optional=True, default=0)
+    created = dicty.DatetimeField(optional=True)
+
+
+class Object(dicty.DictObject):
+    track_dirty = True
+    id = dicty.IntegerField()
+    nested = dicty.TypedObjectField(Item, optional=True)
+    items = dicty.TypedListField(Item, optional=True)
+    lazy = dicty.TypedListField(Item, optional=True, lazy=True)
+    mapping = dicty.TypedDictField(Item, optional=True)
+
+
+class Parent(dicty.DictObject):
+    child = dicty.TypedObjectField(Object)
+
+
+class Compact(dicty.CompactObject):
+    id = dicty.IntegerField()
+    created = dicty.DatetimeField(optional=True)
+
+
+DATA = {
+    'id': 1,
+    'nested': {'Price': 1, 'created': '2020-01-02 03:04:05'},
+    'items': [{'Price': 2}, {'Price': 3}],
+    'lazy': [{'Price': 4}],
+    'mapping': {'a': {'Price': 5}},
+}
+
+
+def test_get():
+    obj = Object.fromjson(DATA)
+    assert dicty.path_get(Object.id, obj) == 1
+    assert dicty.path_get(Object.nested.price, obj) == 1
+    assert dicty.path_get(Object.nested.created, obj) == datetime.datetime(
+        2020, 1, 2, 3, 4, 5)
+    assert dicty.path_get(Object.items[1].price, obj) == 3
+    assert dicty.path_get(Object.items[-1].price, obj) == 3
+    assert dicty.path_get(Object.mapping['a'].price, obj) == 5
+    assert dicty.path_get(Object.lazy[0].price, obj) == 4
+    assert isinstance(dicty.path_get(Object.items[0], obj), Item)
+    parent = Parent(child=obj)
+    assert dicty.path_get(Parent.child.items[1].price, parent) == 3
+    assert dicty.path_get(Parent.child.nested.created, parent).year == 2020
+
+    assert dicty.path_get(Object.items[2].price, obj) is None
+    assert dicty.path_get(Object.mapping['b'].price, obj, 'x') == 'x'
+    # Field defaults are not applied
+    assert dicty.path_get(Object.nested.price, Object(nested=Item())) is None
+    assert dicty.path_get(Object.nested.price, Object(nested=None)) is None
+
+
+def test_getter():
+    objects = [Object.fromjson(dict(DATA, items=[{'Price': price}]))
+               for price in [3, 1, 2]]
+    key = dicty.path_getter(Object.items[0].price)
+    assert key is dicty.path_getter(Object.items[0].price)
+    assert [key(obj) for obj in sorted(objects, key=key)] == [1, 2, 3]
+    with pytest.raises(KeyError):
+        dicty.path_getter(Object.nested.price)(Object(id=1))
+
+
+def test_set():
+    obj = Object.fromjson(DATA)
+    dicty.path_set(Object.items[0].price, obj, 10)
+    assert obj.items[0] == {'Price': 10}
+    assert obj.dirty_keys() == {'items'}
+    dicty.path_set(Object.mapping['b'], obj, Item(price=1))
+    assert obj.mapping['b'].price == 1
+    dicty.path_set(Object.nested.created, obj, datetime.datetime(2021, 1, 1))
+    assert obj.nested['created'] == '2021-01-01 00:00:00'
+    dicty.path_set(Object.id, obj, 2)
+    assert obj.id == 2
+
+    with pytest.raises(KeyError):
+        dicty.path_set(Object.nested.price, Object(), 1)
+
+
+def test_compact_and_view():
+    obj = Compact.fromjson({'id': 1, 'created': '2020-01-02 03:04:05'})
+    assert dicty.path_get(Compact.id, obj) == 1
+    assert dicty.path_get(Compact.created, obj).year == 2020
+
+    view = Object.view(DATA)
+    assert dicty.path_get(Object.items[1].price, view) == 3
+    assert dicty.path_get(Object.nested.created, view).year == 2020
+
+
+def test_path_without_index():
+    with pytest.raises(dicty.DictyRuntimeError):
+        dicty.path_getter(Object.items.price)
+    with pytest.raises(dicty.DictyRuntimeError):
+        dicty.path_get(Object.mapping.price, Object())
+    assert dicty.path_get(Object.items, Object.fromjson(DATA))[0].price == 2
+
+
+def test_fields_named_like_helpers():
+    class Entry(dicty.DictObject):
+        get = dicty.IntegerField()
+        set = dicty.IntegerField()
+        getter = dicty.IntegerField()
+
+    class Top(dicty.DictObject):
+        n = dicty.TypedObjectField(Entry)
+
+    assert Top.n.get == 'n.get'
+    assert Top.n.getter.attname == 'getter'
+    obj = Top.fromjson({'n': {'get': 1, 'set': 2, 'getter': 3}})
+    assert dicty.path_get(Top.n.set, obj) == 2
+    dicty.path_set(Top.n.getter, obj, 4)
+    assert obj.n.getter == 4
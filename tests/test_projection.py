@@ -0,0 +1,163 @@
+import pytest
+
+import dicty
+
+
+class Item(dicty.DictObject):
+    price = dicty.IntegerField()
+    name = dicty.StringField()
+
+
+class Object(dicty.DictObject):
+    id = dicty.IntegerField('_id')
+    title = dicty.StringField()
+    created = dicty.DatetimeField(optional=True)
+    nested = dicty.TypedObjectField(Item, optional=True)
+    items = dicty.TypedListField(Item, optional=True)
+    mapping = dicty.TypedDictField(Item, optional=True)
+
+
+class CompactItem(dicty.CompactObject):
+    price = dicty.IntegerField()
+    name = dicty.StringField()
+
+
+class Compact(dicty.CompactObject):
+    id = dicty.IntegerField()
+    items = dicty.TypedListField(CompactItem)
+
+
+DATA = {
+    '_id': 1,
+    'title': 123,
+    'created': '2020-01-02 03:04:05',
+    'nested': {'price': 1, 'name': 'foo'},
+    'items': [{'price': 2, 'name': None}, {'price': 3}],
+    'mapping': {'a': {'price': 4}},
+    'extra': 1,
+}
+
+
+def test_fromjson_only():
+    obj = Object.fromjson(DATA, only=[Object.id, Object.created,
+                                      Object.items.price,
+                                      Object.mapping.price])
+    assert obj == {'_id': 1, 'created': '2020-01-02 03:04:05',
+                   'items': [{'price': 2}, {'price': 3}],
+                   'mapping': {'a': {'price': 4}}}
+    assert obj.created.second == 5
+    assert isinstance(obj.items[0], Item)
+    assert obj.dirty_keys() == set()
+
+    obj = Object.fromjson(DATA, only=[Object.nested.price, Object.nested])
+    assert obj == {'nested': {'price': 1, 'name': 'foo'}}
+
+
+def test_fromjson_only_errors():
+    with pytest.raises(dicty.FieldError) as exc:
+        Object.fromjson(DATA, only=[Object.title])
+    assert exc.value.path == 'title'
+
+    with pytest.raises(dicty.FieldError) as exc:
+        Object.fromjson(DATA, only=[Object.items.name])
+    assert exc.value.path == 'items[0].name'
+
+    with pytest.raises(dicty.FieldError) as exc:
+        Object.fromjson({'items': [{'price': 1}, 'bad']},
+                        only=[Object.items.price])
+    assert exc.value.path == 'items[1]'
+
+    with pytest.raises(dicty.FieldError) as exc:
+        Object.fromjson({}, only=[Object.id])
+    assert str(exc.value) == '_id: Is required'
+    assert Object.fromjson({'_id': 1}, only=[Object.id, Object.nested.price])
+
+
+def test_projection_cached():
+    only = [Object.id, Object.items.price]
+    assert Object._projection(only) is Object._projection(list(only))
+
+
+def test_projection_invalid():
+    with pytest.raises(dicty.DictyRuntimeError):
+        Object.fromjson(DATA, only=['_id'])
+    with pytest.raises(dicty.DictyRuntimeError):
+        Object.fromjson(DATA, only=[Object.items[0].price])
+    with pytest.raises(dicty.DictyRuntimeError):
+        Object.fromjson(DATA, only=[Compact.id])
+
+
+def test_mongo_projection():
+    assert Object.projection([
+        Object.id, Object.items.price, Object.nested.name,
+        Object.nested.price, Object.mapping.price, Object.created,
+    ]) == {'_id': 1, 'items.price': 1, 'nested.name': 1, 'nested.price': 1,
+           'mapping': 1, 'created': 1}
+
+
+def test_compact_only():
+    obj = Compact.fromjson({'id': 'bad', 'items': [{'price': 1}]},
+                           only=[Compact.items.price])
+    assert type(obj.items[0]) is CompactItem
+    assert obj.items[0].price == 1
+    assert 'id' not in obj
+
+
+def test_track_changes_only():
+    class Tracked(Object):
+        track_changes = True
+
+    obj = Tracked.fromjson(DATA, only=[Tracked.id, Tracked.items.price])
+    assert obj.changes() == {}
+    obj.items[1].price = 5
+    assert obj.changes() == {'$set': {'items.1.price': 5}}
+
+
+def test_projection_cache_checks_owner():
+    class Other(dicty.DictObject):
+        id = dicty.IntegerField('_id')
+
+    assert Object.fromjson(DATA, only=[Object.id]) == {'_id': 1}
+    assert Other.id == Object.id
+    with pytest.raises(dicty.DictyRuntimeError):
+        Object.fromjson(DATA, only=[Other.id])
+
+
+def test_projection_cache_size(monkeypatch):
+    monkeypatch.setattr(dicty._Projection, 'cache_size', 1)
+
+    class Small(Object):
+        pass
+
+    Small._projection([Small.id])
+    Small._projection([Small.title])
+    assert len(Small._projections) == 1
+
+
+def test_overridden_validate_only():
+    class Checked(dicty.DictObject):
+        price = dicty.IntegerField()
+        name = dicty.StringField()
+
+        def validate(self, *args, **kwargs):
+            super(Checked, self).validate(*args, **kwargs)
+            if self.price < 0:
+                raise dicty.FieldError('Negative', 'price')
+
+    class Parent(dicty.DictObject):
+        id = dicty.IntegerField()
+        checked = dicty.TypedObjectField(Checked)
+
+    with pytest.raises(dicty.FieldError) as exc:
+        Checked.fromjson({'price': -1, 'name': 'x'}, only=[Checked.name])
+    assert exc.value.path == 'price'
+
+    only = [Parent.id, Parent.checked.name]
+    assert Parent.projection(only) == {'id': 1, 'checked': 1}
+    obj = Parent.fromjson({'id': 1, 'checked': {'price': 1, 'name': 'x'}},
+                          only=only)
+    assert obj.checked == {'price': 1, 'name': 'x'}
+    with pytest.raises(dicty.FieldError) as exc:
+        Parent.fromjson({'id': 1, 'checked': {'price': -1, 'name': 'x'}},
+                        only=only)
+    assert exc.value.path == 'checked.price'
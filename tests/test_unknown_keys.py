@@ -0,0 +1,159 @@
+import pytest
+
+import dicty
+
+
+class Item(dicty.DictObject):
+    foo = dicty.IntegerField()
+
+
+class Object(dicty.DictObject):
+    name = dicty.StringField('Name', optional=True)
+    items = dicty.TypedListField(Item, optional=True)
+    mapping = dicty.TypedDictField(Item, optional=True)
+
+
+class Dropping(Object):
+    unknown_keys = 'drop'
+
+
+class Rejecting(Object):
+    unknown_keys = 'reject'
+
+
+class StrictItem(dicty.DictObject):
+    unknown_keys = 'reject'
+    foo = dicty.IntegerField()
+
+
+class Parent(dicty.DictObject):
+    child = dicty.TypedObjectField(StrictItem, optional=True)
+
+
+class Compact(dicty.CompactObject):
+    unknown_keys = 'reject'
+    foo = dicty.IntegerField()
+
+
+DATA = {
+    'Name': 'foo',
+    'items': [{'foo': 1, 'blob': 'x' * 100}],
+    'mapping': {'a': {'foo': 2, 'blob': 'y'}},
+    'blob': [1, 2, 3],
+}
+
+
+def test_keep():
+    obj = Object.fromjson(DATA)
+    assert obj['blob'] == [1, 2, 3]
+    assert obj.items[0]['blob'] == 'x' * 100
+    assert 'blob' not in obj.jsonize()
+
+
+def test_drop():
+    obj = Dropping.fromjson(DATA)
+    assert 'blob' not in obj
+    # Nested objects follow policy of their own class
+    assert 'blob' in obj.items[0]
+
+    obj = Object.fromjson(DATA, unknown_keys='drop')
+    assert sorted(obj) == ['Name', 'items', 'mapping']
+    assert dict(obj.items[0]) == {'foo': 1}
+    assert dict(obj.mapping['a']) == {'foo': 2}
+    # Policy given to the call doesn't stick
+    assert 'blob' in Object.fromjson(DATA)
+
+
+def test_drop_baseline():
+    class Tracked(dicty.DictObject):
+        track_changes = True
+        unknown_keys = 'drop'
+        foo = dicty.IntegerField()
+
+    obj = Tracked.fromjson({'foo': 1, 'blob': 2})
+    assert obj._baseline == {'foo': 1}
+    assert obj.changes() == {}
+
+
+@pytest.mark.parametrize('cls, data, path', [
+    (Rejecting, DATA, 'blob'),
+    (Object, {'items': [{'foo': 1}, {'foo': 2, 'bar': 3}]}, 'items[1].bar'),
+    (Object, {'mapping': {'a': {'foo': 1, 'bar': 3}}}, "mapping['a'].bar"),
+])
+def test_reject(cls, data, path):
+    with pytest.raises(dicty.FieldError) as exc:
+        cls.fromjson(data, unknown_keys='reject')
+    assert exc.value.path == path
+    assert exc.value.args[0] == 'Unknown key'
+
+
+def test_reject_nested_class():
+    with pytest.raises(dicty.FieldError) as exc:
+        Parent.fromjson({'child': {'foo': 1, 'bar': 2}})
+    assert exc.value.path == 'child.bar'
+    # Call policy overrides policies of nested classes
+    obj = Parent.fromjson({'child': {'foo': 1, 'bar': 2}},
+                          unknown_keys='keep')
+    assert obj.child['bar'] == 2
+
+
+def test_reject_collect():
+    result = Object.try_fromjson(
+        {'items': [{'foo': 'x', 'bar': 1, 'baz': 2}], 'extra': 1},
+        unknown_keys='reject')
+    assert sorted(path for path, _ in result.errors) == [
+        ('extra',), ('items', 0, 'bar'), ('items', 0, 'baz'),
+        ('items', 0, 'foo')]
+    assert Object.try_fromjson({'extra': 1}).ok
+
+
+def test_compact():
+    assert Compact.fromjson({'foo': 1}).foo == 1
+    with pytest.raises(dicty.FieldError) as exc:
+        Compact.fromjson({'foo': 1, 'bar': 2})
+    assert exc.value.path == 'bar'
+    assert Compact.fromjson({'foo': 1, 'bar': 2}, unknown_keys='drop').foo == 1
+
+
+def test_invalid_policy():
+    with pytest.raises(dicty.DictyRuntimeError):
+        Object.fromjson({}, unknown_keys='ignore')
+    with pytest.raises(dicty.DictyRuntimeError):
+        class Invalid(dicty.DictObject):
+            unknown_keys = 'ignore'
+
+
+class Lazy(dicty.DictObject):
+    items = dicty.TypedListField(Item, lazy=True, optional=True)
+    nested = dicty.TypedObjectField(Item, lazy=True, optional=True)
+
+
+def test_lazy_fields_keep_call_policy():
+    obj = Lazy.fromjson({'items': [{'foo': 1, 'blob': 1}],
+                         'nested': {'foo': 2, 'blob': 2}},
+                        unknown_keys='drop')
+    # Items are instantiated after fromjson() has returned
+    assert dict(obj.items[0]) == {'foo': 1}
+    assert dict(obj.nested) == {'foo': 2}
+
+    obj = Lazy.fromjson({'items': [{'foo': 1, 'blob': 1}]},
+                        unknown_keys='reject')
+    obj.validate()
+    with pytest.raises(dicty.FieldError) as exc:
+        obj.items[0]
+    assert exc.value.path == 'items[0].blob'
+
+    assert 'blob' in Lazy.fromjson({'nested': {'foo': 2, 'blob': 2}}).nested
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_fromjson_many(workers):
+    records = [{'items': [{'foo': no, 'blob': no}]} for no in range(10)]
+    objects = Object.fromjson_many(records, workers=workers, chunksize=3,
+                                   unknown_keys='drop')
+    assert [dict(obj.items[0]) for obj in objects] == \
+        [{'foo': no} for no in range(10)]
+    with pytest.raises(dicty.FieldError) as exc:
+        Object.fromjson_many(records, workers=workers, chunksize=3,
+                             unknown_keys='reject')
+    assert exc.value.path == 'items[0].blob'
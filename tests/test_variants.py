@@ -0,0 +1,97 @@
+import pytest
+
+import dicty
+
+
+class Click(dicty.DictObject):
+    type = dicty.StringField()
+    x = dicty.IntegerField()
+
+
+class View(dicty.DictObject):
+    type = dicty.StringField()
+    page = dicty.StringField()
+
+
+VARIANTS = {'click': Click, 'view': 'tests.test_variants.View'}
+
+
+class Log(dicty.DictObject):
+    event = dicty.TypedObjectField(VARIANTS, discriminator='type',
+                                   optional=True)
+    events = dicty.TypedListField(VARIANTS, discriminator='type',
+                                  optional=True)
+    named = dicty.TypedDictField(VARIANTS, discriminator='type',
+                                 optional=True)
+
+
+DATA = {
+    'event': {'type': 'view', 'page': 'index'},
+    'events': [{'type': 'click', 'x': 1}, {'type': 'view', 'page': 'a'}],
+    'named': {'a': {'type': 'click', 'x': 2}},
+}
+
+
+def test_variants_fromjson():
+    obj = Log.fromjson(DATA)
+    assert type(obj.event) is View
+    assert [type(event) for event in obj.events] == [Click, View]
+    assert type(obj.named['a']) is Click
+    assert obj.events[0].x == 1
+    assert obj.jsonize() == DATA
+    assert ''.join(obj.iterdump()) == ''.join(
+        Log.fromjson(DATA).iterdump())
+    assert Log().event is None
+
+
+@pytest.mark.parametrize('data, path, message', [
+    ({'event': {'type': 'drag'}}, 'event.type', "Unknown variant 'drag'"),
+    ({'events': [{'type': 'click', 'x': 1}, {}]}, 'events[1].type',
+     'Is required'),
+    ({'named': {'a': {'type': []}}}, "named['a'].type",
+     'Unknown variant []'),
+    ({'events': [1]}, 'events[0]', 'must be dictionary'),
+    ({'event': {'type': 'view'}}, 'event.page', 'Is required'),
+])
+def test_variants_errors(data, path, message):
+    with pytest.raises(dicty.FieldError) as exc:
+        Log.fromjson(data)
+    assert exc.value.path == path
+    assert exc.value.args[0] == message
+    assert Log.try_fromjson(data).format_errors() == \
+        ['{}: {}'.format(path, message)]
+
+
+def test_variants_paths():
+    assert Log.events.x == 'events.x'
+    assert Log.event.page == 'event.page'
+    assert dicty.path_get(Log.event.page, Log.fromjson(DATA)) == 'index'
+    assert Log.view(DATA).events[1].page == 'a'
+
+
+def test_variants_declaration():
+    with pytest.raises(dicty.DictyRuntimeError):
+        dicty.TypedListField({'click': Click})
+    with pytest.raises(dicty.DictyRuntimeError):
+        dicty.TypedListField({'click': Click}, discriminator='type',
+                             lazy=True)
+
+
+def test_variants_projection():
+    only = [Log.event.page, Log.events.x]
+    assert Log.projection(only) == {'event': 1, 'events': 1}
+    obj = Log.fromjson(DATA, only=only)
+    assert obj == {'event': DATA['event'], 'events': DATA['events']}
+    assert type(obj.events[0]) is Click
+
+
+def test_variant_without_discriminator():
+    class Untagged(dicty.DictObject):
+        x = dicty.IntegerField()
+
+    class Bad(dicty.DictObject):
+        event = dicty.TypedObjectField({'click': Untagged},
+                                       discriminator='type')
+
+    with pytest.raises(dicty.DictyRuntimeError):
+        Bad.fromjson({'event': {'type': 'click', 'x': 1}})
@@ -0,0 +1,177 @@
+import datetime
+
+import pytest
+
+import dicty
+
+
+class Item(dicty.DictObject):
+    foo = dicty.IntegerField()
+    bar = dicty.StringField(optional=True, default='bar')
+
+
+class Object(dicty.DictObject):
+    name = dicty.StringField('Name', filters=[lambda value: value.strip()])
+    count = dicty.IntegerField(optional=True)
+    created = dicty.DatetimeField(optional=True)
+    nested = dicty.TypedObjectField(Item, optional=True)
+    items = dicty.TypedListField(Item, optional=True)
+    mapping = dicty.TypedDictField(Item, optional=True)
+    numbers = dicty.TypedListField(int, optional=True)
+
+
+class Parent(dicty.DictObject):
+    child = dicty.TypedObjectField(Object)
+
+
+DATA = {
+    'Name': ' foo ',
+    'count': 1,
+    'created': '2020-01-02 03:04:05',
+    'nested': {'foo': 1},
+    'items': [{'foo': 2}, {'foo': 3, 'bar': 'baz'}],
+    'mapping': {'a': {'foo': 4}},
+    'numbers': ['1', 2],
+    'extra': [1],
+}
+
+
+def test_view_access():
+    view = Object.view(DATA)
+    assert view.name == 'foo'
+    assert view['Name'] == 'foo'
+    assert view.count == 1
+    assert view.created == datetime.datetime(2020, 1, 2, 3, 4, 5)
+    assert view['created'] == '2020-01-02 03:04:05'
+    assert view.nested.foo == 1
+    assert view.nested.bar == 'bar'
+    assert [item.foo for item in view.items] == [2, 3]
+    assert view.items[-1].bar == 'baz'
+    assert len(view.items) == 2
+    assert view.mapping['a'].foo == 4
+    assert list(view.mapping) == ['a']
+    assert view.numbers == [1, 2]
+    assert view['extra'] == [1]
+    assert 'count' in view and 'parent' not in view
+    assert sorted(view.keys()) == sorted(DATA)
+    # Wrapped dict is not modified
+    assert DATA['Name'] == ' foo ' and DATA['numbers'] == ['1', 2]
+
+
+def test_view_missing_required():
+    view = Item.view({})
+    with pytest.raises(AttributeError):
+        view.foo
+    with pytest.raises(KeyError):
+        view['foo']
+    # Same default as the object has, without modifying the wrapped dict
+    assert Object.view({}).nested == {}
+
+
+def test_view_missing_defaults():
+    class Defaults(dicty.DictObject):
+        tags = dicty.ListField(optional=True)
+        extra = dicty.DictField(optional=True)
+
+    class Container(Object, Defaults):
+        pass
+
+    raw = {'Name': 'foo'}
+    view = Container.view(raw)
+    obj = Container.fromjson({'Name': 'foo'})
+    for attname in ['count', 'created', 'nested', 'items', 'mapping',
+                    'numbers', 'tags', 'extra']:
+        assert getattr(view, attname) == getattr(obj, attname), attname
+    assert view.items == [] and view.mapping == {} and view.tags == []
+    assert raw == {'Name': 'foo'}
+    assert 'items' not in view
+
+
+def test_view_validates_on_access():
+    view = Object.view({'Name': 'foo', 'count': 'bad',
+                        'items': [{'foo': 1}, {'foo': 'bad'}, 3]})
+    assert view.name == 'foo'
+    with pytest.raises(dicty.FieldError) as exc:
+        view.count
+    assert exc.value.path == 'count'
+    # Still raises on next access
+    with pytest.raises(dicty.FieldError):
+        view.count
+
+    assert view.items[0].foo == 1
+    with pytest.raises(dicty.FieldError) as exc:
+        view.items[1].foo
+    assert exc.value.path == 'items[1].foo'
+    with pytest.raises(dicty.FieldError) as exc:
+        view.items[2]
+    assert exc.value.path == 'items[2]'
+
+    view = Parent.view({'child': {'Name': 'bar', 'mapping': {'a': []}}})
+    assert view.child.name == 'bar'
+    with pytest.raises(dicty.FieldError) as exc:
+        view.child.mapping['a']
+    assert exc.value.path == "child.mapping['a']"
+
+    with pytest.raises(dicty.FieldError) as exc:
+        Object.view({'items': {}}).items
+    assert exc.value.path == 'items'
+    assert str(exc.value) == 'items: must be list'
+
+
+def test_view_validate():
+    Object.view(DATA).validate()
+    with pytest.raises(dicty.FieldError) as exc:
+        Object.view(dict(DATA, mapping={'a': {'foo': 'x'}})).validate()
+    assert exc.value.path == "mapping['a'].foo"
+
+
+def test_view_read_only():
+    view = Object.view(DATA)
+    with pytest.raises(TypeError):
+        view.count = 2
+    with pytest.raises(TypeError):
+        view['count'] = 2
+    with pytest.raises(TypeError):
+        del view.count
+
+    obj = view.toobject()
+    assert type(obj) is Object
+    obj.count = 2
+    assert obj.nested.foo == 1
+    assert DATA['count'] == 1
+
+
+def test_view_paths():
+    view = Object.view(DATA)
+    assert type(view).items[0].bar == Object.items[0].bar == 'items.0.bar'
+    assert type(view.nested).foo == 'foo'
+    assert isinstance(view, dicty.ObjectView)
+
+
+def test_view_instrumented():
+    with dicty.instrument() as instrumentation:
+        Item.view({'foo': 1}).foo
+    assert instrumentation.stats[(Item, 'foo', 'validate')][0] == 1
+
+
+def test_view_overridden_validate():
+    class Checked(dicty.DictObject):
+        foo = dicty.IntegerField()
+
+        def validate(self, *args, **kwargs):
+            super(Checked, self).validate(*args, **kwargs)
+            if self.foo < 0:
+                raise dicty.FieldError('Negative', 'foo')
+
+    class Holder(dicty.DictObject):
+        checked = dicty.TypedObjectField(Checked)
+        items = dicty.TypedListField(Checked, optional=True)
+
+    with pytest.raises(dicty.DictyRuntimeError):
+        Checked.view({'foo': 1})
+
+    view = Holder.view({'checked': {'foo': 1}, 'items': [{'foo': -1}]})
+    assert type(view.checked) is Checked
+    with pytest.raises(dicty.FieldError) as exc:
+        view.items
+    assert exc.value.path == 'items[0].foo'